@@ -0,0 +1,187 @@
+# core/InstrumentPool.py
+"""
+================================================================================
+Gemeinsame Basis für Geräte-Pools (SMUs, Spektrometer)
+================================================================================
+
+Ein Pool verwaltet mehrere gleichartige Geräte unter logischen Namen. Jedes
+Gerät ist ein eigener Manager mit eigenem Thread, der Pool verteilt Aufrufe
+parallel auf diese Threads (`_parallel`) und merkt sich die Geräte im Profil.
+
+Die gerätespezifischen Operationen (`SmuPool.measure_all`,
+`SpectrometerPool.acquire_all`, ...) liegen in den Unterklassen.
+"""
+
+import time
+
+from PySide6.QtCore import QObject, Signal
+
+
+class InstrumentPool(QObject):
+    """
+    Basisklasse der Geräte-Pools.
+
+    Unterklassen setzen `MANAGER_CLASS`, `PROFILE_KEY` und `KIND`. Die Geräte
+    (außer dem Haupt-Gerät der GUI) werden im Profil unter `PROFILE_KEY`
+    gespeichert ({name: adresse}) und mit `connect_saved` wieder verbunden.
+
+    Der Manager muss `connect(adresse)`, `disconnect()`, `shutdown()`,
+    `is_connected()` und `submit(methodenname, ...)` (gibt ein Future zurück) bieten.
+
+    Args:
+        log_manager: LogManager-Instanz.
+        profile_manager: ProfileManager-Instanz.
+        primary (optional): Haupt-Gerät der GUI, wird als `primary_name` eingetragen.
+        primary_name (str): Logischer Name des Haupt-Geräts.
+
+    Signale:
+        instruments_changed (list):
+            Wird ausgelöst, wenn ein Gerät hinzugefügt oder entfernt wurde.
+            Args: (list: Namen aller Geräte).
+    """
+
+    MANAGER_CLASS = None
+    """type: Manager-Klasse eines Geräts (z.B. `SmuManager`)."""
+
+    PROFILE_KEY = None
+    """str: Profil-Schlüssel der gespeicherten Geräte (z.B. "Smu_Pool")."""
+
+    KIND = "instrument"
+    """str: Gerätetyp in Log-Meldungen (z.B. "SMU")."""
+
+    NAME_RULE = "must not be empty"
+    """str: Regel für gültige Namen (Log-Meldung von `add_instrument`)."""
+
+    instruments_changed = Signal(list)
+
+    def __init__(self, log_manager, profile_manager, primary=None, primary_name: str | None = None):
+        super().__init__()
+        self.log_mgr = log_manager
+        self.profile_mgr = profile_manager
+        self._managers = {}
+        self._primary_name = None
+        # Bezugspunkt der Zeitstempel von Operationen über alle Geräte
+        self.t0 = time.monotonic()
+        if primary is not None:
+            self._managers[primary_name] = primary
+            self._primary_name = primary_name
+
+    # --- Geräte-Verwaltung ---
+
+    def names(self, connected_only: bool = False) -> list[str]:
+        """ Namen aller (oder nur der verbundenen) Geräte im Pool. """
+        return [name for name, manager in self._managers.items()
+                if manager.is_connected() or not connected_only]
+
+    def manager(self, name: str):
+        """
+        Gibt den Manager eines Geräts zurück.
+
+        Raises:
+            KeyError: Wenn es kein Gerät mit diesem Namen gibt.
+        """
+        try:
+            return self._managers[name]
+        except KeyError:
+            raise KeyError(f"Unknown {self.KIND} '{name}' (available: {', '.join(self._managers) or 'none'})") from None
+
+    def add_instrument(self, name: str, address: str, remember: bool = True) -> bool:
+        """
+        Fügt ein Gerät hinzu und verbindet es.
+
+        Die Einstellungen des Geräts werden aus dem Profil geladen, falls es
+        unter diesem Namen schon einmal benutzt wurde.
+
+        Args:
+            name (str): Logischer Name, z.B. "smu2" oder "nir".
+            address (str): Adresse wie bei `connect` des Managers (z.B. "COM4", "DUMMY").
+            remember (bool): Gerät im Profil speichern (`PROFILE_KEY`).
+
+        Returns:
+            bool: True, wenn das Gerät verbunden ist.
+        """
+        if not self._is_valid_name(name):
+            self.log_mgr.error(f"Invalid {self.KIND} name '{name}': {self.NAME_RULE}.")
+            return False
+        if name in self._managers:
+            self.log_mgr.error(f"{self.KIND} '{name}' is already part of the pool.")
+            return False
+
+        manager = self.MANAGER_CLASS(self.log_mgr, self.profile_mgr, name=name)
+        self._managers[name] = manager
+        if remember:
+            self._remember(name, address)
+        self.instruments_changed.emit(self.names())
+        return manager.connect(address)
+
+    def remove_instrument(self, name: str):
+        """ Trennt ein Gerät, beendet seinen Thread und entfernt es aus dem Pool (das Haupt-Gerät bleibt). """
+        if name == self._primary_name:
+            self.log_mgr.warning(f"The main {self.KIND} '{name}' cannot be removed from the pool.")
+            return
+        manager = self._managers.pop(name, None)
+        if manager is None:
+            return
+        manager.shutdown()
+        saved = dict(self.profile_mgr.read(self.PROFILE_KEY) or {})
+        if saved.pop(name, None) is not None:
+            self.profile_mgr.write(self.PROFILE_KEY, saved)
+        self.instruments_changed.emit(self.names())
+
+    def connect_saved(self) -> dict[str, bool]:
+        """
+        Verbindet alle im Profil gespeicherten Geräte (parallel).
+
+        Returns:
+            dict[str, bool]: {name: verbunden}
+        """
+        saved = self.profile_mgr.read(self.PROFILE_KEY) or {}
+        for name in saved:
+            if name not in self._managers:
+                self._managers[name] = self.MANAGER_CLASS(self.log_mgr, self.profile_mgr, name=name)
+        if saved:
+            self.instruments_changed.emit(self.names())
+        return self._parallel({name: ('connect', (address,), {}) for name, address in saved.items()})
+
+    def disconnect_all(self):
+        """ Trennt alle Geräte außer dem Haupt-Gerät (parallel). """
+        self._parallel({name: ('disconnect', (), {}) for name in self._managers if name != self._primary_name})
+
+    def shutdown(self):
+        """
+        Trennt alle Geräte außer dem Haupt-Gerät und beendet ihre Threads.
+
+        Für das Programmende; das Haupt-Gerät beendet `ApplicationContext.shutdown`.
+        """
+        for name, manager in self._managers.items():
+            if name != self._primary_name:
+                manager.shutdown()
+
+    def _is_valid_name(self, name: str) -> bool:
+        return bool(name)
+
+    def _remember(self, name: str, address: str):
+        saved = dict(self.profile_mgr.read(self.PROFILE_KEY) or {})
+        saved[name] = address
+        self.profile_mgr.write(self.PROFILE_KEY, saved)
+
+    def _parallel(self, jobs: dict) -> dict:
+        """
+        Führt pro Gerät einen Methodenaufruf im Thread des Geräts aus und wartet auf alle.
+
+        Args:
+            jobs (dict): {name: (methodenname, args, kwargs)}
+
+        Returns:
+            dict: {name: Rückgabewert} (None bei einer Exception, die geloggt wird).
+        """
+        futures = {name: self._managers[name].submit(method_name, *args, **kwargs)
+                   for name, (method_name, args, kwargs) in jobs.items()}
+        results = {}
+        for name, future in futures.items():
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                self.log_mgr.error(f"{self.KIND} '{name}': {jobs[name][0]} failed: {e}")
+                results[name] = None
+        return results
@@ -9,7 +9,9 @@ from modules.experiment.ExperimentManager import ExperimentManager
 from modules.export.ExportManager import ExportManager
 
 from modules.spectrometer.SpectrometerManager import SpectrometerManager
+from modules.spectrometer.SpectrometerPool import SpectrometerPool
 from modules.smu.SmuManager import SmuManager
+from modules.smu.SmuPool import SmuPool
 
 class ApplicationContext:
     """
@@ -35,11 +37,28 @@ class ApplicationContext:
             profile_manager=self.profile_manager
         )
 
+        # Weitere Spektrometer; das Haupt-Spektrometer ist darin als "spec1" enthalten
+        self.spectrometer_pool = SpectrometerPool(
+            log_manager=self.log_manager,
+            profile_manager=self.profile_manager,
+            primary=self.spectrometer_manager
+        )
+
         self.smu_manager = SmuManager(
             log_manager=self.log_manager, 
             profile_manager=self.profile_manager
         )
 
+        # Weitere SMUs; die Haupt-SMU ist darin als "smu1" enthalten
+        self.smu_pool = SmuPool(
+            log_manager=self.log_manager,
+            profile_manager=self.profile_manager,
+            primary=self.smu_manager
+        )
+
+        # Das simulierte Spektrometer sieht eine LED am simulierten SMU-Kanal 'a'
+        self.spectrometer_manager.set_simulated_light_source(self.smu_manager.simulated_output_current)
+
         self.export_manager = ExportManager(
             log_manager=self.log_manager, 
             profile_manager=self.profile_manager
@@ -51,4 +70,15 @@ class ApplicationContext:
     
         
         
-        self.log_manager.debug("ApplicationContext successfully initialized.")
\ No newline at end of file
+        self.log_manager.debug("ApplicationContext successfully initialized.")
+
+    def shutdown(self):
+        """
+        Beendet die Hintergrund-Threads der Manager und trennt die Geräte.
+
+        Wird beim Beenden der Anwendung aufgerufen (`QApplication.aboutToQuit`).
+        """
+        self.smu_pool.shutdown()
+        self.spectrometer_pool.shutdown()
+        self.smu_manager.shutdown()
+        self.spectrometer_manager.shutdown()
@@ -0,0 +1,30 @@
+# Das Script muss eine Funktion 'run_experiment(api)' definieren.
+# 'api' ist die Instanz der ExperimentAPI, die Zugriff auf alle Manager bietet.
+
+def run_experiment(api):
+    """
+    Misst für jedes Mess-Preset der SMU ('fast', 'normal', 'hi-accuracy'),
+    wie viele Einzelmessungen pro Sekunde möglich sind.
+
+    Läuft auch ohne Gerät gegen den DUMMY oder den Emulator
+    (python modules/smu/KeithleyEmulator.py).
+    """
+    smu_channel = 'a'
+    duration_s = 2.0
+
+    if not api.smu_mgr.is_connected():
+        if not api.smu_mgr.connect_LastDevice():
+            api.log_message("Kein SMU gefunden. Verbinde mit DUMMY...")
+            api.smu_mgr.connect("DUMMY")
+
+    api.log_message(f"=== SMU Benchmark auf Kanal {smu_channel} ({duration_s} s pro Preset) ===")
+    results = api.smu_mgr.benchmark_measure_presets(smu_channel, duration=duration_s)
+    if not results:
+        api.log_message("Benchmark fehlgeschlagen.")
+        return
+
+    for name, rate in results.items():
+        settings = api.smu_mgr.MEASURE_PRESETS[name]
+        api.log_message(f"{name:>12}: {rate:8.1f} Messungen/s  "
+                        f"(NPLC {settings['nplc']}, Autozero {settings['autozero']}, "
+                        f"Filter {settings['filter_count']})")
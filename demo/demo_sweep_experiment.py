@@ -19,6 +19,9 @@ def run_experiment(api):
     steps = 11  # Anzahl der Punkte
     integration_time_us = 50 * 1000 # 50 ms
     smu_channel = 'a'
+    # Was pro Schritt vom Spektrum gespeichert wird:
+    # "rois" = nur die Kennwerte der Bereiche, "spectrum" = ganzes Spektrum, "both" = beides
+    store_spectra = "both"
     
     # Verbindung zu den Geräten herstellen
     if not api.smu_mgr.is_connected():
@@ -59,15 +62,22 @@ def run_experiment(api):
 
     # --- 3. HARDWARE KONFIGURATION ---
     
-    # SMU Config
-    api.smu_mgr.reset_channel(smu_channel)
-    api.smu_mgr.set_source_voltage(smu_channel) # Wir geben Spannung vor
-    api.smu_mgr.set_source_limit(smu_channel, 0.01) # 10mA Compliance
+    # SMU Config (wird in einem Schreibvorgang an die SMU gesendet)
+    api.smu_mgr.configure_channel(
+        smu_channel,
+        reset=True,
+        source_func='V', # Wir geben Spannung vor
+        limit=0.01       # 10mA Compliance
+    )
     
     # Spectrometer Config
     api.spectrometer_mgr.set_integrationtime(integration_time_us)
     api.spectrometer_mgr.set_correction_dark_count(True)
 
+    # Wellenlängenbereiche, die pro Schritt auf Integral und Peak reduziert werden
+    api.spectrometer_mgr.add_roi("Emission", 600, 660)
+    api.spectrometer_mgr.add_roi("Parasitic", 420, 480)
+
     # --- 4. EXPORT VORBEREITUNG ---
     
     # Optional: User nach Speicherort fragen (oder einfach Standard nutzen)
@@ -88,9 +98,16 @@ def run_experiment(api):
     # Trick: Einmal Spektrum aufnehmen, um die Wellenlängen-Achse zu bekommen.
     # Diese ändert sich während des Sweeps nicht, also speichern wir sie statisch!
     wl, _ = api.spectrometer_mgr.acquire_spectrum()
-    if wl is not None:
+    if wl is not None and store_spectra != "rois":
         api.export_mgr.add_static("Wavelengths", wl, "nm")
 
+    # Die Bereichsgrenzen gehören zu den Kennwerten, also ebenfalls statisch speichern
+    rois = api.spectrometer_mgr.get_rois()
+    if rois and store_spectra != "spectrum":
+        # h5py kann NumPy-Unicode-Arrays nicht speichern, die Namen also als Bytes ablegen
+        api.export_mgr.add_static("ROI_Names", [name.encode() for name in rois])
+        api.export_mgr.add_static("ROI_Ranges", np.array(list(rois.values())), "nm")
+
     # --- 5. MESS-SCHLEIFE (Der eigentliche Sweep) ---
     
     api.log_message("Starte Sweep...")
@@ -106,14 +123,17 @@ def run_experiment(api):
             while api._is_paused:
                 time.sleep(0.1)
 
-            # B) Hardware ansteuern
-            api.smu_mgr.set_source_level(smu_channel, v_set) # Spannung setzen
-            time.sleep(0.1) # Kurze Wartezeit zum Einschwingen
+            # B) Spannung setzen und messen, sobald der Strom eingeschwungen ist
+            #    (statt einer festen Wartezeit)
+            settled = api.smu_mgr.set_and_measure_settled(smu_channel, v_set, tol=1e-3, max_wait=0.5)
+            if settled:
+                curr, meas_v = settled['current'], settled['voltage']
+            else:
+                curr, meas_v = float('nan'), float('nan')
 
-            # C) Messen
-            curr, meas_v = api.smu_mgr.measure_iv(smu_channel) or (float('nan'), float('nan'))
+            # C) Spektrum aufnehmen
             
-            # Spektrum aufnehmen (nur Intensitäten interessieren uns hier dynamisch)
+            # (nur Intensitäten interessieren uns hier dynamisch)
             _, intensities = api.spectrometer_mgr.acquire_spectrum()
 
             # D) Daten Sammeln (Staging)
@@ -125,7 +145,14 @@ def run_experiment(api):
             if active_area and active_area > 0:
                 api.export_mgr.add("Current_Density", curr / active_area, "A/m^2")
 
-            if intensities is not None:
+            if intensities is not None and store_spectra != "spectrum":
+                # Ein paar Zahlen pro Bereich statt tausender Pixel
+                for name, band in api.spectrometer_mgr.reduce_spectrum(intensities).items():
+                    api.export_mgr.add(f"{name}_Integral", band['integral'], "counts*nm")
+                    api.export_mgr.add(f"{name}_Peak_WL", band['peak_wavelength'], "nm")
+                    api.export_mgr.add(f"{name}_Peak_Height", band['peak_intensity'], "counts")
+
+            if intensities is not None and store_spectra != "rois":
                 # Wir speichern hier nur die Intensitäten. Die Wellenlängen (x-Achse) 
                 # haben wir oben schon statisch gespeichert -> Spart Speicherplatz!
                 api.export_mgr.add("Spectra_Dynamic", intensities, "counts")
@@ -135,7 +162,8 @@ def run_experiment(api):
             
             # Log & Progress Update
             progress = int((i + 1) / steps * 100)
-            api.log_message(f"Step {i+1}/{steps}: {meas_v:.2f} V -> {curr:.2e} A")
+            settle_ms = settled['settle_time'] * 1e3 if settled else float('nan')
+            api.log_message(f"Step {i+1}/{steps}: {meas_v:.2f} V -> {curr:.2e} A (settled in {settle_ms:.1f} ms)")
 
     except Exception as e:
         api.log_mgr.error(f"Fehler während des Experiments: {e}")
@@ -50,6 +50,7 @@ if __name__ == "__main__":
 
     # --- Kontext & MainWindow ---
     app_context = ApplicationContext()
+    app.aboutToQuit.connect(app_context.shutdown)
     main_window = MainWindow(context=app_context)
 
     QTimer.singleShot(150, splash.close)
@@ -28,6 +28,7 @@ class LivePlotWidget(QWidget):
 
         # Verbindung herstellen
         export_manager.data_committed.connect(self.update_plots)
+        export_manager.data_committed_many.connect(self.update_plots_many)
 
     @Slot(dict)
     def update_plots(self, data_payload):
@@ -50,6 +51,30 @@ class LivePlotWidget(QWidget):
         except Exception as e:
             print(f"Plot Error: {e}")
 
+    @Slot(dict)
+    def update_plots_many(self, data_payload):
+        """
+        Wird bei jedem 'commit_many()' aufgerufen, 'value' enthält eine Zeile pro Datenpunkt.
+        Die Kurven werden nur einmal pro Block neu gezeichnet.
+        """
+        try:
+            for name, content in data_payload.items():
+                values = np.asanyarray(content['value'])
+                if len(values) == 0:
+                    continue
+
+                if name not in self.plots:
+                    self._create_plot_for(name, values[0], content['unit'])
+
+                if values.ndim == 1:
+                    self.data_history[name].extend(values.astype(float).tolist())
+                    self.curves[name].setData(self.data_history[name])
+                else:
+                    self.curves[name].setData(values[-1])
+
+        except Exception as e:
+            print(f"Plot Error: {e}")
+
     def _create_plot_for(self, name, sample_val, unit):
         """Entscheidet dynamisch, ob Line-Plot oder Spektrum-Plot nötig ist."""
         arr = np.asanyarray(sample_val)
@@ -220,7 +220,9 @@ class ExperimentAPI():
         self.profile_mgr = self.context.profile_manager
         self.device_mgr = self.context.device_manager
         self.spectrometer_mgr = self.context.spectrometer_manager
+        self.spectrometer_pool = self.context.spectrometer_pool
         self.smu_mgr = self.context.smu_manager
+        self.smu_pool = self.context.smu_pool
         self.export_mgr = self.context.export_manager
         
         # self.next_mgr = next_manager                                      # <- Hier 
@@ -52,6 +52,11 @@ class ExportManager(QObject):
                     'Spectrum': {'value': numpy.array([...]), 'unit': 'cnt'}
                 }
 
+        data_committed_many (dict):
+            Wird bei jedem `commit_many()` einmal für alle Zeilen ausgelöst.
+            Gleiche Struktur wie `data_committed`, 'value' enthält aber ein
+            Array mit einer Zeile pro Datenpunkt.
+
         export_started (str):
             Wird ausgelöst, wenn eine neue Datei erstellt wurde.
             Args: (str: Voller Pfad zur Datei).
@@ -67,6 +72,7 @@ class ExportManager(QObject):
     
     # Signal für GUI / Plotter
     data_committed = Signal(dict)
+    data_committed_many = Signal(dict)
     
     # Status-Signale
     export_started = Signal(str)   # Filename
@@ -86,6 +92,8 @@ class ExportManager(QObject):
         
         # Interner Buffer für den aktuellen Datenpunkt (Row)
         self._buffer = {} 
+        # Interner Buffer für Blöcke mehrerer Zeilen (add_many/commit_many)
+        self._block_buffer = {}
         
         # Tracking
         self._row_counter = 0 
@@ -222,6 +230,7 @@ class ExportManager(QObject):
             # Reset
             self._row_counter = 0
             self._buffer = {}
+            self._block_buffer = {}
             self._known_columns = set()
             
             self.log_mgr.info(f"Export started: {full_name}")
@@ -379,6 +388,80 @@ class ExportManager(QObject):
             self.log_mgr.error(f"Error during commit: {e}")
             self.export_error.emit(str(e))
 
+    def add_many(self, name: str, values, unit: str = ""):
+        """
+        Sammelt mehrere Datenpunkte einer Spalte für `commit_many()`.
+
+        Gegenstück zu `add()` für Blöcke, z.B. aus dem SMU-Streaming. Alle
+        Spalten eines Blocks müssen gleich viele Zeilen haben.
+
+        Args:
+            name (str): Name des Datasets.
+            values (array-like): Ein Wert (bzw. Array) pro Zeile entlang der ersten Achse.
+            unit (str, optional): Einheit.
+        """
+        if self.file is None: return
+        self._block_buffer[name] = {
+            'value': np.asanyarray(values),
+            'unit': unit
+        }
+
+    def commit_many(self):
+        """
+        Schreibt alle mit `add_many()` gesammelten Zeilen auf einmal.
+
+        Statt einem Resize, Schreibzugriff und Signal pro Zeile gibt es pro
+        Spalte einen Resize und einen Schreibzugriff, und insgesamt ein
+        `data_committed_many`-Signal. Fehlende Spalten werden mit NaN gefüllt.
+
+        Examples:
+            .. code-block:: python
+
+                cursor, data, _ = smu_mgr.read_stream(cursor)
+                current, voltage = data['a']
+                export_mgr.add_many("Time", data['timestamp'], "s")
+                export_mgr.add_many("Current", current, "A")
+                export_mgr.commit_many()
+        """
+        if self.file is None or self.current_group is None or not self._block_buffer: return
+
+        try:
+            lengths = {len(content['value']) for content in self._block_buffer.values()}
+            if len(lengths) != 1:
+                raise ValueError(f"add_many() columns have different lengths: {sorted(lengths)}")
+            rows = lengths.pop()
+
+            for name, content in self._block_buffer.items():
+                if name not in self._known_columns:
+                    self._create_dataset_for(name, content['value'][0], content['unit'])
+                    self._known_columns.add(name)
+
+            plot_payload = {}
+            for col_name in self._known_columns:
+                dset = self.current_group[col_name]
+                if col_name in self._block_buffer:
+                    values = self._block_buffer[col_name]['value']
+                    unit = self._block_buffer[col_name]['unit']
+                else:
+                    nan_value = self._get_nan_value_for_dataset(dset)
+                    values = np.broadcast_to(nan_value, (rows,) + nan_value.shape)
+                    unit = dset.attrs.get('units', '')
+
+                start = dset.shape[0]
+                dset.resize(start + rows, axis=0)
+                dset[start:] = values
+                plot_payload[col_name] = {'value': values, 'unit': unit}
+
+            self.file.flush()
+            self._row_counter += rows
+            self._block_buffer.clear()
+
+            self.data_committed_many.emit(plot_payload)
+
+        except Exception as e:
+            self.log_mgr.error(f"Error during commit_many: {e}")
+            self.export_error.emit(str(e))
+
     def stop(self):
         """
         Beendet den Export und schließt die HDF5-Datei sauber.
@@ -0,0 +1,462 @@
+# modules/smu/AsyncKeithley2602.py
+"""
+================================================================================
+Keithley 2602 asyncio-Treiber
+================================================================================
+
+Asynchrone Variante von `Keithley2602` auf Basis von asyncio-Streams.
+
+Befehle werden sofort geschrieben (Pipelining), jede Anfrage bekommt ein
+Future. Ein einzelner Lese-Task ordnet die Antworten in Sende-Reihenfolge
+(FIFO) den Futures zu. Der Timeout einer Anfrage läuft erst, wenn sie an der
+Reihe ist; eine Messung hinter einem langen Sweep wartet also nicht mit.
+Mehrere Anfragen an dasselbe Gerät und Anfragen an andere Geräte können so
+gleichzeitig unterwegs sein, z.B.:
+
+    .. code-block:: python
+
+        current_voltage, spectrum = await asyncio.gather(
+            smu.measure_iv('a'),
+            spectrometer_mgr.acquire_spectrum_async(),
+        )
+
+Verbindungen:
+    host:port, socket://host  -> asyncio.open_connection (LAN Raw-Socket)
+    COM3, /dev/ttyUSB0        -> pyserial-asyncio (optional)
+    VISA ('::')               -> nicht unterstützt, dafür `Keithley2602` nutzen
+
+TSP-Befehle und das Parsen der Antworten werden von `Keithley2602` übernommen.
+"""
+
+import asyncio
+from contextlib import contextmanager
+
+import numpy as np
+
+try:
+    from .Keithley2602 import Keithley2602
+    from .Transport import is_network_address, parse_socket_address
+except ImportError:
+    from Keithley2602 import Keithley2602
+    from Transport import is_network_address, parse_socket_address
+
+# pyserial-asyncio ist optional, ohne sind nur Netzwerk-Verbindungen möglich
+try:
+    import serial_asyncio
+except ImportError:
+    serial_asyncio = None
+
+
+class AsyncKeithley2602:
+    """
+    asyncio-Treiber für die Keithley 2602 mit Befehls-Pipeline.
+
+    Alle Methoden, die mit dem Gerät sprechen, sind Coroutinen. Abgedeckt ist
+    nur ein Teil von `Keithley2602` (dort gleiche Namen, Parameter und
+    Rückgaben): Quelle und Limits einstellen, Ausgang schalten, Messen
+    (`measure_iv`, `measure_iv_multi`), Sweeps, zeitgesteuerte Aufnahmen
+    und Puffer lesen. Messgeschwindigkeit (`set_measure_*`), Settling,
+    `set_level_and_measure`, I/O-Trace und Register-Cache gibt es nur im
+    synchronen Treiber.
+
+    Args:
+        log_manager (LogManager): Eine Instanz eines Log-Managers.
+    """
+
+    SWEEP_SCRIPT_NAME = Keithley2602.SWEEP_SCRIPT_NAME
+    TIMED_SCRIPT_NAME = Keithley2602.TIMED_SCRIPT_NAME
+
+    def __init__(self, log_manager):
+        self.log_mgr = log_manager
+        self.timeout = 2
+        self.idn_message = ""
+
+        self._reader = None
+        self._writer = None
+        self._pending = None
+        self._in_flight = None
+        self._reader_task = None
+        self._batch_depth = 0
+        self._batch_lines = []
+
+    @property
+    def is_open(self) -> bool:
+        return self._writer is not None and not self._writer.is_closing()
+
+    # --- Verbindung ---
+
+    async def connect(self, port: str, baudrate: int = 115200) -> tuple[bool, str]:
+        """ Öffnet die Verbindung und liest die IDN. """
+        try:
+            self._reader, self._writer = await asyncio.wait_for(self._open_streams(port, baudrate), self.timeout)
+            await self._drain_input()
+            self._pending = asyncio.Queue()
+            self._reader_task = asyncio.create_task(self._read_loop())
+            self.log_mgr.info(f"Connected to SMU [{port}] (asyncio)...")
+
+            self.idn_message = (await self.query("*IDN?")).strip()
+            return True, self.idn_message
+
+        except (OSError, asyncio.TimeoutError) as e:
+            self.log_mgr.error(f"Connection error: {e}")
+            await self._close()
+            return False, str(e)
+        except Exception as e:
+            self.log_mgr.error(f"Unexpected connection error: {e}")
+            await self._close()
+            return False, str(e)
+
+    async def disconnect(self):
+        """ Schaltet beide Ausgänge aus und schließt die Verbindung. """
+        if self.is_open:
+            try:
+                with self.batch():
+                    await self.set_output_off('a')
+                    await self.set_output_off('b')
+                await self._writer.drain()
+            except Exception as e:
+                self.log_mgr.error(f"Could not turn off SMU ouput during disconntect: {e}")
+            await self._close()
+            self.log_mgr.info("Disconnected from Keithley SMU.")
+
+    async def _open_streams(self, port: str, baudrate: int):
+        if "::" in port:
+            raise ConnectionError("VISA resources are not supported by the asyncio driver. Use Keithley2602.")
+        if is_network_address(port):
+            host, tcp_port = parse_socket_address(port)
+            return await asyncio.open_connection(host, tcp_port)
+        if serial_asyncio is None:
+            raise ConnectionError("pyserial-asyncio is not installed. Serial ports are not available for the asyncio driver.")
+        return await serial_asyncio.open_serial_connection(url=port, baudrate=baudrate)
+
+    async def _drain_input(self):
+        """ Verwirft Reste einer vorherigen Sitzung im Empfangspuffer. """
+        try:
+            while await asyncio.wait_for(self._reader.read(65536), 0.05):
+                pass
+        except asyncio.TimeoutError:
+            pass
+
+    async def _close(self):
+        self._fail(ConnectionError("Connection to SMU closed."))
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+            try:
+                await self._reader_task
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._reader_task = None
+
+    # --- Pipeline: Schreiben, Futures, Lese-Task ---
+
+    def _write(self, text: str):
+        """ Schreibt eine (ggf. mehrzeilige) Befehlsfolge, ohne auf das Gerät zu warten. """
+        self._writer.write((text + '\n').encode('ascii'))
+        self.log_mgr.debug(f"[SMU_TX] {text}")
+
+    def _flush_batch(self):
+        if self._batch_lines:
+            lines, self._batch_lines = self._batch_lines, []
+            self._write("\n".join(lines))
+
+    async def _request(self, command: str, size: int | None = None, timeout: float | None = None) -> bytes:
+        """
+        Sendet eine Anfrage und wartet auf deren Antwort.
+
+        Future und Befehl werden ohne `await` dazwischen eingereiht bzw.
+        geschrieben, die FIFO-Reihenfolge entspricht damit immer der
+        Reihenfolge auf der Leitung.
+
+        Args:
+            size (int, optional): None = Textzeile, sonst Anzahl Bytes einer REAL64-Antwort.
+            timeout (float, optional): Maximale Wartezeit auf die Antwort, ab dem
+                Zeitpunkt, an dem alle vorherigen Anfragen beantwortet sind
+                (siehe `_read_loop`). None = `self.timeout`.
+        """
+        if not self.is_open:
+            raise ConnectionError("No Connection to SMU-Device.")
+        future = asyncio.get_running_loop().create_future()
+        self._pending.put_nowait((future, size, timeout or self.timeout, command))
+        self._flush_batch()
+        self._write(command)
+        await self._writer.drain()
+        return await future
+
+    async def _read_loop(self):
+        """
+        Liest Antworten in Sende-Reihenfolge und löst die zugehörigen Futures auf.
+
+        Der Timeout einer Anfrage startet erst, wenn sie vorne in der
+        Warteschlange steht. Läuft er ab, lassen sich die folgenden Antworten
+        nicht mehr sicher zuordnen: Alle offenen Anfragen schlagen fehl und
+        die Verbindung wird geschlossen.
+        """
+        try:
+            while True:
+                future, size, timeout, command = await self._pending.get()
+                self._in_flight = future
+                try:
+                    data = await asyncio.wait_for(self._read_response(size), timeout)
+                except asyncio.TimeoutError:
+                    error = TimeoutError(f"SMU did not answer within {timeout} s: '{command[:60]}'")
+                    self.log_mgr.error(str(error))
+                    self._fail(error)
+                    return
+                self._in_flight = None
+                if not future.done():
+                    future.set_result(data)
+        except asyncio.CancelledError:
+            raise
+        except asyncio.IncompleteReadError:
+            self._fail(ConnectionError("Connection to SMU closed by peer."))
+        except Exception as e:
+            self._fail(e)
+
+    async def _read_response(self, size: int | None) -> bytes:
+        """ Liest eine Textzeile (size None) oder eine REAL64-Antwort mit `size` Bytes. """
+        if size is None:
+            data = await self._reader.readline()
+            if not data.endswith(b"\n"):
+                raise ConnectionError("Connection to SMU closed by peer.")
+            return data
+        header = await self._reader.readexactly(2)
+        if header != b"#0":
+            raise ValueError(f"Invalid binary header from SMU: {header!r}")
+        data = await self._reader.readexactly(size)
+        await self._reader.readline()
+        return data
+
+    def _fail(self, error: Exception):
+        """ Beendet alle offenen Anfragen (auch die gerade gelesene) mit `error` und schließt die Verbindung. """
+        if self._in_flight is not None:
+            if not self._in_flight.done():
+                self._in_flight.set_exception(error)
+            self._in_flight = None
+        if self._pending is not None:
+            while not self._pending.empty():
+                future = self._pending.get_nowait()[0]
+                if not future.done():
+                    future.set_exception(error)
+        if self._writer is not None and not self._writer.is_closing():
+            self._writer.close()
+        self._batch_lines = []
+
+    # --- Öffentliche I/O-Methoden ---
+
+    async def send_command(self, command: str):
+        """
+        Sendet einen Command an das Gerät, ohne auf die Ausführung zu warten.
+
+        Innerhalb von `batch()` wird der Befehl nur gesammelt.
+        """
+        if not self.is_open:
+            raise ConnectionError("No Connection to SMU-Device.")
+        if self._batch_depth > 0:
+            self._batch_lines.append(command)
+            return
+        self._write(command)
+        await self._writer.drain()
+
+    @contextmanager
+    def batch(self):
+        """ Sammelt alle Befehle im Block und sendet sie in einem Schreibvorgang (wie `Keithley2602.batch`). """
+        self._batch_depth += 1
+        try:
+            yield self
+        except Exception:
+            if self._batch_depth == 1:
+                self._batch_lines = []
+            raise
+        finally:
+            self._batch_depth -= 1
+        if self._batch_depth == 0 and self.is_open:
+            self._flush_batch()
+
+    async def query(self, command: str, timeout: float | None = None) -> str:
+        """ Sendet einen Befehl und liefert die Antwortzeile. """
+        response = (await self._request(command, timeout=timeout)).decode('ascii').strip()
+        self.log_mgr.debug(f"[SMU_RX] {response}")
+        return response
+
+    async def sync(self) -> bool:
+        """ Wartet, bis das Gerät alle bisher gesendeten Befehle abgearbeitet hat (`*OPC?`). """
+        response = await self.query("*OPC?")
+        try:
+            return float(response) == 1
+        except ValueError:
+            self.log_mgr.warning(f"Unexpected response to *OPC?: '{response}'")
+            return False
+
+    # --- SMU - Funktionen ---
+
+    async def reset_channel(self, channel: str):
+        await self.send_command(f"smu{channel}.reset()")
+
+    async def set_source_current(self, channel: str):
+        await self.send_command(f"smu{channel}.source.func = smu{channel}.OUTPUT_DCAMPS")
+
+    async def set_source_voltage(self, channel: str):
+        await self.send_command(f"smu{channel}.source.func = smu{channel}.OUTPUT_DCVOLTS")
+
+    async def set_sense_mode_local(self, channel: str):
+        await self.send_command(f"smu{channel}.sense = smu{channel}.SENSE_LOCAL")
+
+    async def set_sense_mode_remote(self, channel: str):
+        await self.send_command(f"smu{channel}.sense = smu{channel}.SENSE_REMOTE")
+
+    async def set_source_voltage_level(self, channel: str, level: float):
+        await self.send_command(f"smu{channel}.source.levelv = {level}")
+
+    async def set_source_current_level(self, channel: str, level: float):
+        await self.send_command(f"smu{channel}.source.leveli = {level}")
+
+    async def set_source_voltage_limit(self, channel: str, limit: float):
+        await self.send_command(f"smu{channel}.source.limitv = {limit}")
+
+    async def set_source_current_limit(self, channel: str, limit: float):
+        await self.send_command(f"smu{channel}.source.limiti = {limit}")
+
+    async def set_output_on(self, channel: str):
+        await self.send_command(f"smu{channel}.source.output = smu{channel}.OUTPUT_ON")
+
+    async def set_output_off(self, channel: str):
+        await self.send_command(f"smu{channel}.source.output = smu{channel}.OUTPUT_OFF")
+
+    async def measure_iv(self, channel: str) -> tuple[float, float]:
+        """ Misst Strom und Spannung für einen Kanal. """
+        response = await self.query(f"print(smu{channel}.measure.iv())")
+        try:
+            return Keithley2602._parse_iv(response)
+        except ValueError:
+            self.log_mgr.error(f"Invalid response from SMU during measurement: '{response}'")
+            raise
+
+    async def measure_iv_multi(self, channels=('a', 'b')) -> dict:
+        """ Misst mehrere Kanäle in einem Roundtrip (siehe `Keithley2602.measure_iv_multi`). """
+        channels = tuple(channels)
+        response = await self.query(Keithley2602._measure_multi_command(channels))
+        try:
+            return Keithley2602._parse_measure_multi(response, channels)
+        except ValueError:
+            self.log_mgr.error(f"Invalid response from SMU during multi-channel measurement: '{response}'")
+            raise
+
+    # --- Sweeps und Puffer ---
+
+    async def load_script(self, name: str, lines: list[str]):
+        """ Lädt ein TSP-Skript (loadscript/endscript) in einem Schreibvorgang auf das Gerät. """
+        if not self.is_open:
+            raise ConnectionError("No Connection to SMU-Device.")
+        self._flush_batch()
+        self._writer.write(("\n".join([f"loadscript {name}", *lines, "endscript"]) + "\n").encode('ascii'))
+        self.log_mgr.debug(f"[SMU_TX] loadscript {name} ({len(lines)} lines)")
+        await self._writer.drain()
+
+    async def sweep_linear(self, channel: str, start: float, stop: float, points: int,
+                           source_func: str = 'V', limit: float | None = None,
+                           settle_delay: float | None = None, output_off: bool = True) -> dict:
+        source_cmd, points = Keithley2602._sweep_source_command(channel, 'linear', source_func, start, stop, points)
+        return await self._run_sweep(channel, source_cmd, points, source_func, limit, settle_delay, output_off)
+
+    async def sweep_log(self, channel: str, start: float, stop: float, points: int,
+                        source_func: str = 'V', limit: float | None = None,
+                        settle_delay: float | None = None, output_off: bool = True) -> dict:
+        source_cmd, points = Keithley2602._sweep_source_command(channel, 'log', source_func, start, stop, points)
+        return await self._run_sweep(channel, source_cmd, points, source_func, limit, settle_delay, output_off)
+
+    async def sweep_list(self, channel: str, levels, source_func: str = 'V', limit: float | None = None,
+                         settle_delay: float | None = None, output_off: bool = True) -> dict:
+        source_cmd, points = Keithley2602._sweep_source_command(channel, 'list', source_func, levels)
+        return await self._run_sweep(channel, source_cmd, points, source_func, limit, settle_delay, output_off)
+
+    async def _run_sweep(self, channel: str, source_cmd: str, points: int, source_func: str,
+                         limit: float | None, settle_delay: float | None, output_off: bool) -> dict:
+        lines = Keithley2602._sweep_script(channel, source_cmd, points, source_func, limit, settle_delay, output_off)
+        await self.load_script(self.SWEEP_SCRIPT_NAME, lines)
+        await self.send_command(f"{self.SWEEP_SCRIPT_NAME}.run()")
+        return await self.read_buffers(Keithley2602._sweep_columns(channel), count=points,
+                                       timeout=Keithley2602._sweep_timeout(points))
+
+    async def acquire_timed(self, channel: str, interval: float, count: int, source_level: float | None = None,
+                            source_func: str = 'V', limit: float | None = None, output_off: bool = True) -> dict:
+        lines = Keithley2602._timed_script(channel, interval, count, source_func, source_level, limit, output_off)
+        await self.load_script(self.TIMED_SCRIPT_NAME, lines)
+        await self.send_command(f"{self.TIMED_SCRIPT_NAME}.run()")
+        return await self.read_buffers(Keithley2602._sweep_columns(channel), count=count,
+                                       timeout=2 + 2 * count * interval)
+
+    async def read_buffer(self, channel: str, buffer: str = "nvbuffer1", count: int | None = None) -> dict:
+        """ Liest Messwerte, Source-Werte und Zeitstempel eines Gerätepuffers binär aus. """
+        prefix = f"smu{channel}.{buffer}"
+        return await self.read_buffers({
+            'readings': f"{prefix}.readings",
+            'source': f"{prefix}.sourcevalues",
+            'timestamp': f"{prefix}.timestamps",
+        }, count=count)
+
+    async def read_buffers(self, columns: dict[str, str], count: int | None = None,
+                           timeout: float | None = None) -> dict[str, np.ndarray]:
+        """ Überträgt Puffer-Spalten im REAL64-Format (siehe `Keithley2602.read_buffers`). """
+        names = list(columns)
+        exprs = list(columns.values())
+        if count is None:
+            response = await self.query(f"print({exprs[0].rsplit('.', 1)[0]}.n)")
+            try:
+                count = int(float(response))
+            except ValueError:
+                raise ValueError(f"Invalid SMU buffer size response: '{response}'")
+        if count <= 0:
+            return {name: np.empty(0, dtype=np.float64) for name in names}
+
+        size = count * len(names) * 8
+        payload = await self._request(Keithley2602._printbuffer_command(count, exprs), size=size, timeout=timeout)
+        self.log_mgr.debug(f"[SMU_RX] <{len(payload)} bytes REAL64, {count} x {len(names)}>")
+        return Keithley2602._decode_real64(payload, count, names)
+
+
+# ==========================================================================================
+#  Main zum Testen gegen den Emulator
+# ==========================================================================================
+
+if __name__ == "__main__":
+    import time
+    from KeithleyEmulator import KeithleyTcpEmulator, LatencyModel
+
+    class QuietLogManager:
+        def info(self, msg): print(f"[INFO] {msg}")
+        def debug(self, msg): pass
+        def warning(self, msg): print(f"[WARN] {msg}")
+        def error(self, msg, exc_info=True): print(f"[ERROR] {msg}")
+
+    async def main():
+        # 1 ms Verarbeitungszeit pro Statement, damit Pipelining sichtbar wird
+        server = KeithleyTcpEmulator(latency=LatencyModel(command_latency=1e-3, measure_timing=False))
+        address = server.start()
+
+        smu = AsyncKeithley2602(QuietLogManager())
+        connected, idn = await smu.connect(address)
+        print(f"Verbunden: {idn}")
+
+        with smu.batch():
+            await smu.set_source_voltage_level('a', 1.0)
+            await smu.set_output_on('a')
+
+        n = 200
+        t = time.perf_counter()
+        for _ in range(n):
+            await smu.measure_iv('a')
+        sequential = time.perf_counter() - t
+
+        t = time.perf_counter()
+        results = await asyncio.gather(*(smu.measure_iv('a') for _ in range(n)))
+        pipelined = time.perf_counter() - t
+        print(f"{n} Messungen: sequentiell {sequential * 1000:.0f} ms, gepipelined {pipelined * 1000:.0f} ms")
+        print(f"Letzte Messung: {results[-1]}")
+
+        sweep, single = await asyncio.gather(smu.sweep_linear('a', -1, 1, 1000), smu.measure_iv('b'))
+        print(f"Sweep: {len(sweep['current'])} Punkte, parallel gemessen (b): {single}")
+
+        await smu.disconnect()
+        server.stop()
+
+    asyncio.run(main())
@@ -65,6 +65,55 @@ smuX.source.output = smuX.OUTPUT_OFF            # Quelle (Ausgang) ausschalten
 smuX.sense = smuX.SENSE_LOCAL                   # Lokale Messung (2-Leiter-Messung)
 smuX.sense = smuX.SENSE_REMOTE                  # Fernmessung (4-Leiter-Messung / Kelvin-Messung)
 
+--------------------------------------------------------------------------------
+4. TRIGGER-MODELL & MESSPUFFER (smuX.trigger, smuX.nvbufferY)
+--------------------------------------------------------------------------------
+
+# --- Sweep-Quelle (Trigger-Modell) ---
+smuX.trigger.source.linearv(start, stop, points) # Linearer Spannungs-Sweep
+smuX.trigger.source.logv(start, stop, points, 0) # Logarithmischer Spannungs-Sweep
+smuX.trigger.source.listv({v1, v2, ...})        # Beliebige Spannungsliste
+smuX.trigger.source.limiti = level              # Strom-Compliance während des Sweeps
+smuX.trigger.measure.iv(smuX.nvbuffer1, smuX.nvbuffer2) # I nach Puffer 1, V nach Puffer 2
+smuX.trigger.count = points                     # Anzahl der Sweep-Punkte
+smuX.trigger.initiate()                         # Sweep auf dem Gerät starten
+trigger.timer[1].delay = interval               # Timer-Intervall in s (für zeitgesteuerte Messungen)
+trigger.timer[1].count = count - 1              # Anzahl weiterer Timer-Events
+trigger.timer[1].passthrough = true             # Erstes Event sofort durchreichen
+trigger.timer[1].stimulus = smuX.trigger.ARMED_EVENT_ID # Timer startet mit dem Trigger-Modell
+smuX.trigger.source.stimulus = trigger.timer[1].EVENT_ID # Jeder Punkt wartet auf den Timer
+waitcomplete()                                  # Warten bis alle Befehle fertig sind
+
+# --- Messpuffer auslesen ---
+printbuffer(1, smuX.nvbuffer1.n, smuX.nvbuffer1.readings) # Alle Messwerte in einer Zeile
+format.data = format.REAL64                     # Binärausgabe ('#0' + 8 Byte pro Wert) statt ASCII
+format.byteorder = format.LITTLEENDIAN          # Byte-Reihenfolge der Binärausgabe
+format.data = format.ASCII                      # Zurück zur Textausgabe
+
+--------------------------------------------------------------------------------
+5. MESSGESCHWINDIGKEIT / GENAUIGKEIT
+--------------------------------------------------------------------------------
+
+smuX.measure.nplc = 1                           # Integrationszeit in Netzperioden (0.001 ... 25)
+smuX.measure.autozero = smuX.AUTOZERO_AUTO      # Referenz/Null bei jeder Messung (genau, langsam)
+smuX.measure.autozero = smuX.AUTOZERO_ONCE      # Referenz/Null einmalig jetzt
+smuX.measure.autozero = smuX.AUTOZERO_OFF       # Kein Autozero (schnell, driftet)
+smuX.measure.delay = smuX.DELAY_AUTO            # Messverzögerung abhängig vom Bereich
+smuX.measure.delay = 0                          # Keine zusätzliche Messverzögerung
+smuX.measure.filter.type = smuX.FILTER_REPEAT_AVG # Mittelwert über wiederholte Messungen
+smuX.measure.filter.count = 10                  # Anzahl der gemittelten Messungen
+smuX.measure.filter.enable = smuX.FILTER_ON     # Filter EIN (FILTER_OFF = AUS)
+display.screen = display.SMUA_SMUB              # Messwerte am Display anzeigen
+display.screen = display.USER                   # Keine Messwert-Aktualisierung am Display
+
+--------------------------------------------------------------------------------
+6. FUNKTIONSBIBLIOTHEK (ModulabLib, siehe Keithley2602.TSP_LIBRARY_FUNCTIONS)
+--------------------------------------------------------------------------------
+
+print(ml_version)                               # Version der geladenen Bibliothek ('nil' = keine)
+mlLv(smua, 0.5)                                 # = smua.source.levelv = 0.5
+mlLvM(smua, 0.5)                                # Level setzen und I/V messen in einer Zeile
+
 """
 
 # ==========================================================================================
@@ -72,99 +121,515 @@ smuX.sense = smuX.SENSE_REMOTE                  # Fernmessung (4-Leiter-Messung
 # ==========================================================================================
 # https://download.tek.com/manual/2600AS-901-01--E-Aug2011--Ref.pdf
 
+import functools
+import re
+import threading
 import time
+from contextlib import contextmanager
 
-# Die Verbindung läuft über einen seriellen Port RS232 
+import numpy as np
+
+# Die Verbindung läuft standardmäßig über einen seriellen Port RS232 
 # Mann kann wahrscheinlich auch über den USB Port der neuen SMU ein Virtuellen Com Port nutzen.
-# Am besten einfach mal auspobieren 
+# Alternativ LAN (Raw-Socket Port 5025) oder VISA, siehe Transport.py
 import serial
 from serial.tools import list_ports
 
+try:
+    from .Transport import create_transport
+    from .TraceRecorder import TraceRecorder, TracingTransport
+except ImportError: # Direkter Aufruf als Skript (siehe Main unten)
+    from Transport import create_transport
+    from TraceRecorder import TraceRecorder, TracingTransport
+
+def _locked(method):
+    """ Führt eine Treiber-Methode unter dem I/O-Lock aus (z.B. GUI und Streaming-Thread gleichzeitig). """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._io_lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+class ShadowRegisterCache:
+    """
+    Write-Through-Schattenkopie der zuletzt gesendeten SMU-Register.
+
+    Gemerkt werden einfache Zuweisungen an `smuX.source.*`, `smuX.measure.*`
+    und `smuX.sense`. Eine Zuweisung, deren Wert bereits im Cache steht,
+    ist ein No-Op und muss nicht erneut gesendet werden.
+
+    Der Cache kennt nur, was über den Treiber geschrieben wurde. Alles, was
+    den Gerätezustand anders ändert (Reset, Sweep-Skripte, Fehler,
+    Bedienung am Gerät), muss ihn über `invalidate()` verwerfen.
+    Der Ausgangszustand (`source.output`) wird nie gecacht und immer
+    gesendet: Das Gerät schaltet den Ausgang auch selbst ab (Compliance,
+    Interlock, Bedienfeld), ein erneutes "Ein" darf also nicht verloren gehen.
+    """
+
+    UNCACHED_REGISTERS = frozenset({'source.output'})
+    """frozenset[str]: Register, die sich am Gerät ohne Zutun des Treibers ändern können."""
+
+    _REGISTER_ASSIGNMENT = re.compile(r"^smu([ab])\.(source\.\w+|measure\.[\w.]+|sense)\s*=\s*(\S+)$")
+
+    def __init__(self):
+        self.enabled = True
+        self._values = {}
+        self.hits = 0
+        self.misses = 0
+        self.saved_bytes = 0
+
+    def is_redundant(self, command: str) -> bool:
+        """
+        Prüft, ob `command` einen bereits gesetzten Wert erneut schreibt.
+
+        Nicht redundante Register-Zuweisungen werden dabei in den Cache übernommen.
+        """
+        match = self._REGISTER_ASSIGNMENT.match(command) if self.enabled else None
+        if not match:
+            return False
+        channel, register, value = match.groups()
+        if register in self.UNCACHED_REGISTERS:
+            return False
+        key = (channel, register)
+        if self._values.get(key) == value:
+            self.hits += 1
+            self.saved_bytes += len(command) + 1
+            return True
+        self._values[key] = value
+        self.misses += 1
+        return False
+
+    def store(self, command: str):
+        """ Übernimmt eine Zuweisung, die auf anderem Weg (z.B. in einem Skript) gesendet wurde. """
+        match = self._REGISTER_ASSIGNMENT.match(command)
+        if match and match.group(2) not in self.UNCACHED_REGISTERS:
+            channel, register, value = match.groups()
+            self._values[(channel, register)] = value
+
+    def invalidate(self, channel: str | None = None):
+        """ Verwirft die gemerkten Werte eines Kanals oder (ohne Argument) aller Kanäle. """
+        if channel is None:
+            self._values.clear()
+        else:
+            self._values = {key: value for key, value in self._values.items() if key[0] != channel}
+
+    def stats(self) -> dict:
+        """ Zähler: {'hits', 'misses', 'saved_bytes', 'entries'}. """
+        return {'hits': self.hits, 'misses': self.misses,
+                'saved_bytes': self.saved_bytes, 'entries': len(self._values)}
+
+
 class Keithley2602:
     """
     Low-Level-Treiber des Keithley2602
     """
 
+    SWEEP_SCRIPT_NAME = "ModulabSweep"
+    """str: Name des TSP-Skripts, in das Sweeps auf dem Gerät geladen werden."""
+
+    TIMED_SCRIPT_NAME = "ModulabTimed"
+    """str: Name des TSP-Skripts für zeitgesteuerte Aufnahmen (`acquire_timed`)."""
+
+    TSP_LIBRARY_NAME = "ModulabLib"
+    """str: Name des TSP-Skripts mit den Kurzfunktionen (`TSP_LIBRARY_FUNCTIONS`)."""
+
+    TSP_LIBRARY_VERSION = "1"
+    """str: Version der Bibliothek, bei Änderungen an `TSP_LIBRARY_FUNCTIONS` erhöhen."""
+
+    # Kurzname: (Parameter, Rumpf). 's' ist die SMU (smua/smub), 'x' ein Wert.
+    # Befehle, die exakt dem Rumpf entsprechen, werden nach dem Laden der
+    # Bibliothek als Funktionsaufruf gesendet (siehe `_compact`).
+    TSP_LIBRARY_FUNCTIONS = {
+        'mlFv': ("s", "s.source.func = s.OUTPUT_DCVOLTS"),
+        'mlFi': ("s", "s.source.func = s.OUTPUT_DCAMPS"),
+        'mlSl': ("s", "s.sense = s.SENSE_LOCAL"),
+        'mlSr': ("s", "s.sense = s.SENSE_REMOTE"),
+        'mlLv': ("s, x", "s.source.levelv = x"),
+        'mlLi': ("s, x", "s.source.leveli = x"),
+        'mlCv': ("s, x", "s.source.limitv = x"),
+        'mlCi': ("s, x", "s.source.limiti = x"),
+        'mlOn': ("s", "s.source.output = s.OUTPUT_ON"),
+        'mlOff': ("s", "s.source.output = s.OUTPUT_OFF"),
+        'mlM': ("s", "print(s.measure.iv())"),
+        'mlLvM': ("s, x", "s.source.levelv = x print(s.measure.iv())"),
+        'mlLiM': ("s, x", "s.source.leveli = x print(s.measure.iv())"),
+    }
+    """dict: Funktionen der TSP-Bibliothek, die einmal pro Gerät geladen wird."""
+
+    SETTLE_SCRIPT_NAME = "ModulabSettle"
+    """str: Name des TSP-Skripts, das die Funktion `modulab_settle` definiert."""
+
+    # Setzt das Level und misst so lange, bis die letzten `window` Werte der
+    # gemessenen Größe (Strom bei V-Quelle, Spannung bei I-Quelle) innerhalb
+    # von tol * |Mittelwert| + abs_tol liegen oder max_wait erreicht ist.
+    # TSP ist Lua 5.0: kein '#'-Operator, daher table.getn.
+    SETTLE_SCRIPT = [
+        "function modulab_settle(smu, source_v, level, tol, abs_tol, window, max_wait)",
+        "  if source_v == 1 then smu.source.levelv = level else smu.source.leveli = level end",
+        "  local t0 = timer.measure.t()",
+        "  local values = {}",
+        "  local i, v, x, t",
+        "  local settled = 0",
+        "  repeat",
+        "    i, v = smu.measure.iv()",
+        "    if source_v == 1 then x = i else x = v end",
+        "    table.insert(values, x)",
+        "    if table.getn(values) > window then table.remove(values, 1) end",
+        "    t = timer.measure.t() - t0",
+        "    if table.getn(values) == window then",
+        "      local lo, hi, sum = values[1], values[1], 0",
+        "      for k = 1, window do",
+        "        lo = math.min(lo, values[k]) hi = math.max(hi, values[k]) sum = sum + values[k]",
+        "      end",
+        "      if hi - lo <= tol * math.abs(sum / window) + abs_tol then settled = 1 end",
+        "    end",
+        "  until settled == 1 or t >= max_wait",
+        "  return i, v, t, settled",
+        "end",
+    ]
+    """list[str]: TSP-Quelltext von `modulab_settle` (wird einmal pro Verbindung geladen)."""
+
+    LINE_FREQUENCY = 50
+    """int: Netzfrequenz in Hz (1 NPLC = 20 ms)."""
+
+    AUTOZERO_MODES = ('off', 'once', 'auto')
+    """tuple[str]: Gültige Autozero-Modi für `set_measure_autozero`."""
+
+    DEFAULT_MEASURE_TIMING = {'nplc': 1.0, 'autozero': 'auto', 'delay': 'auto', 'filter_count': 1}
+    """dict: Werkseinstellungen der Messgeschwindigkeit nach `smuX.reset()`."""
+
     def __init__(self,log_manager):
         self.log_mgr = log_manager
-        self._serial = serial.Serial() 
-        self._serial.timeout = 2
+        self._transport = None
+        self.timeout = 2
     
         self.idn_message = ""
 
+        # Batch-Modus: gesammelte TSP-Zeilen werden in einem Schreibvorgang gesendet
+        self._batch_depth = 0
+        self._batch_lines = []
+
+        # Zuletzt geschriebene Register, um No-Op-Befehle nicht erneut zu senden
+        self.register_cache = ShadowRegisterCache()
+
+        # Skripte, die in dieser Verbindung bereits auf das Gerät geladen wurden
+        self._loaded_scripts = set()
+
+        # Kurzfunktionen (TSP_LIBRARY_FUNCTIONS) statt ausgeschriebener Befehle senden
+        self.use_library = True
+        self._library_loaded = False
+
+        # Messgeschwindigkeit pro Kanal, für die Abschätzung von Timeouts
+        self._measure_timing = {ch: dict(self.DEFAULT_MEASURE_TIMING) for ch in ('a', 'b')}
+
+        # Befehl + Antwort müssen zusammenbleiben, wenn mehrere Threads das Gerät nutzen
+        self._io_lock = threading.RLock()
+
+        # I/O-Protokoll: Debug-Log pro Zeile (langsam) und/oder binärer Trace (schnell)
+        self.log_io = True
+        self.trace_recorder = None
+        # Handshake des letzten connect() (IDN, Bibliothek), für start_trace mitten in der Sitzung
+        self._handshake = None
+
     # --- Verbindung ---
 
     @property
     def is_open(self) -> bool:
-        """ Gibt den Status des Serialen Ports zurück """
-        return self._serial.is_open
+        """ Gibt den Status der Verbindung zurück """
+        return self._transport is not None and self._transport.is_open
     
     def connect(self, port: str, baudrate: int = 115200) -> tuple[bool,str]:
-        """ Versucht Verbindung zum Keithley aufzubauen """
-        if self._serial.is_open:
+        """
+        Versucht Verbindung zum Keithley aufzubauen.
+
+        `port` ist ein COM-Port, eine LAN-Adresse ('192.168.0.10:5025') oder
+        eine VISA-Ressource ('TCPIP0::192.168.0.10::INSTR').
+        """
+        if self.is_open:
             self.disconnect()
 
+        self.register_cache.invalidate()
+        self._loaded_scripts.clear()
+        self._library_loaded = False
         try:
-            self._serial.port = port
-            self._serial.baudrate = baudrate
-            self._serial.open()
+            transport = create_transport(port, baudrate=baudrate, timeout=self.timeout)
+            # Der Handshake wird immer mitgeschnitten, start_trace() trägt ihn nach
+            self._handshake = TraceRecorder(max_records=16, payload_capacity=64 * 1024)
+            self._transport = self._traced(TracingTransport(transport, self._handshake))
+            self._transport.open()
             time.sleep(0.1) # sry for that!
-            self._serial.read_all() # Buffer leeren
+            self._transport.clear_input() # Buffer leeren
             self.log_mgr.info(f"Connected to SMU [{port}]...")
 
 
             # Befehl zum Auslesen der IDN
             self.idn_message = self.query("*IDN?").strip()
 
+            if self.use_library and "KEITHLEY" in self.idn_message.upper():
+                self._load_library()
+
+            self._transport = self._traced(transport)
             return True, self.idn_message
 
         except serial.SerialException as e:
             self.log_mgr.error(f"Serial connection error: {e}")
             return False, str(e)
+        except OSError as e:
+            self.log_mgr.error(f"Network connection error: {e}")
+            return False, str(e)
         except Exception as e:
             self.log_mgr.error(f"Unexpected connection error: {e}")
             return False, str(e)
 
+    def _load_library(self):
+        """
+        Lädt die TSP-Bibliothek, falls sie nicht schon in passender Version auf dem Gerät liegt.
+
+        Die Funktionen bleiben bis zum Ausschalten des Geräts erhalten, nach
+        dem ersten Verbinden genügt also eine kurze Versionsabfrage.
+        """
+        version = self.query("print(ml_version)")
+        if version != self.TSP_LIBRARY_VERSION:
+            lines = [f'ml_version = "{self.TSP_LIBRARY_VERSION}"']
+            lines += [f"function {name}({params}) {body} end"
+                      for name, (params, body) in self.TSP_LIBRARY_FUNCTIONS.items()]
+            self.load_script(self.TSP_LIBRARY_NAME, lines)
+            self.send_command(f"{self.TSP_LIBRARY_NAME}.run()")
+            version = self.query("print(ml_version)")
+        self._library_loaded = version == self.TSP_LIBRARY_VERSION
+        if self._library_loaded:
+            self.log_mgr.debug(f"TSP library {self.TSP_LIBRARY_NAME} v{version} ready.")
+        else:
+            self.log_mgr.warning(f"Could not load TSP library {self.TSP_LIBRARY_NAME} "
+                                 f"(got '{version}'), sending full commands.")
+
+    @classmethod
+    @functools.cache
+    def _library_patterns(cls) -> list[tuple[re.Pattern, str]]:
+        """ Übersetzt die Rümpfe aus `TSP_LIBRARY_FUNCTIONS` in Regexe für `_compact`. """
+        patterns = []
+        for name, (params, body) in cls.TSP_LIBRARY_FUNCTIONS.items():
+            regex, seen = "", set()
+            for token in re.split(r"\b([sx])\b", body):
+                if token in ('s', 'x'):
+                    if token in seen:
+                        regex += f"(?P={token})"
+                    else:
+                        regex += f"(?P<s>smu[ab])" if token == 's' else r"(?P<x>[^\s,(){}]+)"
+                        seen.add(token)
+                else:
+                    regex += re.escape(token)
+            patterns.append((re.compile(regex), f"{name}({params.replace(' ', '').replace('s', '{s}').replace('x', '{x}')})"))
+        return patterns
+
+    def _compact(self, command: str) -> str:
+        """ Ersetzt einen Befehl durch den passenden Bibliotheksaufruf (falls geladen). """
+        if not self._library_loaded:
+            return command
+        for pattern, template in self._library_patterns():
+            match = pattern.fullmatch(command)
+            if match:
+                return template.format(**match.groupdict())
+        return command
+
+    @staticmethod
+    def probe(port: str, baudrate: int = 115200, timeout: float = 0.3) -> str | None:
+        """
+        Fragt an `port` einmal `*IDN?` ab, ohne eine Verbindung aufzubauen.
+
+        Für die Gerätesuche gedacht: kurzer Timeout, keine Wartezeit nach dem
+        Öffnen, kein Logging. Wird parallel für viele Ports aufgerufen.
+
+        Returns:
+            str | None: Die IDN-Antwort oder None, wenn nichts (Lesbares) zurückkam.
+        """
+        transport = create_transport(port, baudrate=baudrate, timeout=timeout)
+        try:
+            transport.open()
+            transport.clear_input()
+            transport.write(b"*IDN?\n")
+            response = transport.readline()
+        except Exception:
+            return None
+        finally:
+            if transport.is_open:
+                transport.close()
+        idn = response.decode('ascii', errors='replace').strip()
+        return idn or None
+
     def disconnect(self):
-        """ Schließt die serielle Verbindung """
+        """ Schließt die Verbindung """
         if self.is_open:
             try:
-                self.set_output_off('a')
-                self.set_output_off('b')
+                with self.batch():
+                    self.set_output_off('a')
+                    self.set_output_off('b')
             except Exception as e:
                 self.log_mgr.error(f"Could not turn off SMU ouput during disconntect: {e}")
-            self._serial.close()
+            self._transport.close()
             self.log_mgr.info("Disconnected from Keithley SMU.") 
 
-    # --- Auf Seriellen Port schreiben und lesen ---
+    # --- Auf die Verbindung schreiben und lesen ---
 
+    @_locked
     def send_command(self, command: str):
-        """ Sendet einen Command an das Gerät."""
+        """
+        Sendet einen Command an das Gerät.
+
+        Innerhalb von `batch()` wird der Befehl nur gesammelt und erst beim
+        Verlassen des Blocks zusammen mit den anderen Befehlen geschrieben.
+        Es wird nicht auf die Ausführung gewartet, dafür gibt es `sync()`.
+        Register-Zuweisungen mit unverändertem Wert werden nicht gesendet
+        (siehe `ShadowRegisterCache`).
+        """
         if not self.is_open:
             raise ConnectionError("No Connection to SMU-Device.")
-        cmd_bytes = (command + '\n').encode('ascii')
-        self._serial.write(cmd_bytes)
-        self.log_mgr.debug(f"[SMU_TX] {command}")
-        time.sleep(0.05) # sry again but
+        if self.register_cache.is_redundant(command):
+            return
+        command = self._compact(command)
+        if self._batch_depth > 0:
+            self._batch_lines.append(command)
+            return
+        self._write(command)
+
+    def _write(self, text: str):
+        """ Schreibt eine (ggf. mehrzeilige) Befehlsfolge in einem Schreibvorgang. """
+        try:
+            self._transport.write((text + '\n').encode('ascii'))
+        except Exception:
+            # Unklar, was angekommen ist
+            self.register_cache.invalidate()
+            raise
+        if self.log_io:
+            self.log_mgr.debug(f"[SMU_TX] {text}")
+
+    def _flush_batch(self):
+        """ Schreibt alle im Batch gesammelten Befehle als einen Block. """
+        if self._batch_lines:
+            lines, self._batch_lines = self._batch_lines, []
+            self._write("\n".join(lines))
+
+    @contextmanager
+    def batch(self):
+        """
+        Sammelt alle Befehle im Block und sendet sie in einem einzigen Schreibvorgang.
+
+        Blöcke dürfen verschachtelt werden, gesendet wird beim Verlassen des
+        äußersten Blocks. Queries innerhalb des Blocks senden die bis dahin
+        gesammelten Befehle vorher ab, damit die Reihenfolge erhalten bleibt.
+        Bei einer Exception werden die noch nicht gesendeten Befehle verworfen.
+        Andere Threads warten, bis der Block beendet ist.
+        """
+        with self._io_lock:
+            self._batch_depth += 1
+            try:
+                yield self
+            except Exception:
+                if self._batch_depth == 1 and self._batch_lines:
+                    self.log_mgr.warning(f"Discarding {len(self._batch_lines)} batched SMU command(s) after error.")
+                    self._batch_lines = []
+                    # Die verworfenen Zuweisungen stehen schon im Cache
+                    self.register_cache.invalidate()
+                raise
+            finally:
+                self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._flush_batch()
+
+    def sync(self) -> bool:
+        """
+        Wartet, bis das Gerät alle bisher gesendeten Befehle abgearbeitet hat (`*OPC?`).
+
+        Returns:
+            bool: True, wenn das Gerät die Fertigmeldung geschickt hat.
+        """
+        response = self.query("*OPC?")
+        try:
+            return float(response) == 1
+        except ValueError:
+            self.log_mgr.warning(f"Unexpected response to *OPC?: '{response}'")
+            return False
 
     def read_response(self) -> str:
         """ Liest eine Antwort vom Gerät """
         if not self.is_open:
             return ""
-        response = self._serial.readline().decode('ascii').strip()
-        self.log_mgr.debug(f"[SMU_RX] {response}")
+        response = self._transport.readline().decode('ascii').strip()
+        if self.log_io:
+            self.log_mgr.debug(f"[SMU_RX] {response}")
         return response
     
     # --- SMU - Funktionen ---
 
+    @_locked
     def query(self, command : str) -> str:
         """sendet einen Befehl und liest die Antwort."""
-        self.send_command(command)
-        return self.read_response()
+        if not self.is_open:
+            raise ConnectionError("No Connection to SMU-Device.")
+        self._flush_batch()
+        self._write(self._compact(command))
+        response = self.read_response()
+        if not response:
+            # Timeout: Gerätezustand unbekannt
+            self.register_cache.invalidate()
+        return response
+
+    def start_trace(self, recorder: TraceRecorder | None = None) -> TraceRecorder:
+        """
+        Zeichnet ab jetzt alle TX/RX-Vorgänge binär auf (siehe `TraceRecorder`).
+
+        Das zeilenweise Debug-Log (`log_io`) wird während des Traces abgeschaltet,
+        da es ein Vielfaches der eigentlichen I/O-Zeit kostet.
+
+        Bei bestehender Verbindung beginnt der Trace mit dem Handshake von
+        `connect()` (IDN, Bibliotheks-Version), Register-Cache und geladene
+        Skripte werden verworfen. Ein Replay mit `connect("REPLAY:…")` sendet
+        also genau das, was aufgezeichnet wurde.
+        """
+        self.trace_recorder = recorder or TraceRecorder()
+        self.log_io = False
+        if self._transport is not None:
+            if isinstance(self._transport, TracingTransport):
+                self._transport = self._transport.inner
+            if self.is_open and self._handshake is not None:
+                # Handshake von connect() nachtragen, damit der Trace mit connect() abspielbar ist
+                for record in self._handshake.records():
+                    self.trace_recorder.record(record.direction, record.data)
+                # Zustand wie direkt nach connect(): sonst fehlen im Trace Befehle,
+                # die der Cache bzw. ein schon geladenes Skript hier eingespart hat
+                self.register_cache.invalidate()
+                self._loaded_scripts.clear()
+            self._transport = self._traced(self._transport)
+        return self.trace_recorder
+
+    def stop_trace(self) -> TraceRecorder | None:
+        """ Beendet die Aufzeichnung und gibt den Recorder (mit allen Einträgen) zurück. """
+        recorder, self.trace_recorder = self.trace_recorder, None
+        if isinstance(self._transport, TracingTransport):
+            self._transport = self._transport.inner
+        self.log_io = True
+        return recorder
+
+    def _traced(self, transport):
+        """ Hüllt `transport` in einen `TracingTransport`, solange ein Trace läuft. """
+        if self.trace_recorder is None:
+            return transport
+        return TracingTransport(transport, self.trace_recorder)
+
+    def get_cache_stats(self) -> dict:
+        """ Gibt die Zähler des Register-Caches zurück (siehe `ShadowRegisterCache.stats`). """
+        return self.register_cache.stats()
+
+    def invalidate_cache(self, channel: str | None = None):
+        """ Verwirft den Register-Cache, z.B. nach Bedienung am Gerät. """
+        self.register_cache.invalidate(channel)
     
     def reset_channel(self, channel: str):
         """Setzt Channel der SMU zurück"""
         self.send_command(f"smu{channel}.reset()")
+        self.register_cache.invalidate(channel)
+        self._measure_timing[channel] = dict(self.DEFAULT_MEASURE_TIMING)
 
     def set_source_current(self, channel: str):
         """Stellt die Source-Funktion auf Strom für einen Kanal"""
@@ -206,16 +671,534 @@ class Keithley2602:
         """Schaltet den Ausgang eines Kanals aus."""
         self.send_command(f"smu{channel}.source.output = smu{channel}.OUTPUT_OFF")
 
+    def set_measure_nplc(self, channel: str, nplc: float):
+        """Stellt die Integrationszeit (in Netzperioden, 0.001 ... 25) für einen Kanal ein."""
+        if not 0.001 <= nplc <= 25:
+            raise ValueError(f"NPLC {nplc} out of range (0.001 ... 25).")
+        self.send_command(f"smu{channel}.measure.nplc = {nplc}")
+        self._measure_timing[channel]['nplc'] = nplc
+
+    def set_measure_autozero(self, channel: str, mode: str):
+        """Stellt den Autozero-Modus ('off', 'once', 'auto') für einen Kanal ein."""
+        if mode not in self.AUTOZERO_MODES:
+            raise ValueError(f"Invalid autozero mode '{mode}' (expected one of {self.AUTOZERO_MODES}).")
+        self.send_command(f"smu{channel}.measure.autozero = smu{channel}.AUTOZERO_{mode.upper()}")
+        self._measure_timing[channel]['autozero'] = mode
+
+    def set_measure_delay(self, channel: str, delay):
+        """Stellt die Messverzögerung in Sekunden ein ('auto' = bereichsabhängig)."""
+        if delay == 'auto':
+            self.send_command(f"smu{channel}.measure.delay = smu{channel}.DELAY_AUTO")
+        elif delay >= 0:
+            self.send_command(f"smu{channel}.measure.delay = {delay}")
+        else:
+            raise ValueError(f"Invalid measure delay {delay}.")
+        self._measure_timing[channel]['delay'] = delay
+
+    def set_measure_filter(self, channel: str, count: int):
+        """Mittelt über `count` wiederholte Messungen (1 = Filter aus)."""
+        if not 1 <= count <= 100:
+            raise ValueError(f"Filter count {count} out of range (1 ... 100).")
+        if count > 1:
+            self.send_command(f"smu{channel}.measure.filter.type = smu{channel}.FILTER_REPEAT_AVG")
+            self.send_command(f"smu{channel}.measure.filter.count = {count}")
+            self.send_command(f"smu{channel}.measure.filter.enable = smu{channel}.FILTER_ON")
+        else:
+            self.send_command(f"smu{channel}.measure.filter.enable = smu{channel}.FILTER_OFF")
+        self._measure_timing[channel]['filter_count'] = count
+
+    def set_display_enabled(self, enable: bool):
+        """Schaltet die Messwert-Anzeige am Gerät ein oder aus (aus spart Zeit pro Messung)."""
+        if enable:
+            self.send_command("display.screen = display.SMUA_SMUB")
+        else:
+            self.send_command("display.screen = display.USER")
+            self.send_command("display.clear()")
+
+    def estimate_measure_time(self, channel: str) -> float:
+        """
+        Schätzt die Dauer einer Messung aus den eingestellten Werten.
+
+        Autozero 'auto' misst Referenz und Null bei jeder Messung mit (~3x),
+        der Filter wiederholt die ganze Messung `filter_count` mal.
+        """
+        timing = self._measure_timing[channel]
+        delay = 0.001 if timing['delay'] == 'auto' else timing['delay']
+        integration = timing['nplc'] / self.LINE_FREQUENCY * (3 if timing['autozero'] == 'auto' else 1)
+        return (integration + delay) * timing['filter_count']
+
+    @contextmanager
+    def _timeout_at_least(self, seconds: float):
+        """ Erhöht den Lese-Timeout für die Dauer des Blocks, falls er kürzer als `seconds` ist. """
+        old_timeout = self._transport.timeout if self._transport is not None else None
+        if old_timeout is None or old_timeout >= seconds:
+            yield
+            return
+        self._transport.timeout = seconds
+        try:
+            yield
+        finally:
+            self._transport.timeout = old_timeout
+
+    @_locked
     def measure_iv(self, channel: str) -> tuple[float, float]:
         """Misst Strom und Spannung für einen Kanal und gibt sie zurück."""
-        response = self.query(f"print(smu{channel}.measure.iv())")
+        # Langsame Einstellungen (hohe NPLC, Filter) dürfen nicht in den Timeout laufen
+        with self._timeout_at_least(self.timeout + 2 * self.estimate_measure_time(channel)):
+            response = self.query(f"print(smu{channel}.measure.iv())")
+        try:
+            return self._parse_iv(response)
+        except ValueError:
+            self.log_mgr.error(f"Invalid response from SMU during measurement: '{response}'")
+            self.register_cache.invalidate()
+            raise
+
+    @_locked
+    def set_level_and_measure(self, channel: str, level: float, source_func: str = 'V') -> tuple[float, float]:
+        """
+        Setzt das Source-Level und misst I/V mit einer Zeile und einer Antwort.
+
+        Mit geladener Bibliothek wird daraus z.B. `mlLvM(smua,0.5)`.
+        """
+        func = self._sweep_func(source_func)
+        command = f"smu{channel}.source.level{func} = {level}"
+        self.register_cache.store(command)
+        with self._timeout_at_least(self.timeout + 2 * self.estimate_measure_time(channel)):
+            response = self.query(f"{command} print(smu{channel}.measure.iv())")
+        try:
+            return self._parse_iv(response)
+        except ValueError:
+            self.log_mgr.error(f"Invalid response from SMU during measurement: '{response}'")
+            self.register_cache.invalidate()
+            raise
+
+    @_locked
+    def measure_iv_multi(self, channels=('a', 'b')) -> dict:
+        """
+        Misst Strom und Spannung mehrerer Kanäle mit einem einzigen TSP-Befehl.
+
+        Die Messungen laufen direkt nacheinander auf dem Gerät, zurück kommt eine
+        Zeile mit dem Gerätezeitstempel (`timer.measure.t()`) und allen Werten.
+
+        Returns:
+            dict: {'timestamp': float, 'a': (Strom, Spannung), 'b': (Strom, Spannung)}
+        """
+        channels = tuple(channels)
+        measure_time = sum(self.estimate_measure_time(ch) for ch in channels)
+        with self._timeout_at_least(self.timeout + 2 * measure_time):
+            response = self.query(self._measure_multi_command(channels))
+        try:
+            return self._parse_measure_multi(response, channels)
+        except ValueError:
+            self.log_mgr.error(f"Invalid response from SMU during multi-channel measurement: '{response}'")
+            self.register_cache.invalidate()
+            raise
+
+    @_locked
+    def set_and_measure_settled(self, channel: str, level: float, source_func: str = 'V',
+                                tol: float = 1e-3, abs_tol: float | None = None,
+                                window: int = 3, max_wait: float = 1.0) -> dict:
+        """
+        Setzt das Source-Level und misst auf dem Gerät, bis der Messwert eingeschwungen ist.
+
+        Die Schleife läuft als TSP-Funktion (`modulab_settle`) direkt auf dem
+        Gerät, es gibt nur einen Roundtrip pro Punkt. Wie schnell gemessen
+        wird, bestimmt die eingestellte NPLC.
+
+        Args:
+            source_func (str): 'V' (es wird der Strom beobachtet) oder 'I' (die Spannung).
+            tol (float): Relative Toleranz der letzten `window` Werte.
+            abs_tol (float, optional): Absolute Toleranz (für Werte nahe 0).
+                                       None = 1 nA bzw. 10 uV.
+            window (int): Anzahl aufeinanderfolgender Werte, die übereinstimmen müssen.
+            max_wait (float): Maximale Wartezeit in Sekunden.
+
+        Returns:
+            dict: {'current', 'voltage', 'settle_time' [s], 'settled' (bool)}
+        """
+        func = self._sweep_func(source_func)
+        if abs_tol is None:
+            abs_tol = 1e-9 if source_func == 'V' else 1e-5
+        if self.SETTLE_SCRIPT_NAME not in self._loaded_scripts:
+            self.load_script(self.SETTLE_SCRIPT_NAME, self.SETTLE_SCRIPT)
+            self.send_command(f"{self.SETTLE_SCRIPT_NAME}.run()")
+            self._loaded_scripts.add(self.SETTLE_SCRIPT_NAME)
+
+        with self._timeout_at_least(self.timeout + max_wait + 2 * self.estimate_measure_time(channel)):
+            response = self.query(f"print(modulab_settle(smu{channel}, {1 if func == 'v' else 0}, {level}, "
+                                  f"{tol}, {abs_tol}, {int(window)}, {max_wait}))")
+        self.register_cache.store(f"smu{channel}.source.level{func} = {level}")
+
+        try:
+            current, voltage, settle_time, settled = (float(part) for part in response.split('\t'))
+        except (ValueError, TypeError):
+            self.log_mgr.error(f"Invalid response from SMU during settle measurement: '{response}'")
+            self.register_cache.invalidate()
+            raise ValueError(f"Invalid SMU response: '{response}'")
+        return {'current': current, 'voltage': voltage, 'settle_time': settle_time, 'settled': settled == 1}
+
+    # --- TSP-Befehle bauen und Antworten parsen (auch von AsyncKeithley2602 genutzt) ---
+
+    @staticmethod
+    def _parse_iv(response: str) -> tuple[float, float]:
+        """ Parst die Antwort von `print(smuX.measure.iv())` zu (Strom, Spannung). """
         try:
             parts = response.split('\t')
             return float(parts[0]), float(parts[1])
-        except (ValueError, IndexError, TypeError):
-            self.log_mgr.error(f"Invalid response from SMU during measurement: '{response}'")
+        except (ValueError, IndexError, TypeError, AttributeError):
             raise ValueError(f"Invalid SMU response: '{response}'")
 
+    @staticmethod
+    def _measure_multi_command(channels: tuple) -> str:
+        """ TSP-Zeile für eine gemeinsame Messung mehrerer Kanäle inkl. Zeitstempel. """
+        # Mehrfach-Rückgaben von measure.iv() werden in Lua nur am Listenende expandiert,
+        # daher zuerst in lokale Variablen schreiben.
+        statements = ["local t = timer.measure.t()"]
+        statements += [f"local i{ch}, v{ch} = smu{ch}.measure.iv()" for ch in channels]
+        values = ", ".join(f"i{ch}, v{ch}" for ch in channels)
+        return " ".join(statements) + f" print(t, {values})"
+
+    @staticmethod
+    def _parse_measure_multi(response: str, channels: tuple) -> dict:
+        """ Parst die Antwort von `_measure_multi_command`. """
+        try:
+            parts = [float(part) for part in response.split('\t')]
+            if len(parts) != 1 + 2 * len(channels):
+                raise ValueError
+        except (ValueError, TypeError, AttributeError):
+            raise ValueError(f"Invalid SMU response: '{response}'")
+
+        result = {'timestamp': parts[0]}
+        for index, ch in enumerate(channels):
+            result[ch] = (parts[1 + 2 * index], parts[2 + 2 * index])
+        return result
+
+    # --- Sweeps (Trigger-Modell auf dem Gerät) ---
+
+    @_locked
+    def load_script(self, name: str, lines: list[str]):
+        """
+        Lädt ein TSP-Skript (loadscript/endscript) in einem Schreibvorgang auf das Gerät.
+
+        Ein bereits vorhandenes Skript mit gleichem Namen wird überschrieben.
+        """
+        if not self.is_open:
+            raise ConnectionError("No Connection to SMU-Device.")
+        self._flush_batch()
+        script = "\n".join([f"loadscript {name}", *lines, "endscript"]) + "\n"
+        self._transport.write(script.encode('ascii'))
+        if self.log_io:
+            self.log_mgr.debug(f"[SMU_TX] loadscript {name} ({len(lines)} lines)")
+
+    def sweep_linear(self, channel: str, start: float, stop: float, points: int,
+                     source_func: str = 'V', limit: float | None = None,
+                     settle_delay: float | None = None, output_off: bool = True) -> dict:
+        """Führt einen linearen Sweep von `start` bis `stop` auf dem Gerät aus."""
+        source_cmd, points = self._sweep_source_command(channel, 'linear', source_func, start, stop, points)
+        return self._run_sweep(channel, source_cmd, points, source_func, limit, settle_delay, output_off)
+
+    def sweep_log(self, channel: str, start: float, stop: float, points: int,
+                  source_func: str = 'V', limit: float | None = None,
+                  settle_delay: float | None = None, output_off: bool = True) -> dict:
+        """Führt einen logarithmischen Sweep von `start` bis `stop` auf dem Gerät aus."""
+        source_cmd, points = self._sweep_source_command(channel, 'log', source_func, start, stop, points)
+        return self._run_sweep(channel, source_cmd, points, source_func, limit, settle_delay, output_off)
+
+    def sweep_list(self, channel: str, levels, source_func: str = 'V', limit: float | None = None,
+                   settle_delay: float | None = None, output_off: bool = True) -> dict:
+        """Führt einen Sweep über eine beliebige Liste von Source-Levels auf dem Gerät aus."""
+        source_cmd, points = self._sweep_source_command(channel, 'list', source_func, levels)
+        return self._run_sweep(channel, source_cmd, points, source_func, limit, settle_delay, output_off)
+
+    @staticmethod
+    def _sweep_func(source_func: str) -> str:
+        """Übersetzt 'V'/'I' in das TSP-Suffix der Trigger-Source-Funktionen."""
+        if source_func not in ('V', 'I'):
+            raise ValueError(f"Invalid source function '{source_func}' (expected 'V' or 'I').")
+        return 'v' if source_func == 'V' else 'i'
+
+    @staticmethod
+    def _sweep_source_command(channel: str, kind: str, source_func: str, *args) -> tuple[str, int]:
+        """
+        Baut den Trigger-Source-Befehl eines Sweeps.
+
+        Args:
+            kind (str): 'linear' / 'log' (args: start, stop, points) oder 'list' (args: levels).
+
+        Returns:
+            tuple[str, int]: (TSP-Befehl, Anzahl der Punkte)
+        """
+        func = Keithley2602._sweep_func(source_func)
+        if kind == 'list':
+            levels = [float(level) for level in args[0]]
+            if not levels:
+                raise ValueError("List sweep requires at least one level.")
+            # 15 signifikante Stellen (weit unter der Quellauflösung), ohne Leerzeichen:
+            # spart Bytes pro Sweep-Punkt gegenüber repr()
+            values = ",".join(f"{level:.15g}" for level in levels)
+            return f"smu{channel}.trigger.source.list{func}({{{values}}})", len(levels)
+
+        start, stop, points = args
+        if kind == 'log':
+            if start == 0 or stop == 0 or (start > 0) != (stop > 0):
+                raise ValueError("Log sweep requires start and stop with the same sign and non-zero.")
+            return f"smu{channel}.trigger.source.log{func}({start}, {stop}, {int(points)}, 0)", int(points)
+        return f"smu{channel}.trigger.source.linear{func}({start}, {stop}, {int(points)})", int(points)
+
+    @staticmethod
+    def _sweep_script(channel: str, source_cmd: str, points: int, source_func: str,
+                      limit: float | None, settle_delay: float | None, output_off: bool) -> list[str]:
+        """
+        Baut das Sweep-Skript für das Trigger-Modell.
+
+        Strom landet in `nvbuffer1` (inkl. Source-Werten und Zeitstempeln),
+        Spannung in `nvbuffer2`. Messverzögerung und Trigger-Modell werden am
+        Ende wiederhergestellt, spätere Einzelmessungen laufen also wie vorher.
+        """
+        if points < 1:
+            raise ValueError("Sweep requires at least one point.")
+        smu = f"smu{channel}"
+        limit_func = 'i' if source_func == 'V' else 'v'
+        lines = [
+            f"local ml_delay = {smu}.measure.delay",
+            f"{smu}.nvbuffer1.clear()",
+            f"{smu}.nvbuffer2.clear()",
+            f"{smu}.nvbuffer1.collectsourcevalues = 1",
+            f"{smu}.nvbuffer1.collecttimestamps = 1",
+            f"{smu}.source.func = {smu}.OUTPUT_DC{'VOLTS' if source_func == 'V' else 'AMPS'}",
+            source_cmd,
+        ]
+        if limit is not None:
+            lines.append(f"{smu}.trigger.source.limit{limit_func} = {limit}")
+        # Ohne settle_delay gilt die eingestellte Messverzögerung (siehe set_measure_delay)
+        if settle_delay is not None:
+            lines.append(f"{smu}.measure.delay = {settle_delay}")
+        lines += [
+            f"{smu}.trigger.measure.action = {smu}.ENABLE",
+            f"{smu}.trigger.measure.iv({smu}.nvbuffer1, {smu}.nvbuffer2)",
+            f"{smu}.trigger.endpulse.action = {smu}.SOURCE_HOLD",
+            f"{smu}.trigger.count = {points}",
+            f"{smu}.trigger.source.action = {smu}.ENABLE",
+            f"{smu}.source.output = {smu}.OUTPUT_ON",
+            f"{smu}.trigger.initiate()",
+            "waitcomplete()",
+            f"{smu}.measure.delay = ml_delay",
+            *Keithley2602._trigger_restore_lines(channel),
+        ]
+        if limit is not None:
+            lines.append(f"{smu}.trigger.source.limit{limit_func} = {smu}.LIMIT_AUTO")
+        if output_off:
+            lines.append(f"{smu}.source.output = {smu}.OUTPUT_OFF")
+        return lines
+
+    @staticmethod
+    def _trigger_restore_lines(channel: str) -> list[str]:
+        """ Setzt das Trigger-Modell eines Kanals nach einem Skript auf die Werkseinstellungen zurück. """
+        smu = f"smu{channel}"
+        return [
+            f"{smu}.trigger.source.action = {smu}.DISABLE",
+            f"{smu}.trigger.measure.action = {smu}.DISABLE",
+            f"{smu}.trigger.count = 1",
+        ]
+
+    @staticmethod
+    def _sweep_columns(channel: str) -> dict[str, str]:
+        """ Pufferspalten, die nach einem Sweep gelesen werden. """
+        smu = f"smu{channel}"
+        return {
+            'current': f"{smu}.nvbuffer1.readings",
+            'voltage': f"{smu}.nvbuffer2.readings",
+            'source': f"{smu}.nvbuffer1.sourcevalues",
+            'timestamp': f"{smu}.nvbuffer1.timestamps",
+        }
+
+    @staticmethod
+    def _sweep_timeout(points: int, point_time: float = 0.0) -> float:
+        """ Großzügiger Lese-Timeout für einen Sweep mit `points` Punkten. """
+        return 2 + points * max(0.1, 2 * point_time)
+
+    @_locked
+    def _run_sweep(self, channel: str, source_cmd: str, points: int, source_func: str,
+                   limit: float | None, settle_delay: float | None, output_off: bool) -> dict:
+        """ Lädt das Sweep-Skript, startet es und liest alle Puffer in einem Rutsch aus. """
+        lines = self._sweep_script(channel, source_cmd, points, source_func, limit, settle_delay, output_off)
+        # Das Skript setzt Source-Funktion, Level und Ausgang am Cache vorbei (das Delay stellt es selbst wieder her)
+        self.register_cache.invalidate(channel)
+        self.load_script(self.SWEEP_SCRIPT_NAME, lines)
+        self.send_command(f"{self.SWEEP_SCRIPT_NAME}.run()")
+
+        # Das Gerät arbeitet die Befehle der Reihe nach ab: printbuffer antwortet erst nach dem Sweep.
+        return self.read_buffers(self._sweep_columns(channel), count=points,
+                                 timeout=self._sweep_timeout(points, self.estimate_measure_time(channel)))
+
+    # --- Zeitgesteuerte Aufnahme (Trigger-Timer) ---
+
+    @_locked
+    def acquire_timed(self, channel: str, interval: float, count: int, source_level: float | None = None,
+                      source_func: str = 'V', limit: float | None = None, output_off: bool = True) -> dict:
+        """
+        Nimmt `count` Messpunkte im festen Abstand `interval` auf, getaktet von `trigger.timer[1]`.
+
+        Der Ausgang wird direkt vor dem Start eingeschaltet, der erste Punkt
+        liegt also am Anfang des Einschaltvorgangs. Die Werte werden auf dem
+        Gerät gepuffert und am Ende in einem Rutsch gelesen.
+
+        Returns:
+            dict: numpy-Arrays 'current', 'voltage', 'source' und 'timestamp' (Gerätezeit in s).
+        """
+        measure_time = self.estimate_measure_time(channel)
+        if measure_time > interval:
+            self.log_mgr.warning(f"SMU measurement on {channel} takes ~{measure_time * 1e3:.3f} ms, "
+                                 f"longer than the interval of {interval * 1e3:.3f} ms.")
+        lines = self._timed_script(channel, interval, count, source_func, source_level, limit, output_off)
+        # Das Skript setzt Source-Funktion, Level und Ausgang am Cache vorbei
+        self.register_cache.invalidate(channel)
+        self.load_script(self.TIMED_SCRIPT_NAME, lines)
+        self.send_command(f"{self.TIMED_SCRIPT_NAME}.run()")
+        return self.read_buffers(self._sweep_columns(channel), count=count,
+                                 timeout=2 + 2 * count * max(interval, measure_time))
+
+    @staticmethod
+    def _timed_script(channel: str, interval: float, count: int, source_func: str,
+                      source_level: float | None, limit: float | None, output_off: bool) -> list[str]:
+        """
+        Baut das Skript für `acquire_timed`.
+
+        Der Timer gibt den Takt für das Source-Event vor (Source-Aktion aus,
+        das Level bleibt konstant), jede Messung folgt direkt darauf. Am Ende
+        werden die Stimuli und das Trigger-Modell zurückgesetzt, damit
+        spätere Sweeps nicht auf den Timer warten.
+        """
+        if count < 1:
+            raise ValueError("Timed acquisition requires at least one point.")
+        if interval <= 0:
+            raise ValueError(f"Invalid sample interval {interval}.")
+        func = Keithley2602._sweep_func(source_func)
+        smu = f"smu{channel}"
+        lines = [
+            f"{smu}.nvbuffer1.clear()",
+            f"{smu}.nvbuffer2.clear()",
+            f"{smu}.nvbuffer1.collectsourcevalues = 1",
+            f"{smu}.nvbuffer1.collecttimestamps = 1",
+            f"{smu}.source.func = {smu}.OUTPUT_DC{'VOLTS' if source_func == 'V' else 'AMPS'}",
+        ]
+        if limit is not None:
+            lines.append(f"{smu}.source.limit{'i' if source_func == 'V' else 'v'} = {limit}")
+        if source_level is not None:
+            lines.append(f"{smu}.source.level{func} = {source_level}")
+        lines += [
+            "trigger.timer[1].reset()",
+            f"trigger.timer[1].delay = {interval}",
+            f"trigger.timer[1].count = {max(count - 1, 1)}",
+            "trigger.timer[1].passthrough = true",
+            f"trigger.timer[1].stimulus = {smu}.trigger.ARMED_EVENT_ID",
+            f"{smu}.trigger.source.action = {smu}.DISABLE",
+            f"{smu}.trigger.source.stimulus = trigger.timer[1].EVENT_ID",
+            f"{smu}.trigger.measure.action = {smu}.ENABLE",
+            f"{smu}.trigger.measure.iv({smu}.nvbuffer1, {smu}.nvbuffer2)",
+            f"{smu}.trigger.endpulse.action = {smu}.SOURCE_HOLD",
+            f"{smu}.trigger.count = {count}",
+            f"{smu}.source.output = {smu}.OUTPUT_ON",
+            f"{smu}.trigger.initiate()",
+            "waitcomplete()",
+            f"{smu}.trigger.source.stimulus = 0",
+            *Keithley2602._trigger_restore_lines(channel),
+        ]
+        if output_off:
+            lines.append(f"{smu}.source.output = {smu}.OUTPUT_OFF")
+        return lines
+
+    # --- Binärer Puffer-Transfer ---
+
+    def read_buffer(self, channel: str, buffer: str = "nvbuffer1", count: int | None = None) -> dict:
+        """
+        Liest Messwerte, Source-Werte und Zeitstempel eines Gerätepuffers binär aus.
+
+        Source-Werte und Zeitstempel sind nur gefüllt, wenn sie beim Messen
+        gesammelt wurden (`collectsourcevalues`/`collecttimestamps`).
+        """
+        prefix = f"smu{channel}.{buffer}"
+        return self.read_buffers({
+            'readings': f"{prefix}.readings",
+            'source': f"{prefix}.sourcevalues",
+            'timestamp': f"{prefix}.timestamps",
+        }, count=count)
+
+    @_locked
+    def read_buffers(self, columns: dict[str, str], count: int | None = None,
+                     timeout: float | None = None) -> dict[str, np.ndarray]:
+        """
+        Überträgt eine oder mehrere Puffer-Spalten im REAL64-Format in einem Block.
+
+        `printbuffer` schreibt die Werte der Spalten verschränkt (Punkt für Punkt),
+        die Rohdaten werden mit `numpy.frombuffer` ohne Textparsing dekodiert.
+
+        Args:
+            columns (dict[str, str]): Name im Ergebnis -> TSP-Ausdruck der Pufferspalte
+                                      (z.B. {'current': 'smua.nvbuffer1.readings'}).
+            count (int, optional): Anzahl der Punkte. None = Füllstand des ersten Puffers.
+            timeout (float, optional): Lese-Timeout in Sekunden für diese Übertragung.
+
+        Returns:
+            dict[str, np.ndarray]: Ein float64-Array pro Spalte.
+        """
+        if not self.is_open:
+            raise ConnectionError("No Connection to SMU-Device.")
+        names = list(columns)
+        exprs = list(columns.values())
+
+        old_timeout = self._transport.timeout
+        if timeout is not None:
+            self._transport.timeout = max(old_timeout or 0, timeout)
+        try:
+            if count is None:
+                first_buffer = exprs[0].rsplit('.', 1)[0]
+                response = self.query(f"print({first_buffer}.n)")
+                try:
+                    count = int(float(response))
+                except ValueError:
+                    raise ValueError(f"Invalid SMU buffer size response: '{response}'")
+            if count <= 0:
+                return {name: np.empty(0, dtype=np.float64) for name in names}
+
+            self._flush_batch()
+            self._write(self._printbuffer_command(count, exprs))
+
+            # Antwortformat: '#0' + Rohdaten + Zeilenende
+            header = self._read_exact(2)
+            if header != b"#0":
+                raise ValueError(f"Invalid binary header from SMU: {header!r}")
+            payload = self._read_exact(count * len(names) * 8)
+            self._transport.readline()
+        finally:
+            self._transport.timeout = old_timeout
+
+        if self.log_io:
+            self.log_mgr.debug(f"[SMU_RX] <{len(payload)} bytes REAL64, {count} x {len(names)}>")
+        return self._decode_real64(payload, count, names)
+
+    @staticmethod
+    def _printbuffer_command(count: int, exprs: list[str]) -> str:
+        """ `printbuffer` im REAL64-Format, danach zurück auf ASCII. """
+        return ("format.data = format.REAL64 format.byteorder = format.LITTLEENDIAN "
+                f"printbuffer(1, {count}, {', '.join(exprs)}) format.data = format.ASCII")
+
+    @staticmethod
+    def _decode_real64(payload: bytes, count: int, names: list[str]) -> dict[str, np.ndarray]:
+        """ Dekodiert verschränkte REAL64-Rohdaten zu einem Array pro Spalte. """
+        values = np.frombuffer(payload, dtype='<f8').reshape(count, len(names))
+        return {name: values[:, i].copy() for i, name in enumerate(names)}
+
+    def _read_exact(self, size: int) -> bytes:
+        """ Liest genau `size` Bytes oder wirft einen TimeoutError. """
+        data = bytearray()
+        while len(data) < size:
+            chunk = self._transport.read(size - len(data))
+            if not chunk:
+                raise TimeoutError(f"SMU binary transfer timed out ({len(data)} of {size} bytes).")
+            data += chunk
+        return bytes(data)
+
 # ==========================================================================================
 #  Dummy Treiber
 # ==========================================================================================
@@ -230,9 +1213,14 @@ class DummyKeithley2602:
         self._is_open = False
         self.idn_message = "DUMMY INC., MODEL 2602 (SIMULATED), 1.0, 1.0"
         self.simulated_resistance = 100.0 # 100 Ohm, wie gewünscht
+        self.simulated_measure_time = 0.001 # Sekunden pro Messung bei 1 NPLC, begrenzt die Streaming-Rate
+        self.simulated_time_constant = 0.002 # RC-Zeitkonstante des Einschaltvorgangs (acquire_timed)
+        self.log_io = True
         
         # Interner Zustand der simulierten Kanäle
         self._channel_states = {}
+        self._buffers = {}
+        self._t0 = time.monotonic() # Referenz für simulierte Gerätezeitstempel
         self.reset_channel('a')
         self.reset_channel('b')
 
@@ -257,8 +1245,33 @@ class DummyKeithley2602:
         self.log_mgr.debug(f"[DUMMY_TX] {command}")
         if command == "*IDN?":
             return self.idn_message
+        if command == "*OPC?":
+            return "1"
         return ""
 
+    @contextmanager
+    def batch(self):
+        yield self
+
+    def sync(self) -> bool:
+        return self._is_open
+
+    def get_cache_stats(self) -> dict:
+        # Der Dummy sendet nichts, es gibt also auch nichts zu sparen
+        return {'hits': 0, 'misses': 0, 'saved_bytes': 0, 'entries': 0}
+
+    def invalidate_cache(self, channel: str | None = None):
+        pass
+
+    def start_trace(self, recorder: TraceRecorder | None = None) -> TraceRecorder:
+        # Der Dummy hat keine Verbindung, der Trace bleibt leer
+        self.trace_recorder = recorder or TraceRecorder()
+        return self.trace_recorder
+
+    def stop_trace(self) -> TraceRecorder | None:
+        recorder, self.trace_recorder = getattr(self, 'trace_recorder', None), None
+        return recorder
+
     def reset_channel(self, channel: str):
         self.log_mgr.debug(f"[DUMMY] Resetting channel {channel}")
         self._channel_states[channel] = {
@@ -266,7 +1279,9 @@ class DummyKeithley2602:
             'level': 0.0,
             'v_limit': 20.0, # Standard 20V Limit
             'i_limit': 0.1,  # Standard 100mA Limit
-            'output': False # ON/OFF
+            'output': False, # ON/OFF
+            'nplc': 1.0,
+            'filter_count': 1,
         }
 
     def set_source_current(self, channel: str):
@@ -303,9 +1318,35 @@ class DummyKeithley2602:
         self._channel_states[channel]['output'] = False
         self.log_mgr.debug(f"[DUMMY] Channel {channel} output OFF")
 
+    def set_measure_nplc(self, channel: str, nplc: float):
+        if not 0.001 <= nplc <= 25:
+            raise ValueError(f"NPLC {nplc} out of range (0.001 ... 25).")
+        self._channel_states[channel]['nplc'] = nplc
+
+    def set_measure_autozero(self, channel: str, mode: str):
+        if mode not in Keithley2602.AUTOZERO_MODES:
+            raise ValueError(f"Invalid autozero mode '{mode}'.")
+
+    def set_measure_delay(self, channel: str, delay):
+        if delay != 'auto' and delay < 0:
+            raise ValueError(f"Invalid measure delay {delay}.")
+
+    def set_measure_filter(self, channel: str, count: int):
+        if not 1 <= count <= 100:
+            raise ValueError(f"Filter count {count} out of range (1 ... 100).")
+        self._channel_states[channel]['filter_count'] = count
+
+    def set_display_enabled(self, enable: bool):
+        self.log_mgr.debug(f"[DUMMY] Display {'ON' if enable else 'OFF'}")
+
+    def estimate_measure_time(self, channel: str) -> float:
+        state = self._channel_states[channel]
+        return self.simulated_measure_time * state['nplc'] * state['filter_count']
+
     def measure_iv(self, channel: str) -> tuple[float, float]:
         if not self._is_open:
             raise ConnectionError("DUMMY SMU is not connected.")
+        time.sleep(self.estimate_measure_time(channel))
         
         state = self._channel_states[channel]
         
@@ -338,8 +1379,149 @@ class DummyKeithley2602:
                 voltage = state['v_limit'] * (1 if voltage > 0 else -1)
                 self.log_mgr.warning(f"[DUMMY] Channel {channel} voltage limit reached!")
 
-        self.log_mgr.debug(f"[DUMMY] Measured: C={current}, V={voltage}")
+        if self.log_io:
+            self.log_mgr.debug(f"[DUMMY] Measured: C={current}, V={voltage}")
         return current, voltage  
+
+    def set_level_and_measure(self, channel: str, level: float, source_func: str = 'V') -> tuple[float, float]:
+        self._channel_states[channel]['level'] = level
+        return self.measure_iv(channel)
+
+    def output_current(self, channel: str) -> float:
+        """ Aktueller Ausgangsstrom ohne Messzeit und Log (z.B. für das simulierte Spektrometer). """
+        state = self._channel_states[channel]
+        if not self._is_open or not state['output']:
+            return 0.0
+        if state['func'] == 'V':
+            current = state['level'] / self.simulated_resistance
+            return float(np.clip(current, -abs(state['i_limit']), abs(state['i_limit'])))
+        v_max = abs(state['v_limit']) / self.simulated_resistance
+        return float(np.clip(state['level'], -v_max, v_max))
+
+    def measure_iv_multi(self, channels=('a', 'b')) -> dict:
+        result = {'timestamp': time.monotonic() - self._t0}
+        for ch in channels:
+            result[ch] = self.measure_iv(ch)
+        return result
+
+    def set_and_measure_settled(self, channel: str, level: float, source_func: str = 'V',
+                                tol: float = 1e-3, abs_tol: float | None = None,
+                                window: int = 3, max_wait: float = 1.0) -> dict:
+        # Gleiches Kriterium wie Keithley2602.SETTLE_SCRIPT, nur als Python-Schleife
+        if abs_tol is None:
+            abs_tol = 1e-9 if source_func == 'V' else 1e-5
+        self._channel_states[channel]['level'] = level
+        values = []
+        t0 = time.perf_counter()
+        while True:
+            current, voltage = self.measure_iv(channel)
+            values = (values + [current if source_func == 'V' else voltage])[-window:]
+            elapsed = time.perf_counter() - t0
+            settled = (len(values) == window and
+                       max(values) - min(values) <= tol * abs(sum(values) / window) + abs_tol)
+            if settled or elapsed >= max_wait:
+                return {'current': current, 'voltage': voltage, 'settle_time': elapsed, 'settled': settled}
+
+    def sweep_linear(self, channel: str, start: float, stop: float, points: int,
+                     source_func: str = 'V', limit: float | None = None,
+                     settle_delay: float | None = None, output_off: bool = True) -> dict:
+        return self.sweep_list(channel, np.linspace(start, stop, int(points)), source_func, limit, settle_delay, output_off)
+
+    def sweep_log(self, channel: str, start: float, stop: float, points: int,
+                  source_func: str = 'V', limit: float | None = None,
+                  settle_delay: float | None = None, output_off: bool = True) -> dict:
+        if start == 0 or stop == 0 or (start > 0) != (stop > 0):
+            raise ValueError("Log sweep requires start and stop with the same sign and non-zero.")
+        levels = np.sign(start) * np.geomspace(abs(start), abs(stop), int(points))
+        return self.sweep_list(channel, levels, source_func, limit, settle_delay, output_off)
+
+    def sweep_list(self, channel: str, levels, source_func: str = 'V', limit: float | None = None,
+                   settle_delay: float | None = None, output_off: bool = True) -> dict:
+        if not self._is_open:
+            raise ConnectionError("DUMMY SMU is not connected.")
+        if source_func not in ('V', 'I'):
+            raise ValueError(f"Invalid source function '{source_func}' (expected 'V' or 'I').")
+        levels = np.asarray(levels, dtype=np.float64)
+        if levels.size == 0:
+            raise ValueError("List sweep requires at least one level.")
+
+        state = self._channel_states[channel]
+        state['func'] = source_func
+        if limit is not None:
+            state['i_limit' if source_func == 'V' else 'v_limit'] = limit
+
+        # Vektorisierte Simulation des 100 Ohm Widerstands inkl. Compliance
+        if source_func == 'V':
+            voltage = levels.copy()
+            current = np.clip(voltage / self.simulated_resistance, -abs(state['i_limit']), abs(state['i_limit']))
+        else:
+            current = levels.copy()
+            voltage = np.clip(current * self.simulated_resistance, -abs(state['v_limit']), abs(state['v_limit']))
+
+        delay = 0.001 if settle_delay is None else settle_delay
+        timestamps = np.arange(levels.size, dtype=np.float64) * (delay + 0.001)
+
+        state['level'] = float(levels[-1])
+        state['output'] = not output_off
+        self._buffers[channel] = {
+            'nvbuffer1': {'readings': current, 'source': levels, 'timestamp': timestamps},
+            'nvbuffer2': {'readings': voltage, 'source': levels, 'timestamp': timestamps},
+        }
+        self.log_mgr.debug(f"[DUMMY] Sweep on channel {channel}: {levels.size} points")
+        return {
+            'current': current.copy(),
+            'voltage': voltage.copy(),
+            'source': levels.copy(),
+            'timestamp': timestamps.copy(),
+        }
+
+    def acquire_timed(self, channel: str, interval: float, count: int, source_level: float | None = None,
+                      source_func: str = 'V', limit: float | None = None, output_off: bool = True) -> dict:
+        if not self._is_open:
+            raise ConnectionError("DUMMY SMU is not connected.")
+        if count < 1:
+            raise ValueError("Timed acquisition requires at least one point.")
+        if interval <= 0:
+            raise ValueError(f"Invalid sample interval {interval}.")
+        if source_func not in ('V', 'I'):
+            raise ValueError(f"Invalid source function '{source_func}' (expected 'V' or 'I').")
+
+        state = self._channel_states[channel]
+        state['func'] = source_func
+        if limit is not None:
+            state['i_limit' if source_func == 'V' else 'v_limit'] = limit
+        if source_level is not None:
+            state['level'] = source_level
+        level = state['level']
+
+        # Einschaltvorgang: 100 Ohm parallel zu einer Kapazität, Ladestrom klingt mit tau ab
+        timestamps = np.arange(count, dtype=np.float64) * max(interval, self.estimate_measure_time(channel))
+        decay = np.exp(-timestamps / self.simulated_time_constant)
+        if source_func == 'V':
+            voltage = np.full(count, level)
+            current = np.clip(level / self.simulated_resistance * (1 + 4 * decay),
+                              -abs(state['i_limit']), abs(state['i_limit']))
+        else:
+            current = np.full(count, level)
+            voltage = np.clip(level * self.simulated_resistance * (1 - decay),
+                              -abs(state['v_limit']), abs(state['v_limit']))
+        source = np.full(count, level)
+
+        state['output'] = not output_off
+        self._buffers[channel] = {
+            'nvbuffer1': {'readings': current, 'source': source, 'timestamp': timestamps},
+            'nvbuffer2': {'readings': voltage, 'source': source, 'timestamp': timestamps},
+        }
+        self.log_mgr.debug(f"[DUMMY] Timed acquisition on channel {channel}: {count} points every {interval} s")
+        return {'current': current.copy(), 'voltage': voltage.copy(),
+                'source': source.copy(), 'timestamp': timestamps.copy()}
+
+    def read_buffer(self, channel: str, buffer: str = "nvbuffer1", count: int | None = None) -> dict:
+        if not self._is_open:
+            raise ConnectionError("DUMMY SMU is not connected.")
+        empty = np.empty(0, dtype=np.float64)
+        data = self._buffers.get(channel, {}).get(buffer, {'readings': empty, 'source': empty, 'timestamp': empty})
+        return {name: values[:count].copy() for name, values in data.items()}
 # ==========================================================================================
 #  Main zum Testen des Treibers
 # ==========================================================================================
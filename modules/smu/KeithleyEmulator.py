@@ -0,0 +1,818 @@
+# modules/smu/KeithleyEmulator.py
+"""
+================================================================================
+Keithley 2602 Emulator (TSP-Teilmenge)
+================================================================================
+
+Emuliert das Protokoll einer Keithley 2602 auf Textebene, so dass der echte
+`Keithley2602`-Treiber (inkl. Transport, Framing und Parsing) ohne Gerät
+getestet und gebenchmarkt werden kann. Im Gegensatz zu `DummyKeithley2602`,
+das nur die Python-API nachbildet, läuft hier jede Zeile über eine echte
+Verbindung: wahlweise ein lokaler TCP-Socket (`KeithleyTcpEmulator`) oder ein
+Pseudo-Terminal, das sich wie ein serieller Port verhält (`KeithleyPtyEmulator`,
+nur Linux/macOS).
+
+Damit die Zahlen etwas über reale Messläufe aussagen, lassen sich Laufzeit
+und Messwerte modellieren:
+    LatencyModel  - Verarbeitungszeit pro Befehl, NPLC-abhängige Messdauer
+                    und Baudraten-Drosselung (10 Bit pro Byte)
+    NoiseModel    - Gaußsches Rauschen auf Strom und Spannung (skaliert mit 1/sqrt(NPLC))
+
+Unterstützt wird die TSP-Teilmenge, die `Keithley2602` verwendet:
+    *IDN?, *OPC?, *RST, reset(), smuX.reset(), Register-Zuweisungen
+    (smuX.source.*, smuX.measure.*, smuX.sense, smuX.trigger.*, smuX.nvbufferY.*),
+    print(...) von Messungen, lokalen Variablen und Pufferständen,
+    printbuffer(...) in ASCII und REAL64, Trigger-Modell-Sweeps sowie
+    loadscript/endscript mit name.run().
+
+Simuliert wird ein ohmscher Widerstand (Standard 100 Ohm) inkl. Compliance.
+
+Stubs (kein Lua-Interpreter):
+    Einzeilige Funktionen (z.B. die ModulabLib) werden beim Aufruf textuell
+    eingesetzt und laufen damit wirklich durch den Emulator. Mehrzeilige
+    Funktionen mit Schleifen nicht: Ihr Rumpf wird beim `name.run()` nicht
+    ausgeführt, sondern nur der Name registriert. Aufrufe davon beantwortet
+    eine Python-Nachbildung aus `NATIVE_FUNCTIONS`, derzeit nur
+    `modulab_settle` (siehe `Keithley2602.SETTLE_SCRIPT`). Getestet werden
+    damit Laden, Aufruf und Antwortformat, nicht der TSP-Quelltext selbst.
+    Unbekannte mehrzeilige Funktionen und Aufrufe nicht geladener
+    Funktionen landen in `errors`.
+"""
+
+import os
+import re
+import select
+import socket
+import threading
+import time
+
+import numpy as np
+
+# Pseudo-Terminals gibt es nur auf POSIX-Systemen
+try:
+    import tty
+except ImportError:
+    tty = None
+
+
+# ==========================================================================================
+# Modelle für Laufzeit und Messwerte
+# ==========================================================================================
+
+class LatencyModel:
+    """
+    Modelliert die Zeit, die ein echtes Gerät für Befehle und Übertragung braucht.
+
+    Args:
+        command_latency (float): Grund-Verarbeitungszeit pro TSP-Statement in Sekunden.
+        per_command (dict, optional): Abweichende Zeiten pro Statement-Art, z.B.
+                                      {'idn': 0.002, 'printbuffer': 0.01}. Die
+                                      Namen entsprechen den `_cmd_*`-Handlern
+                                      von `TspEmulator` ohne Präfix.
+        baudrate (int, optional): Simulierte Baudrate. None = keine Drosselung.
+        measure_timing (bool): Messungen dauern NPLC / Netzfrequenz + Delay.
+
+    Examples:
+        Eine Keithley 2602 an RS232 mit 115200 Baud nachbilden:
+
+        .. code-block:: python
+
+            latency = LatencyModel(command_latency=200e-6, baudrate=115200)
+            server = KeithleyPtyEmulator(latency=latency)
+    """
+
+    def __init__(self, command_latency: float = 0.0, per_command: dict | None = None,
+                 baudrate: int | None = None, measure_timing: bool = True):
+        self.command_latency = command_latency
+        self.per_command = dict(per_command or {})
+        self.baudrate = baudrate
+        self.measure_timing = measure_timing
+
+    def command_delay(self, command: str) -> float:
+        """ Verarbeitungszeit eines Statements in Sekunden. """
+        return self.per_command.get(command, self.command_latency)
+
+    def transfer_delay(self, num_bytes: int) -> float:
+        """ Übertragungszeit für `num_bytes` bei der eingestellten Baudrate (8N1). """
+        if not self.baudrate:
+            return 0.0
+        return num_bytes * 10.0 / self.baudrate
+
+
+class NoiseModel:
+    """
+    Gaußsches Messrauschen für den simulierten Widerstand.
+
+    Die Standardabweichung ist `absolut + relativ * |Wert|` und wird mit
+    1/sqrt(NPLC) skaliert, wie beim echten Gerät längere Integration das
+    Rauschen verringert.
+
+    Args:
+        current_noise (float): Absolutes Stromrauschen in A (bei NPLC = 1).
+        voltage_noise (float): Absolutes Spannungsrauschen in V (bei NPLC = 1).
+        relative (float): Relativer Anteil (z.B. 1e-4 = 100 ppm).
+        seed (int, optional): Startwert des Zufallsgenerators für reproduzierbare Läufe.
+    """
+
+    def __init__(self, current_noise: float = 0.0, voltage_noise: float = 0.0,
+                 relative: float = 0.0, seed: int | None = None):
+        self.current_noise = current_noise
+        self.voltage_noise = voltage_noise
+        self.relative = relative
+        self._rng = np.random.default_rng(seed)
+
+    def apply(self, current: float, voltage: float, nplc: float = 1.0) -> tuple[float, float]:
+        """ Gibt (Strom, Spannung) mit überlagertem Rauschen zurück. """
+        scale = 1.0 / np.sqrt(max(nplc, 1e-3))
+        sigma_i = (self.current_noise + self.relative * abs(current)) * scale
+        sigma_v = (self.voltage_noise + self.relative * abs(voltage)) * scale
+        noise_i, noise_v = self._rng.standard_normal(2)
+        return current + sigma_i * noise_i, voltage + sigma_v * noise_v
+
+
+# ==========================================================================================
+# Protokoll-Kern
+# ==========================================================================================
+
+class _EmulatedChannel:
+    """ Zustand eines emulierten SMU-Kanals (Register + Messpuffer). """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.registers = {
+            'source.func': 'OUTPUT_DCVOLTS',
+            'source.levelv': 0.0,
+            'source.leveli': 0.0,
+            'source.limitv': 20.0,
+            'source.limiti': 0.1,
+            'source.output': 'OUTPUT_OFF',
+            'sense': 'SENSE_LOCAL',
+            'measure.nplc': 1.0,
+            'measure.delay': 'DELAY_AUTO',
+            'measure.autozero': 'AUTOZERO_AUTO',
+            'measure.filter.enable': 'FILTER_OFF',
+            'measure.filter.count': 1,
+            'measure.filter.type': 'FILTER_REPEAT_AVG',
+            'trigger.count': 1,
+            'trigger.source.action': 'DISABLE',
+            'trigger.measure.action': 'DISABLE',
+        }
+        self.sweep_levels = np.zeros(1)
+        self.sweep_func = 'v'
+        self.measure_targets = {}
+        self.stimulus = {'source': None, 'measure': None}
+        self.buffers = {1: self._empty_buffer(), 2: self._empty_buffer()}
+
+    @staticmethod
+    def _empty_buffer() -> dict:
+        return {'readings': [], 'sourcevalues': [], 'timestamps': []}
+
+
+class TspEmulator:
+    """
+    Interpretiert TSP-Zeilen und erzeugt die Antworten eines Keithley 2602.
+
+    Die Klasse ist unabhängig vom Transport: `handle_line()` bekommt eine
+    empfangene Zeile (ohne '\\n') und liefert die zu sendenden Bytes zurück.
+    `process()` liefert zusätzlich die modellierte Bearbeitungszeit.
+
+    Args:
+        resistance (float): Simulierter Lastwiderstand in Ohm.
+        idn (str): Antwort auf `*IDN?`.
+        latency (LatencyModel, optional): Laufzeitmodell. None = keine Verzögerung.
+        noise (NoiseModel, optional): Rauschmodell. None = ideale Messwerte.
+    """
+
+    DEFAULT_IDN = "KEITHLEY INSTRUMENTS INC.,MODEL 2602,EMULATED,1.0"
+    LINE_FREQUENCY = 50.0
+
+    NATIVE_FUNCTIONS = ('modulab_settle',)
+    """tuple[str, ...]: Mehrzeilige TSP-Funktionen, die als Python-Stub nachgebildet sind (siehe Modul-Docstring)."""
+
+    _NUMBER = r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?"
+
+    def __init__(self, resistance: float = 100.0, idn: str = DEFAULT_IDN,
+                 latency: LatencyModel | None = None, noise: NoiseModel | None = None):
+        self.resistance = resistance
+        self.idn = idn
+        self.latency = latency
+        self.noise = noise
+        self._busy_time = 0.0
+        self.channels = {'a': _EmulatedChannel(), 'b': _EmulatedChannel()}
+        self.data_format = 'ASCII'
+        self.display_screen = 'SMUA_SMUB'
+        self.timers = {}
+        self.globals = {}
+        self.functions = {}
+        self.native_functions = set()
+        self.byteorder = 'LITTLEENDIAN'
+        self.scripts = {}
+        self.errors = []
+        self._locals = {}
+        self._loading_script = None
+        self._t0 = time.monotonic()
+
+        # (Regex, Handler) - wird der Reihe nach an der aktuellen Position probiert
+        n = self._NUMBER
+        self._statements = [
+            (r"\*IDN\?", self._cmd_idn),
+            (r"\*OPC\?", self._cmd_opc),
+            (r"\*RST|reset\(\)", self._cmd_reset_all),
+            (r"waitcomplete\(\)|timer\.reset\(\)|\*CLS|display\.clear\(\)", self._cmd_noop),
+            (r"display\.screen\s*=\s*display\.(\w+)", self._cmd_display),
+            (r"smu([ab])\.reset\(\)", self._cmd_reset_channel),
+            (r"smu([ab])\.nvbuffer([12])\.clear\(\)", self._cmd_buffer_clear),
+            (r"smu([ab])\.trigger\.source\.(linear|log|list)([vi])\(([^)]*)\)", self._cmd_trigger_source),
+            (r"smu([ab])\.trigger\.measure\.(iv|i|v)\(([^)]*)\)", self._cmd_trigger_measure),
+            (r"smu([ab])\.trigger\.initiate\(\)", self._cmd_trigger_initiate),
+            (r"smu([ab])\.trigger\.(source|measure)\.stimulus\s*=\s*(?:trigger\.timer\[(\d)\]\.EVENT_ID|0)",
+             self._cmd_trigger_stimulus),
+            (r"trigger\.timer\[(\d)\]\.reset\(\)", self._cmd_timer_reset),
+            (r"trigger\.timer\[(\d)\]\.(\w+)\s*=\s*(true|false|smu[ab]\.trigger\.\w+|" + n + r")",
+             self._cmd_timer_assign),
+            (r"smu([ab])\.([\w.]+?)\s*=\s*(smu[ab]\.\w+|" + n + r"|[A-Za-z_]\w*)", self._cmd_assign),
+            (r"format\.(data|byteorder)\s*=\s*format\.(\w+)", self._cmd_format),
+            (r"format\.asciiprecision\s*=\s*\d+", self._cmd_noop),
+            (r"local\s+([\w\s,]+?)\s*=\s*(timer\.measure\.t\(\)|smu[ab]\.measure\.(?:iv|i|v)\(\)|smu[ab]\.[\w.]+)",
+             self._cmd_local),
+            (r"printbuffer\(\s*(\d+)\s*,\s*([\w.]+)\s*,([^)]*)\)", self._cmd_printbuffer),
+            (r"print\(smu([ab])\.measure\.(iv|i|v)\(\)\)", self._cmd_print_measure),
+            (r"print\(modulab_settle\(smu([ab]),([^)]*)\)\)", self._cmd_settle),
+            (r"print\(smu([ab])\.nvbuffer([12])\.n\)", self._cmd_print_buffer_size),
+            (r"print\(([\w\s,]*)\)", self._cmd_print_locals),
+            (r"(\w+)\.run\(\)", self._cmd_run_script),
+            (r"function\s+(\w+)\(([^)]*)\)\s+(.*)\s+end\s*$", self._cmd_define),
+            (r'(\w+)\s*=\s*"([^"]*)"', self._cmd_global),
+            (r"(\w+)\(([^()]*)\)", self._cmd_call),
+        ]
+        self._statements = [(re.compile(pattern), handler) for pattern, handler in self._statements]
+
+    # --- Öffentliche Schnittstelle ---
+
+    def process(self, line: str) -> tuple[bytes, float]:
+        """
+        Verarbeitet eine Zeile wie `handle_line` und liefert zusätzlich die Zeit,
+        die das Gerät laut `LatencyModel` dafür gebraucht hätte.
+
+        Returns:
+            tuple[bytes, float]: (Antwort, Bearbeitungszeit in Sekunden)
+        """
+        self._busy_time = 0.0
+        output = self.handle_line(line)
+        return output, self._busy_time
+
+    def handle_line(self, line: str) -> bytes:
+        """ Verarbeitet eine Zeile TSP (ggf. mehrere Statements) und liefert die Antwort. """
+        line = line.strip()
+        if self._loading_script is not None:
+            if line == "endscript":
+                self._loading_script = None
+            else:
+                self.scripts[self._loading_script].append(line)
+            return b""
+        if line.startswith("loadscript"):
+            name = line.split()[1]
+            self.scripts[name] = []
+            self._loading_script = name
+            return b""
+
+        output = bytearray()
+        position = 0
+        while position < len(line):
+            if line[position].isspace():
+                position += 1
+                continue
+            for pattern, handler in self._statements:
+                match = pattern.match(line, position)
+                if match:
+                    output += handler(*match.groups()) or b""
+                    if self.latency is not None:
+                        self._busy_time += self.latency.command_delay(handler.__name__[len('_cmd_'):])
+                    position = match.end()
+                    break
+            else:
+                self.errors.append(line[position:])
+                break
+        return bytes(output)
+
+    def measure(self, channel: str) -> tuple[float, float]:
+        """ Simuliert eine I/V-Messung am Widerstand inkl. Compliance. """
+        regs = self.channels[channel].registers
+        if self.latency is not None and self.latency.measure_timing:
+            self._busy_time += self.point_duration(channel)
+        if regs['source.output'] != 'OUTPUT_ON':
+            current, voltage = 0.0, 0.0
+        elif regs['source.func'] == 'OUTPUT_DCVOLTS':
+            voltage = float(regs['source.levelv'])
+            limit = abs(float(regs['source.limiti']))
+            current = float(np.clip(voltage / self.resistance, -limit, limit))
+        else:
+            current = float(regs['source.leveli'])
+            limit = abs(float(regs['source.limitv']))
+            voltage = float(np.clip(current * self.resistance, -limit, limit))
+        if self.noise is not None:
+            current, voltage = self.noise.apply(current, voltage, float(regs['measure.nplc']) * self._filter_count(regs))
+        return current, voltage
+
+    def point_duration(self, channel: str) -> float:
+        """ Nominelle Dauer einer Messung in Sekunden (NPLC, Autozero, Filter und Delay). """
+        regs = self.channels[channel].registers
+        delay = regs['measure.delay']
+        delay = 0.001 if delay == 'DELAY_AUTO' else float(delay)
+        integration = float(regs['measure.nplc']) / self.LINE_FREQUENCY
+        if regs['measure.autozero'] == 'AUTOZERO_AUTO':
+            integration *= 3 # Referenz- und Nullmessung bei jeder Messung
+        return (integration + delay) * self._filter_count(regs)
+
+    @staticmethod
+    def _filter_count(regs: dict) -> int:
+        return int(regs['measure.filter.count']) if regs['measure.filter.enable'] == 'FILTER_ON' else 1
+
+    def timestamp(self) -> float:
+        return time.monotonic() - self._t0
+
+    # --- Formatierung ---
+
+    def _format_values(self, values) -> bytes:
+        if self.data_format in ('REAL64', 'REAL'):
+            dtype = '<f8' if self.byteorder != 'BIGENDIAN' else '>f8'
+            return b"#0" + np.asarray(values, dtype=dtype).tobytes() + b"\n"
+        if self.data_format == 'REAL32':
+            dtype = '<f4' if self.byteorder != 'BIGENDIAN' else '>f4'
+            return b"#0" + np.asarray(values, dtype=dtype).tobytes() + b"\n"
+        return ("\t".join(f"{float(v):.8e}" for v in values) + "\n").encode('ascii')
+
+    # --- Statement-Handler ---
+
+    def _cmd_noop(self, *args):
+        return b""
+
+    def _cmd_idn(self):
+        return (self.idn + "\n").encode('ascii')
+
+    def _cmd_opc(self):
+        return b"1\n"
+
+    def _cmd_reset_all(self):
+        for channel in self.channels.values():
+            channel.reset()
+        return b""
+
+    def _cmd_reset_channel(self, ch):
+        self.channels[ch].reset()
+        return b""
+
+    def _cmd_buffer_clear(self, ch, buffer):
+        self.channels[ch].buffers[int(buffer)] = _EmulatedChannel._empty_buffer()
+        return b""
+
+    def _cmd_assign(self, ch, path, value):
+        if value.startswith('smu'):
+            value = value.split('.', 1)[1]
+        elif value in self._locals:
+            value = self._locals[value]
+        elif re.fullmatch(self._NUMBER, value):
+            value = float(value)
+        else:
+            self.errors.append(f"smu{ch}.{path} = {value}")
+            return b""
+        self.channels[ch].registers[path] = value
+        return b""
+
+    def _cmd_display(self, screen):
+        self.display_screen = screen
+        return b""
+
+    def _cmd_format(self, key, value):
+        if key == 'data':
+            self.data_format = value
+        else:
+            self.byteorder = value
+        return b""
+
+    def _cmd_trigger_source(self, ch, kind, func, args):
+        channel = self.channels[ch]
+        if kind == 'list':
+            values = [float(v) for v in args.strip().strip('{}').split(',') if v.strip()]
+            channel.sweep_levels = np.array(values, dtype=np.float64)
+        else:
+            parts = [float(v) for v in args.split(',')]
+            start, stop, points = parts[0], parts[1], int(parts[2])
+            if kind == 'linear':
+                channel.sweep_levels = np.linspace(start, stop, points)
+            else:
+                channel.sweep_levels = np.sign(start) * np.geomspace(abs(start), abs(stop), points)
+        channel.sweep_func = func
+        return b""
+
+    def _cmd_trigger_measure(self, ch, kind, args):
+        buffers = [int(b) for b in re.findall(r"nvbuffer([12])", args)]
+        if kind == 'iv':
+            self.channels[ch].measure_targets = {'i': buffers[0], 'v': buffers[1]}
+        else:
+            self.channels[ch].measure_targets = {kind: buffers[0]}
+        return b""
+
+    def _cmd_trigger_stimulus(self, ch, event, timer):
+        self.channels[ch].stimulus[event] = int(timer) if timer else None
+        return b""
+
+    def _cmd_timer_reset(self, timer):
+        self.timers[int(timer)] = {'delay': 10e-6, 'count': 1, 'passthrough': False}
+        return b""
+
+    def _cmd_timer_assign(self, timer, key, value):
+        timer = self.timers.setdefault(int(timer), {'delay': 10e-6, 'count': 1, 'passthrough': False})
+        if value in ('true', 'false'):
+            timer[key] = value == 'true'
+        elif value.startswith('smu'):
+            timer[key] = value
+        else:
+            timer[key] = float(value)
+        return b""
+
+    def _cmd_trigger_initiate(self, ch):
+        channel = self.channels[ch]
+        regs = channel.registers
+        count = int(regs['trigger.count'])
+        source_enabled = regs['trigger.source.action'] == 'ENABLE'
+        limit_key = 'trigger.source.limiti' if channel.sweep_func == 'v' else 'trigger.source.limitv'
+        saved = dict(regs)
+        if regs.get(limit_key, 'LIMIT_AUTO') != 'LIMIT_AUTO':
+            regs[limit_key.replace('trigger.', '')] = regs[limit_key]
+        if source_enabled:
+            regs['source.func'] = 'OUTPUT_DCVOLTS' if channel.sweep_func == 'v' else 'OUTPUT_DCAMPS'
+
+        t = self.timestamp()
+        step = self.point_duration(ch)
+        # Wartet ein Event auf einen Timer, gibt dessen Intervall den Takt vor
+        timers = [self.timers.get(index) for index in channel.stimulus.values() if index is not None]
+        if timers and timers[0] is not None:
+            interval = float(timers[0]['delay'])
+            if interval > step and self.latency is not None and self.latency.measure_timing:
+                self._busy_time += (interval - step) * count
+            step = max(step, interval)
+        for index in range(count):
+            if source_enabled:
+                level = channel.sweep_levels[min(index, len(channel.sweep_levels) - 1)]
+                regs['source.level' + channel.sweep_func] = float(level)
+            source_value = float(regs['source.level' + ('v' if regs['source.func'] == 'OUTPUT_DCVOLTS' else 'i')])
+            current, voltage = self.measure(ch)
+            for kind, value in (('i', current), ('v', voltage)):
+                if kind in channel.measure_targets:
+                    buffer = channel.buffers[channel.measure_targets[kind]]
+                    buffer['readings'].append(value)
+                    buffer['sourcevalues'].append(source_value)
+                    buffer['timestamps'].append(t + index * step)
+
+        # Compliance-Werte des Trigger-Modells gelten nur während des Sweeps
+        for key in ('source.limiti', 'source.limitv'):
+            regs[key] = saved[key]
+        return b""
+
+    def _cmd_local(self, names, expr):
+        names = [name.strip() for name in names.split(',')]
+        if expr.startswith('timer'):
+            values = [self.timestamp()]
+        elif not expr.endswith(')'):
+            # Register lesen, z.B. local d = smua.measure.delay
+            ch, path = re.match(r"smu([ab])\.([\w.]+)", expr).groups()
+            values = [self.channels[ch].registers.get(path)]
+        else:
+            ch, kind = re.match(r"smu([ab])\.measure\.(iv|i|v)", expr).groups()
+            current, voltage = self.measure(ch)
+            values = {'iv': [current, voltage], 'i': [current], 'v': [voltage]}[kind]
+        for name, value in zip(names, values):
+            self._locals[name] = value
+        return b""
+
+    def _cmd_print_measure(self, ch, kind):
+        current, voltage = self.measure(ch)
+        values = {'iv': [current, voltage], 'i': [current], 'v': [voltage]}[kind]
+        return self._format_values(values)
+
+    def _cmd_print_buffer_size(self, ch, buffer):
+        return self._format_values([len(self.channels[ch].buffers[int(buffer)]['readings'])])
+
+    def _cmd_print_locals(self, names):
+        names = [name.strip() for name in names.split(',') if name.strip()]
+        if len(names) == 1 and names[0] not in self._locals:
+            return f"{self.globals.get(names[0], 'nil')}\n".encode('ascii')
+        values = [self._locals.get(name, 0.0) for name in names]
+        return self._format_values(values)
+
+    def _cmd_printbuffer(self, start, end, columns):
+        columns = [c.strip() for c in columns.split(',') if c.strip()]
+        series = []
+        for column in columns:
+            ch, buffer, field = re.match(r"smu([ab])\.nvbuffer([12])\.(\w+)", column).groups()
+            series.append(self.channels[ch].buffers[int(buffer)][field])
+        if re.fullmatch(r"\d+", end):
+            stop = int(end)
+        else:
+            ch, buffer = re.match(r"smu([ab])\.nvbuffer([12])\.n", end).groups()
+            stop = len(self.channels[ch].buffers[int(buffer)]['readings'])
+        first = int(start) - 1
+        rows = np.array([s[first:stop] for s in series], dtype=np.float64).T.ravel()
+        if self.data_format == 'ASCII':
+            return (", ".join(f"{v:.8e}" for v in rows) + "\n").encode('ascii')
+        return self._format_values(rows)
+
+    def _cmd_settle(self, ch, args):
+        # Stub für die TSP-Funktion `modulab_settle` aus Keithley2602.SETTLE_SCRIPT,
+        # gleiches Kriterium als Python-Schleife. Wie am Gerät erst nach dem Laden aufrufbar.
+        if 'modulab_settle' not in self.native_functions:
+            self.errors.append(f"modulab_settle(smu{ch},{args})")
+            return b""
+        source_v, level, tol, abs_tol, window, max_wait = (float(v) for v in args.split(','))
+        window = int(window)
+        self.channels[ch].registers['source.levelv' if source_v == 1 else 'source.leveli'] = level
+        values, elapsed, settled = [], 0.0, 0
+        while True:
+            current, voltage = self.measure(ch)
+            values = (values + [current if source_v == 1 else voltage])[-window:]
+            elapsed += self.point_duration(ch)
+            if len(values) == window:
+                spread = max(values) - min(values)
+                if spread <= tol * abs(sum(values) / window) + abs_tol:
+                    settled = 1
+            if settled or elapsed >= max_wait:
+                break
+        return self._format_values([current, voltage, elapsed, settled])
+
+    def _cmd_define(self, name, params, body):
+        # Einzeilige Funktionen werden beim Aufruf textuell eingesetzt (reicht für ModulabLib)
+        self.functions[name] = ([p.strip() for p in params.split(',') if p.strip()], body)
+        return b""
+
+    def _cmd_global(self, name, value):
+        self.globals[name] = value
+        return b""
+
+    def _cmd_call(self, name, args):
+        if name not in self.functions:
+            self.errors.append(f"{name}({args})")
+            return b""
+        params, body = self.functions[name]
+        values = [a.strip() for a in args.split(',')]
+        for param, value in zip(params, values):
+            body = re.sub(rf"\b{param}\b", value, body)
+        return self.handle_line(body)
+
+    def _cmd_run_script(self, name):
+        output = bytearray()
+        lines = self.scripts.get(name, [])
+        if lines and lines[0].startswith("function") and not lines[0].endswith(" end"):
+            # Mehrzeilige Funktion: Rumpf wird nicht interpretiert, nur der Stub freigeschaltet
+            function = re.match(r"function\s+(\w+)", lines[0]).group(1)
+            if function in self.NATIVE_FUNCTIONS:
+                self.native_functions.add(function)
+            else:
+                self.errors.append(f"{name}.run(): multi-line function '{function}' is not emulated")
+            return b""
+        for line in lines:
+            output += self.handle_line(line)
+        return bytes(output)
+
+
+# ==========================================================================================
+# Server (TCP-Socket und Pseudo-Terminal)
+# ==========================================================================================
+
+class _EmulatorServer:
+    """
+    Gemeinsame Zeilenverarbeitung aller Server inkl. Latenz- und Baudraten-Modell.
+
+    Unterklassen lesen Rohdaten von ihrer Verbindung und reichen sie an
+    `_process_input` weiter.
+    """
+
+    SEND_CHUNK = 1024
+    """int: Blockgröße beim gedrosselten Senden in Bytes."""
+
+    def __init__(self, emulator: TspEmulator | None, latency: LatencyModel | None, noise: NoiseModel | None):
+        self.emulator = emulator or TspEmulator(latency=latency, noise=noise)
+        self._thread = None
+        self._running = False
+
+    @property
+    def latency(self) -> LatencyModel | None:
+        return self.emulator.latency
+
+    def _process_input(self, pending: bytearray, data: bytes, send):
+        """ Verarbeitet alle vollständigen Zeilen in `pending` und sendet die Antworten über `send`. """
+        pending += data
+        while (index := pending.find(b"\n")) >= 0:
+            raw = bytes(pending[:index])
+            del pending[:index + 1]
+            output, busy_time = self.emulator.process(raw.decode('ascii', errors='replace'))
+            if self.latency is not None:
+                busy_time += self.latency.transfer_delay(len(raw) + 1)
+            if busy_time > 0:
+                time.sleep(busy_time)
+            if output:
+                self._send_throttled(output, send)
+
+    def _send_throttled(self, data: bytes, send):
+        if self.latency is None or not self.latency.baudrate:
+            send(data)
+            return
+        for start in range(0, len(data), self.SEND_CHUNK):
+            chunk = data[start:start + self.SEND_CHUNK]
+            send(chunk)
+            time.sleep(self.latency.transfer_delay(len(chunk)))
+
+
+class KeithleyTcpEmulator(_EmulatorServer):
+    """
+    Stellt einen `TspEmulator` als lokalen TCP-Server bereit.
+
+    Der Treiber verbindet sich wie mit einem echten Gerät im LAN, z.B.
+    `Keithley2602.connect("127.0.0.1:5025")`.
+
+    Args:
+        host (str): Adresse, an die gebunden wird.
+        port (int): TCP-Port (0 = vom Betriebssystem vergeben).
+        emulator (TspEmulator, optional): Eigene Emulator-Instanz.
+        latency (LatencyModel, optional): Laufzeitmodell (nur ohne eigene Instanz).
+        noise (NoiseModel, optional): Rauschmodell (nur ohne eigene Instanz).
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, emulator: TspEmulator | None = None,
+                 latency: LatencyModel | None = None, noise: NoiseModel | None = None):
+        super().__init__(emulator, latency, noise)
+        self._server = socket.create_server((host, port))
+        self.host, self.port = self._server.getsockname()[:2]
+
+    @property
+    def address(self) -> str:
+        """ Adresse im Format des Treibers ('host:port'). """
+        return f"{self.host}:{self.port}"
+
+    def start(self) -> str:
+        """ Startet den Server-Thread und gibt die Adresse zurück. """
+        self._running = True
+        self._thread = threading.Thread(target=self._serve, name="KeithleyTcpEmulator", daemon=True)
+        self._thread.start()
+        return self.address
+
+    def stop(self):
+        """ Beendet den Server. """
+        self._running = False
+        try:
+            self._server.close()
+        except OSError:
+            pass
+
+    def _serve(self):
+        while self._running:
+            try:
+                connection, _ = self._server.accept()
+            except OSError:
+                break
+            threading.Thread(target=self._handle_client, args=(connection,), daemon=True).start()
+
+    def _handle_client(self, connection: socket.socket):
+        connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        pending = bytearray()
+        with connection:
+            while self._running:
+                try:
+                    data = connection.recv(65536)
+                except OSError:
+                    break
+                if not data:
+                    break
+                try:
+                    self._process_input(pending, data, connection.sendall)
+                except OSError:
+                    break
+
+
+class KeithleyPtyEmulator(_EmulatorServer):
+    """
+    Stellt einen `TspEmulator` hinter einem Pseudo-Terminal bereit (nur Linux/macOS).
+
+    Das Slave-Ende (z.B. '/dev/pts/5') verhält sich für pyserial wie ein
+    serieller Port. Damit laufen `Keithley2602` inkl. `SerialTransport` und
+    `SmuManager.connect()` unverändert gegen den Emulator. Zusammen mit einem
+    `LatencyModel` (z.B. 115200 Baud) ergibt das realistische Durchsatzzahlen.
+
+    Args:
+        emulator (TspEmulator, optional): Eigene Emulator-Instanz.
+        latency (LatencyModel, optional): Laufzeitmodell (nur ohne eigene Instanz).
+        noise (NoiseModel, optional): Rauschmodell (nur ohne eigene Instanz).
+
+    Examples:
+        .. code-block:: python
+
+            server = KeithleyPtyEmulator(latency=LatencyModel(baudrate=115200))
+            port = server.start()            # z.B. '/dev/pts/5'
+            smu_manager.connect(port)
+    """
+
+    def __init__(self, emulator: TspEmulator | None = None,
+                 latency: LatencyModel | None = None, noise: NoiseModel | None = None):
+        super().__init__(emulator, latency, noise)
+        self._master = None
+        self._slave = None
+        self.port_name = ""
+
+    def start(self) -> str:
+        """ Öffnet das Pseudo-Terminal, startet den Server-Thread und gibt den Port-Namen zurück. """
+        if tty is None:
+            raise OSError("Pseudo-terminals are not available on this platform. Use KeithleyTcpEmulator instead.")
+        self._master, self._slave = os.openpty()
+        tty.setraw(self._slave)
+        self.port_name = os.ttyname(self._slave)
+        self._running = True
+        self._thread = threading.Thread(target=self._serve, name="KeithleyPtyEmulator", daemon=True)
+        self._thread.start()
+        return self.port_name
+
+    def stop(self):
+        """ Beendet den Server und schließt das Pseudo-Terminal. """
+        self._running = False
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+        for fd in (self._master, self._slave):
+            if fd is not None:
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+        self._master = self._slave = None
+
+    def _serve(self):
+        pending = bytearray()
+        while self._running:
+            readable, _, _ = select.select([self._master], [], [], 0.1)
+            if not readable:
+                continue
+            try:
+                data = os.read(self._master, 65536)
+            except OSError:
+                break
+            self._process_input(pending, data, self._write_master)
+
+    def _write_master(self, data: bytes):
+        view = memoryview(data)
+        while view:
+            written = os.write(self._master, view)
+            view = view[written:]
+
+
+# ==========================================================================================
+#  Main zum Benchmarken der Transports
+# ==========================================================================================
+
+if __name__ == "__main__":
+    import sys
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from Keithley2602 import Keithley2602
+
+    class QuietLogManager:
+        """Logger ohne Ausgabe von Debug-Meldungen (sonst misst man nur print)."""
+        def info(self, msg): print(f"[INFO] {msg}")
+        def debug(self, msg): pass
+        def warning(self, msg): print(f"[WARN] {msg}")
+        def error(self, msg, exc_info=True): print(f"[ERROR] {msg}")
+
+    def benchmark(title, server, measurements, sweep_points):
+        address = server.start()
+        smu = Keithley2602(QuietLogManager())
+        connected, idn = smu.connect(address)
+        print(f"--- {title} ({address}) ---")
+
+        # Schnelle Messungen, damit die Übertragung und nicht die Integration dominiert
+        smu.send_command("smua.measure.nplc = 0.01")
+        smu.set_source_voltage_level('a', 1.0)
+        smu.set_output_on('a')
+
+        # Einzelmessungen (Roundtrips)
+        t = time.perf_counter()
+        for _ in range(measurements):
+            smu.measure_iv('a')
+        duration = time.perf_counter() - t
+        print(f"measure_iv:  {measurements / duration:10.0f} Messungen/s")
+
+        # Bulk-Transfer
+        for points in sweep_points:
+            t = time.perf_counter()
+            result = smu.sweep_linear('a', -1.0, 1.0, points, limit=0.1)
+            duration = time.perf_counter() - t
+            print(f"sweep {points:6d}: {duration * 1000:8.1f} ms ({len(result['current'])} Punkte)")
+
+        smu.disconnect()
+        server.stop()
+
+    # Ideal: nur Protokoll- und Python-Overhead
+    benchmark("TCP, ohne Latenz", KeithleyTcpEmulator(), 1000, (1000, 10000, 50000))
+
+    # Realistisch: RS232 mit 115200 Baud, 200 us pro Statement, NPLC-Timing, Rauschen
+    if tty is not None:
+        realistic = LatencyModel(command_latency=200e-6, baudrate=115200)
+        noise = NoiseModel(current_noise=1e-9, voltage_noise=10e-6, relative=50e-6, seed=0)
+        benchmark("PTY, 115200 Baud", KeithleyPtyEmulator(latency=realistic, noise=noise), 100, (100, 1000))
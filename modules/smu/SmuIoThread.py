@@ -0,0 +1,91 @@
+# modules/smu/SmuIoThread.py
+"""
+================================================================================
+I/O-Thread mit priorisierter Befehlswarteschlange für die SMU
+================================================================================
+
+Alle Zugriffe des `SmuManager` auf das Gerät laufen nacheinander in einem
+einzigen `SmuIoThread`. Aufrufer reichen Funktionen mit einer Priorität ein
+und bekommen ein `concurrent.futures.Future` zurück:
+
+    - die GUI wartet nicht, das Ergebnis kommt per Signal
+    - Experiment-Skripte warten synchron auf das Future
+    - asyncio-Code wartet mit `asyncio.wrap_future`
+
+Bei gleicher Priorität gilt die Reihenfolge des Einreichens.
+"""
+
+import functools
+import itertools
+import queue
+import threading
+from concurrent.futures import Future
+
+
+class SmuIoThread(threading.Thread):
+    """
+    Arbeitet eingereichte Funktionen nach Priorität (kleiner = zuerst) ab.
+
+    Args:
+        name (str): Name des Threads (erscheint z.B. im Debugger).
+    """
+
+    PRIORITY_HIGH = 0
+    """int: Nur Ausgang aus und Trennen. Alles, was einen Zustand aufbaut (auch Ausgang ein), bleibt in Reihenfolge."""
+
+    PRIORITY_NORMAL = 1
+    """int: Standard für Konfiguration und Messungen."""
+
+    PRIORITY_LOW = 2
+    """int: Alles, was warten kann, z.B. Gerätesuche und Benchmarks."""
+
+    _STOP = object()
+
+    def __init__(self, name: str = "SmuIO"):
+        super().__init__(name=name, daemon=True)
+        self._queue = queue.PriorityQueue()
+        self._sequence = itertools.count()
+        self._stopped = False
+
+    def is_current(self) -> bool:
+        """ True, wenn der Aufrufer selbst im I/O-Thread läuft. """
+        return threading.current_thread() is self
+
+    def pending(self) -> int:
+        """ Anzahl der noch nicht begonnenen Aufträge. """
+        return self._queue.qsize()
+
+    def submit(self, function, *args, priority: int = PRIORITY_NORMAL, **kwargs) -> Future:
+        """
+        Reiht `function(*args, **kwargs)` ein und gibt sofort ein Future zurück.
+
+        Raises:
+            RuntimeError: Nach `stop`, der Auftrag würde nie ausgeführt.
+        """
+        if self._stopped:
+            raise RuntimeError(f"{self.name} has been stopped.")
+        future = Future()
+        self._queue.put((priority, next(self._sequence), future, functools.partial(function, *args, **kwargs)))
+        return future
+
+    def stop(self, timeout: float = 2.0):
+        """ Arbeitet die Warteschlange ab und beendet dann den Thread. """
+        if self._stopped:
+            return
+        self._stopped = True
+        # Niedrigste Priorität: bereits eingereichte Aufträge laufen noch
+        self._queue.put((float('inf'), next(self._sequence), None, self._STOP))
+        if self.is_alive() and not self.is_current():
+            self.join(timeout)
+
+    def run(self):
+        while True:
+            _, _, future, function = self._queue.get()
+            if function is self._STOP:
+                break
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(function())
+            except BaseException as e:
+                future.set_exception(e)
@@ -1,6 +1,13 @@
 # modules/smu/SmuManager.py
+import asyncio
+import functools
+import itertools
+import os
 import sys
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
 import serial
 from serial.tools import list_ports
 
@@ -8,6 +15,49 @@ from PySide6.QtCore import QObject, Signal
 
 # Importiere beide Treiber, aber KEINE TSP-Konstanten mehr
 from .Keithley2602 import Keithley2602, DummyKeithley2602
+from .TraceRecorder import TraceRecorder
+from .SmuStream import SampleRingBuffer, SmuStreamWorker
+from .SmuIoThread import SmuIoThread
+from .Transport import is_network_address
+
+
+def _io(priority=SmuIoThread.PRIORITY_NORMAL):
+    """
+    Führt eine Manager-Methode im I/O-Thread des Managers aus.
+
+    Der Aufrufer wartet auf das Ergebnis (synchrone Fassade). Verschachtelte
+    Aufrufe im I/O-Thread und Aufrufe innerhalb von `SmuManager.batch()`
+    laufen direkt.
+
+    `priority` ist eine `SmuIoThread.PRIORITY_*` oder eine Funktion, die sie
+    aus den Aufrufargumenten bestimmt (siehe `_output_priority`).
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if self._runs_direct():
+                return method(self, *args, **kwargs)
+            return self._io_thread.submit(method, self, *args, priority=_resolve_priority(priority, args, kwargs),
+                                          **kwargs).result()
+        wrapper.io_priority = priority
+        return wrapper
+    return decorator
+
+
+def _resolve_priority(priority, args, kwargs) -> int:
+    """ Wertet eine Priorität aus `_io` für einen konkreten Aufruf aus. """
+    return priority(*args, **kwargs) if callable(priority) else priority
+
+
+def _output_priority(channel: str, enable: bool) -> int:
+    """
+    Nur "Ausgang AUS" darf ältere Aufträge überholen.
+
+    "Ausgang EIN" bleibt in der Reihenfolge, sonst schaltet der Ausgang mit
+    einem Pegel ein, dessen Änderung noch in der Warteschlange steht.
+    """
+    return SmuIoThread.PRIORITY_NORMAL if enable else SmuIoThread.PRIORITY_HIGH
+
 
 class SmuManager(QObject):
     """
@@ -30,24 +80,69 @@ class SmuManager(QObject):
         
         device_list_updated (list):
             Wird ausgelöst, nachdem die Liste der seriellen Ports aktualisiert wurde.
-            Args: (list: Liste von Port-Namen [str]).
+            Enthält auch die gespeicherten Netzwerk-Adressen.
+            Args: (list: Liste von Port-Namen/Adressen [str]).
             
         new_measurement_acquired (str, float, float):
             Wird ausgelöst, wenn eine neue Messung verfügbar ist.
             Args: (str: Kanal, float: Strom, float: Spannung).
+
+        new_measurements_acquired (float, dict):
+            Wird ausgelöst, wenn mehrere Kanäle gemeinsam gemessen wurden.
+            Args: (float: Gerätezeitstempel [s], dict: {Kanal: (Strom, Spannung)}).
+
+        stream_block_acquired (dict):
+            Wird während des Streamings (`start_stream`) im Block-Takt ausgelöst,
+            nicht pro Sample.
+            Args: (dict: {'timestamp': ndarray, Kanal: (Strom-ndarray, Spannungs-ndarray)}).
+
+        stream_state_changed (bool):
+            Wird ausgelöst, wenn das Streaming startet oder endet (auch bei Fehlern).
+
+        devices_discovered (list):
+            Wird nach `discover_devices` ausgelöst.
+            Args: (list: [{'port', 'model', 'serial', 'idn'}, ...] nur echte SMUs).
+
+        request_finished (int, str, object):
+            Wird ausgelöst, wenn ein mit `request` eingereichter Auftrag fertig ist.
+            Args: (int: Auftrags-ID, str: Methodenname, object: Rückgabewert oder None bei Fehler).
+
+    Threads:
+        Alle Gerätezugriffe laufen nacheinander in einem eigenen I/O-Thread
+        (`SmuIoThread`). Aufrufe aus anderen Threads (z.B. Experiment-Skripte)
+        warten wie gewohnt auf das Ergebnis. Die GUI nutzt `request`, das
+        sofort zurückkehrt.
     """
 
+    # Die Presets setzen alle Werte, die die Dauer einer Messung bestimmen.
+    # 'normal' entspricht den Werkseinstellungen der 2602 nach einem Reset.
+    MEASURE_PRESETS = {
+        'fast': {'nplc': 0.01, 'autozero': 'off', 'delay': 0.0, 'filter_count': 1, 'display': False},
+        'normal': {'nplc': 1.0, 'autozero': 'auto', 'delay': 'auto', 'filter_count': 1, 'display': True},
+        'hi-accuracy': {'nplc': 5.0, 'autozero': 'auto', 'delay': 'auto', 'filter_count': 3, 'display': True},
+    }
+    """dict: Vordefinierte Einstellungen für `set_measure_settings(preset=...)`."""
+
     # Signale
     connection_status_changed = Signal(bool, str)
     device_list_updated = Signal(list)
     new_measurement_acquired = Signal(str, float, float)
+    new_measurements_acquired = Signal(float, dict)
+    stream_block_acquired = Signal(object)
+    stream_state_changed = Signal(bool)
+    devices_discovered = Signal(list)
+    request_finished = Signal(int, str, object)
 
-    def __init__(self, log_manager, profile_manager):
+    def __init__(self, log_manager, profile_manager, name: str | None = None):
         super().__init__()
         self.log_mgr = log_manager
         self.profile_mgr = profile_manager
+        # None = Haupt-SMU der GUI; mit Namen = weiteres Gerät im `SmuPool`
+        self.name = name
 
         self.smu_device = None
+        self._stream_worker = None
+        self.stream_buffer = None
         self.available_devices = {}
         self.connected_port = ""
         self.idn_message = ""
@@ -58,6 +153,20 @@ class SmuManager(QObject):
             'b': 'V'
         }
 
+        # Ein Thread für alle Gerätezugriffe, Aufträge aus GUI/Experiment werden eingereiht
+        self._io_thread = SmuIoThread("SmuIO" if name is None else f"SmuIO-{name}")
+        self._io_thread.start()
+        self._io_local = threading.local()
+        self._request_ids = itertools.count(1)
+
+        # Messgeschwindigkeit pro Kanal + Display, wird bei jedem Verbinden übertragen
+        self.measure_settings = self._load_measure_settings()
+
+        if name is not None:
+            # Pool-Geräte verbindet der SmuPool selbst
+            self.LastDevice = None
+            return
+
         self.LastDevice = self.profile_mgr.read("Smu_LastDevice")
 
         if self.LastDevice:
@@ -67,17 +176,98 @@ class SmuManager(QObject):
             self.log_mgr.info("No last SMU saved. Please connect manually")
             self.get_deviceList()
 
+    # --- I/O-Thread ---
+
+    def request(self, method_name: str, *args, priority: int | None = None, **kwargs) -> int:
+        """
+        Reiht einen Methodenaufruf im I/O-Thread ein und kehrt sofort zurück.
+
+        Für die GUI gedacht: Der Aufruf blockiert nicht, das Ergebnis kommt
+        über `request_finished`. Die Signale der Methode selbst (z.B.
+        `new_measurement_acquired`) werden wie gewohnt ausgelöst.
+
+        Args:
+            method_name (str): Name einer Manager-Methode, z.B. 'measure_iv'.
+            *args, **kwargs: Argumente der Methode.
+            priority (int, optional): `SmuIoThread.PRIORITY_*`. None = Standard der Methode.
+
+        Returns:
+            int: Auftrags-ID (wird mit `request_finished` zurückgegeben).
+
+        Examples:
+            .. code-block:: python
+
+                manager.request('set_output_state', 'a', False)
+                manager.request('measure_iv', 'a')
+        """
+        request_id = next(self._request_ids)
+        future = self.submit(method_name, *args, priority=priority, **kwargs)
+        future.add_done_callback(functools.partial(self._on_request_done, request_id, method_name))
+        return request_id
+
+    def submit(self, method_name: str, *args, priority: int | None = None, **kwargs) -> Future:
+        """
+        Reiht einen Methodenaufruf im I/O-Thread ein und gibt ein Future zurück.
+
+        Grundlage von `request`; nützlich, um mehrere Geräte parallel
+        anzusprechen (siehe `SmuPool`).
+
+        Args:
+            method_name (str): Name einer Manager-Methode, z.B. 'measure_iv_all'.
+            *args, **kwargs: Argumente der Methode.
+            priority (int, optional): `SmuIoThread.PRIORITY_*`. None = Standard der Methode.
+
+        Returns:
+            concurrent.futures.Future: Liefert den Rückgabewert der Methode.
+        """
+        method = getattr(type(self), method_name)
+        if priority is None:
+            priority = _resolve_priority(getattr(method, 'io_priority', SmuIoThread.PRIORITY_NORMAL), args, kwargs)
+        return self._io_thread.submit(getattr(method, '__wrapped__', method), self, *args,
+                                      priority=priority, **kwargs)
+
+    def _on_request_done(self, request_id: int, method_name: str, future):
+        """ Läuft im I/O-Thread, sobald ein Auftrag aus `request` fertig ist. """
+        try:
+            result = future.result()
+        except Exception as e:
+            self.log_mgr.error(f"SMU request '{method_name}' failed: {e}")
+            result = None
+        self.request_finished.emit(request_id, method_name, result)
+
+    def shutdown(self):
+        """
+        Trennt das Gerät und beendet den I/O-Thread.
+
+        Für das Programmende bzw. wenn ein Pool-Gerät entfernt wird. Danach
+        laufen Methodenaufrufe direkt im Aufrufer, `request`/`submit` sind
+        nicht mehr möglich.
+        """
+        self.disconnect()
+        self._io_thread.stop()
+
+    def pending_requests(self) -> int:
+        """ Anzahl der Aufträge, die im I/O-Thread noch warten. """
+        return self._io_thread.pending()
+
+    def _runs_direct(self) -> bool:
+        """ True, wenn ein Gerätezugriff ohne Umweg über die Warteschlange laufen muss. """
+        return (self._io_thread.is_current() or not self._io_thread.is_alive()
+                or getattr(self._io_local, 'batch_depth', 0) > 0)
+
     # --- Verbindungs- und Geräte-Verwaltung
 
     def get_deviceList(self) -> list:
         """
         Scannt nach verfügbaren seriellen Ports und aktualisiert die interne Liste.
 
-        Sucht nach allen COM-Ports und fügt zusätzlich einen "DUMMY"-Port
-        für Testzwecke hinzu. Löst das `device_list_updated`-Signal aus.
+        Sucht nach allen COM-Ports, ergänzt die im Profil gespeicherten
+        Netzwerk-Adressen (siehe `add_network_device`) und fügt zusätzlich einen
+        "DUMMY"-Port für Testzwecke hinzu. Löst das `device_list_updated`-Signal aus.
 
         Returns:
-            list: Eine Liste der gefundenen Port-Namen (z.B. ['COM1', 'COM3', 'DUMMY']).
+            list: Eine Liste der gefundenen Port-Namen 
+                  (z.B. ['COM1', 'COM3', '192.168.0.10:5025', 'DUMMY']).
         """
         port_names = []
         try:
@@ -98,6 +288,12 @@ class SmuManager(QObject):
             self.log_mgr.error(f"Error listing COM-Ports: {e}")
             self.available_devices.clear()
 
+        # Netzwerk-Geräte (LAN/VISA) lassen sich nicht scannen, sie kommen aus dem Profil
+        for address in self.profile_mgr.read("Smu_NetworkDevices") or []:
+            port_names.append(address)
+            self.available_devices[address] = None
+            self.log_mgr.debug(f" - Found: {address} (network)")
+
         # Dummy Port für Testzwecke
         port_names.append("DUMMY")
         self.available_devices["DUMMY"] = None
@@ -105,14 +301,181 @@ class SmuManager(QObject):
 
         self.device_list_updated.emit(port_names)
         return port_names
+
+    def add_network_device(self, address: str) -> bool:
+        """
+        Speichert eine Netzwerk-Adresse (LAN Raw-Socket oder VISA) im Profil.
+
+        Netzwerk-Geräte tauchen danach in `get_deviceList` auf und können wie
+        ein COM-Port mit `connect` verbunden werden.
+
+        Args:
+            address (str): z.B. "192.168.0.10:5025", "socket://192.168.0.10"
+                           oder "TCPIP0::192.168.0.10::INSTR".
+
+        Returns:
+            bool: True, wenn die Adresse gültig ist und gespeichert wurde.
+
+        Examples:
+            .. code-block:: python
+
+                manager.add_network_device("192.168.0.10:5025")
+                manager.connect("192.168.0.10:5025")
+        """
+        if not is_network_address(address):
+            self.log_mgr.error(f"'{address}' is not a valid network address (expected host:port or VISA resource).")
+            return False
+
+        addresses = list(self.profile_mgr.read("Smu_NetworkDevices") or [])
+        if address not in addresses:
+            addresses.append(address)
+            self.profile_mgr.write("Smu_NetworkDevices", addresses)
+            self.log_mgr.info(f"Network SMU address {address} added.")
+        self.get_deviceList()
+        return True
+
+    @_io(SmuIoThread.PRIORITY_LOW)
+    def discover_devices(self, refresh: bool = False, timeout: float = 0.3, max_workers: int = 16) -> list[dict]:
+        """
+        Sucht an allen Ports parallel nach Keithley SMUs.
+
+        Jeder COM-Port (und jede gespeicherte Netzwerk-Adresse) wird in einem
+        eigenen Thread mit kurzem Timeout per `*IDN?` abgefragt. Die Antworten
+        werden zusammen mit VID/PID/Seriennummer des USB-Adapters im Profil
+        gespeichert (`Smu_PortCache`). Ports, deren Adapter sich seit der
+        letzten Suche nicht geändert hat, werden ohne Abfrage aus dem Cache
+        beantwortet. Löst `devices_discovered` aus.
+
+        Args:
+            refresh (bool): Alle Ports neu abfragen, auch wenn sie im Cache stehen.
+            timeout (float): Antwortzeit pro Port in Sekunden.
+            max_workers (int): Maximale Anzahl gleichzeitig abgefragter Ports.
+
+        Returns:
+            list[dict]: Gefundene SMUs als {'port', 'model', 'serial', 'idn'}.
+
+        Examples:
+            .. code-block:: python
+
+                smus = manager.discover_devices()
+                if smus:
+                    manager.connect(smus[0]['port'])
+        """
+        self.get_deviceList()
+        # Die verbundene SMU nicht parallel zur laufenden Verbindung ansprechen
+        candidates = [port for port in self.available_devices
+                      if port != "DUMMY" and not (self.is_connected() and port == self.connected_port)]
+        cache = dict(self.profile_mgr.read("Smu_PortCache") or {})
+
+        idns, to_probe = {}, []
+        for port in candidates:
+            entry = cache.get(port)
+            if not refresh and entry and self._same_adapter(entry, self.available_devices[port]):
+                idns[port] = entry['idn']
+            else:
+                to_probe.append(port)
+
+        if to_probe:
+            start_time = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(to_probe)),
+                                    thread_name_prefix="SmuProbe") as executor:
+                probed = dict(zip(to_probe, executor.map(
+                    functools.partial(Keithley2602.probe, timeout=timeout), to_probe)))
+            self.log_mgr.debug(f"Probed {len(to_probe)} port(s) in {time.perf_counter() - start_time:.2f} s.")
+            for port, idn in probed.items():
+                if idn is None:
+                    # Keine Antwort: evtl. nur ausgeschaltet, also nicht als "kein SMU" merken
+                    cache.pop(port, None)
+                    continue
+                idns[port] = idn
+                cache[port] = self._port_cache_entry(port, idn)
+            self.profile_mgr.write("Smu_PortCache", cache)
+
+        if self.is_connected() and self.connected_port in self.available_devices:
+            idns[self.connected_port] = self.idn_message
+
+        devices = []
+        for port, idn in idns.items():
+            if not self._is_smu_idn(idn):
+                continue
+            model, serial_number = self._parse_idn(idn)
+            devices.append({'port': port, 'model': model, 'serial': serial_number, 'idn': idn})
+            self.log_mgr.info(f"Found SMU {model} (SN: {serial_number}) @ {port}")
+        if not devices:
+            self.log_mgr.warning("No SMU found during discovery.")
+
+        self.devices_discovered.emit(devices)
+        return devices
+
+    @staticmethod
+    def _is_smu_idn(idn: str) -> bool:
+        """ Prüft, ob eine IDN-Antwort zu einer unterstützten SMU gehört. """
+        return "KEITHLEY" in idn.upper() or "DUMMY" in idn.upper()
+
+    @staticmethod
+    def _parse_idn(idn: str) -> tuple[str, str]:
+        """ Zerlegt 'KEITHLEY INSTRUMENTS INC.,MODEL 2602,1234567,1.4.2' in (Modell, Seriennummer). """
+        parts = [part.strip() for part in idn.split(',')]
+        model = parts[1] if len(parts) > 1 else parts[0]
+        serial_number = parts[2] if len(parts) > 2 else ""
+        return model, serial_number
+
+    def _port_cache_entry(self, port: str, idn: str) -> dict:
+        """ Eintrag für `Smu_PortCache`: USB-Kennung des Ports und IDN-Antwort des Geräts. """
+        info = self.available_devices.get(port)
+        return {
+            'vid': getattr(info, 'vid', None),
+            'pid': getattr(info, 'pid', None),
+            'serial_number': getattr(info, 'serial_number', None),
+            'idn': idn,
+        }
+
+    @staticmethod
+    def _same_adapter(entry: dict, port_info) -> bool:
+        """ Prüft, ob am Port noch derselbe USB-Adapter steckt wie beim Cache-Eintrag. """
+        if port_info is None:
+            # Netzwerk-Adressen: die Adresse selbst ist die Kennung
+            return True
+        return (entry.get('vid') is not None and entry.get('serial_number') is not None
+                and (entry['vid'], entry['pid'], entry['serial_number'])
+                == (port_info.vid, port_info.pid, port_info.serial_number))
+
+    def _find_moved_port(self, port_name: str) -> str | None:
+        """
+        Sucht den Port, an dem der USB-Adapter von `port_name` jetzt steckt
+        (z.B. COM3 -> COM7 nach Umstecken), anhand von `Smu_PortCache`.
+        """
+        entry = (self.profile_mgr.read("Smu_PortCache") or {}).get(port_name)
+        if not entry or not self._is_smu_idn(entry.get('idn') or ""):
+            return None
+        for port, info in self.available_devices.items():
+            if info is not None and self._same_adapter(entry, info):
+                return port
+        return None
+
+    def _update_port_cache(self, port_name: str, idn: str):
+        """ Merkt sich nach einem erfolgreichen Verbinden Adapter und IDN des Ports. """
+        if port_name not in self.available_devices:
+            return
+        cache = dict(self.profile_mgr.read("Smu_PortCache") or {})
+        entry = self._port_cache_entry(port_name, idn)
+        # Derselbe Adapter kann nur an einem Port stecken
+        for port in [p for p, e in cache.items() if p != port_name and e.get('serial_number')
+                     and (e.get('vid'), e.get('pid'), e.get('serial_number'))
+                     == (entry['vid'], entry['pid'], entry['serial_number'])]:
+            del cache[port]
+        if cache.get(port_name) != entry:
+            cache[port_name] = entry
+            self.profile_mgr.write("Smu_PortCache", cache)
     
+    @_io()
     def connect(self, port_name: str) -> bool:
         """
-        Verbindet eine SMU an einem bestimmten COM-Port.
+        Verbindet eine SMU an einem bestimmten COM-Port oder einer Netzwerk-Adresse.
         ...
 
         Args:
-            port_name (str): Der Name des Ports (z.B. "COM1" oder "DUMMY").
+            port_name (str): Der Name des Ports (z.B. "COM1", "192.168.0.10:5025" oder "DUMMY").
 
         Returns:
             bool: True bei erfolgreicher Verbindung, sonst False.
@@ -139,7 +502,11 @@ class SmuManager(QObject):
         if port_name.upper() == "DUMMY":
             self.log_mgr.info("Connecting to DUMMY driver...")
             driver_to_use = DummyKeithley2602(self.log_mgr)
-        elif port_name in self.available_devices:
+        elif port_name.upper().startswith("REPLAY:"):
+            self.log_mgr.info(f"Replaying SMU trace {port_name[len('REPLAY:'):]}...")
+            driver_to_use = Keithley2602(self.log_mgr)
+        elif port_name in self.available_devices or is_network_address(port_name) or os.path.exists(port_name):
+            # Nicht gelistete Pfade (z.B. Pseudo-Terminal von KeithleyPtyEmulator) werden direkt geöffnet
             self.log_mgr.info(f"Connecting to real Keithley driver on {port_name}...")
             # =====================================================================
             # Hier können später auch andere Treiber für andere SMU Geräte eingebunden werden
@@ -155,7 +522,7 @@ class SmuManager(QObject):
 
             if is_connected:
                 #Prüfen ob Keithley:
-                if "KEITHLEY" not in idn_msg.upper() and "DUMMY" not in idn_msg.upper():
+                if not self._is_smu_idn(idn_msg):
                     self.log_mgr.error(f"Device on {port_name} is not a Keithley SMU. IDN: {idn_msg}")
                     driver_to_use.disconnect()
                     self.connection_status_changed.emit(False,"")
@@ -164,8 +531,15 @@ class SmuManager(QObject):
                 self.smu_device = driver_to_use
                 self.connected_port = port_name
                 self.idn_message = idn_msg
-                self.LastDevice = port_name
-                self.profile_mgr.write("Smu_LastDevice", self.LastDevice)
+                # Ein Replay ist kein Gerät, zu dem beim nächsten Start verbunden werden soll
+                if not port_name.upper().startswith("REPLAY:"):
+                    if self.name is None:
+                        self.LastDevice = port_name
+                        self.profile_mgr.write("Smu_LastDevice", self.LastDevice)
+                    if port_name.upper() != "DUMMY":
+                        self._update_port_cache(port_name, idn_msg)
+
+                self._apply_measure_settings(('a', 'b'))
 
                 active_name = self.get_activeDeviceName()
                 self.log_mgr.info(f"Successfully connected to {active_name}")
@@ -180,12 +554,15 @@ class SmuManager(QObject):
             self.connection_status_changed.emit(False, "")
             return False
         
+    @_io()
     def connect_LastDevice(self):
         """
         Versucht, die Verbindung mit dem zuletzt genutzten Gerät wiederherzustellen.
 
         Aktualisiert zuerst die Geräteliste und prüft, ob der gespeicherte
-        Port (`self.LastDevice`) verfügbar ist.
+        Port (`self.LastDevice`) verfügbar ist. Steckt der USB-Adapter der SMU
+        inzwischen an einem anderen Port, wird dieser über `Smu_PortCache`
+        gefunden (ohne andere Ports abzufragen).
 
         Returns:
             bool: True bei Erfolg, False, wenn kein Gerät gespeichert war 
@@ -193,8 +570,12 @@ class SmuManager(QObject):
         """
         self.get_deviceList()
         if self.LastDevice:
-            if self.LastDevice in self.available_devices:
+            if self.LastDevice in self.available_devices or is_network_address(self.LastDevice):
                 return self.connect(self.LastDevice)
+            moved_port = self._find_moved_port(self.LastDevice)
+            if moved_port:
+                self.log_mgr.info(f"Last used SMU moved from {self.LastDevice} to {moved_port}.")
+                return self.connect(moved_port)
             else:
                 self.log_mgr.debug(f"Last used port {self.LastDevice} is not available.")   
                 return False
@@ -202,13 +583,19 @@ class SmuManager(QObject):
             self.log_mgr.debug(f"No 'LastDevice' (port) found to connect to.")
             return False
 
+    @_io(SmuIoThread.PRIORITY_HIGH)
     def disconnect(self):
         """
         Trennt die aktive Verbindung zum SMU-Gerät.
         
         Setzt den internen Zustand zurück und löst `connection_status_changed` aus.
         """
+        self.stop_stream()
         if self.smu_device:
+            stats = self.get_cache_stats()
+            if stats and stats['hits']:
+                self.log_mgr.info(f"SMU register cache: {stats['hits']} redundant command(s) skipped "
+                                  f"({stats['saved_bytes']} bytes), {stats['misses']} sent.")
             try:
                 self.smu_device.disconnect()
             except Exception as e:
@@ -234,9 +621,7 @@ class SmuManager(QObject):
                 return "DUMMY (Simuliert)"
             try:
                 # IDN-String parsen, z.B.: "KEITHLEY INSTRUMENTS INC.,MODEL 2602,..."
-                parts = self.idn_message.split(',')
-                model = parts[1].strip()
-                serial = parts[2].strip()
+                model, serial = self._parse_idn(self.idn_message)
                 return f"{model} (SN: {serial}) @ {self.connected_port}"
             except Exception as e:
                 return f"Keithley SMU @ {self.connected_port}"
@@ -270,6 +655,7 @@ class SmuManager(QObject):
             return False
         return True
 
+    @_io()
     def reset_channel(self, channel: str):
         """
         Setzt einen SMU-Kanal auf Werkseinstellungen zurück.
@@ -283,12 +669,15 @@ class SmuManager(QObject):
             self.smu_device.reset_channel(channel)
             # Internen Zustand auch zurücksetzen
             self.channel_source_func[channel] = 'V'
+            # Der Reset setzt auch die Messgeschwindigkeit zurück
+            self._apply_measure_settings((channel,), display=False)
             self.log_mgr.info(f"SMU Channel {channel} reset.")
         except Exception as e:
             self.log_mgr.error(f"Failed to reset channel {channel}: {e}")
 
     # --- NEUE, INTUITIVE API-METHODEN (ersetzen die alten 'bool'-Methoden) ---
 
+    @_io()
     def set_source_voltage(self, channel: str):
         """
         Konfiguriert den Kanal als SPANNUNGSQUELLE (V-Source).
@@ -308,6 +697,7 @@ class SmuManager(QObject):
         except Exception as e:
             self.log_mgr.error(f"Failed to set source voltage for {channel}: {e}")
 
+    @_io()
     def set_source_current(self, channel: str):
         """
         Konfiguriert den Kanal als STROMQUELLE (I-Source).
@@ -327,6 +717,7 @@ class SmuManager(QObject):
         except Exception as e:
             self.log_mgr.error(f"Failed to set source current for {channel}: {e}")
 
+    @_io()
     def set_sense_local(self, channel: str):
         """
         Stellt den Sense-Modus auf LOKAL (2-Draht-Messung).
@@ -342,6 +733,7 @@ class SmuManager(QObject):
         except Exception as e:
             self.log_mgr.error(f"Failed to set sense local for {channel}: {e}")
 
+    @_io()
     def set_sense_remote(self, channel: str):
         """
         Stellt den Sense-Modus auf REMOTE (4-Draht-Messung).
@@ -359,6 +751,7 @@ class SmuManager(QObject):
 
     # --- "Intelligente" Methoden  ---
 
+    @_io()
     def set_source_level(self, channel: str, level: float):
         """
         Setzt das Source-Level (V oder A).
@@ -385,6 +778,7 @@ class SmuManager(QObject):
         except Exception as e:
             self.log_mgr.error(f"Failed to set source level for {channel}: {e}")
 
+    @_io()
     def set_source_limit(self, channel: str, limit: float):
         """
         Setzt das Source-Limit (A oder V).
@@ -436,6 +830,7 @@ class SmuManager(QObject):
         except Exception as e:
             self.log_mgr.error(f"Failed to set source limit for {channel}: {e}")
 
+    @_io(_output_priority)
     def set_output_state(self, channel: str, enable: bool):
         """
         Schaltet den Ausgang eines Kanals EIN oder AUS.
@@ -457,8 +852,437 @@ class SmuManager(QObject):
         except Exception as e:
             self.log_mgr.error(f"Failed to set output state for {channel}: {e}")
 
+    # --- Batch-Konfiguration ---
+
+    @contextmanager
+    def batch(self):
+        """
+        Fasst alle SMU-Befehle innerhalb des Blocks zu einem Schreibvorgang zusammen.
+
+        Die Setter (`set_source_voltage`, `set_source_limit`, ...) können wie
+        gewohnt aufgerufen werden, die Befehle werden aber erst beim Verlassen
+        des Blocks gemeinsam an das Gerät gesendet. Ohne Verbindung ist der
+        Block wirkungslos.
+
+        Examples:
+            Einen Kanal in einem Rutsch konfigurieren:
+
+            .. code-block:: python
+
+                with manager.batch():
+                    manager.set_source_voltage('a')
+                    manager.set_source_limit('a', 0.01)
+                    manager.set_source_level('a', 0.5)
+                    manager.set_output_state('a', True)
+        """
+        if not self.is_connected():
+            yield self
+            return
+        # Der Block hält die Treiber-Sperre; Aufrufe darin laufen direkt in diesem Thread
+        self._io_local.batch_depth = getattr(self._io_local, 'batch_depth', 0) + 1
+        try:
+            with self.smu_device.batch():
+                yield self
+        finally:
+            self._io_local.batch_depth -= 1
+
+    @_io()
+    def wait_complete(self) -> bool:
+        """
+        Wartet, bis die SMU alle gesendeten Befehle ausgeführt hat.
+
+        Befehle werden ohne feste Wartezeit gesendet. Vor zeitkritischen Schritten
+        (z.B. Spektrum direkt nach dem Setzen eines Levels) sorgt diese Methode
+        dafür, dass das Gerät den neuen Zustand tatsächlich übernommen hat.
+
+        Returns:
+            bool: True bei Erfolg, False bei Fehler oder ohne Verbindung.
+        """
+        if not self._check_connection("wait for SMU completion"):
+            return False
+        try:
+            return self.smu_device.sync()
+        except Exception as e:
+            self.log_mgr.error(f"Error while waiting for SMU completion: {e}")
+            return False
+
+    @_io()
+    def configure_channel(self, channel: str, source_func: str | None = None, level: float | None = None,
+                          limit: float | None = None, sense: str | None = None,
+                          output: bool | None = None, reset: bool = False) -> bool:
+        """
+        Setzt mehrere Einstellungen eines Kanals gemeinsam in einem Schreibvorgang.
+
+        Nur die übergebenen Parameter werden geändert. Die Reihenfolge entspricht
+        der sicheren Reihenfolge am Gerät: Reset, Source-Funktion, Sense, Limit,
+        Level und zuletzt der Ausgang. Abschließend wird einmal auf die Ausführung
+        gewartet.
+
+        Args:
+            channel (str): Der Kanal (z.B. 'a').
+            source_func (str, optional): 'V' (Spannungsquelle) oder 'I' (Stromquelle).
+            level (float, optional): Source-Level (V oder A).
+            limit (float, optional): Source-Limit (A oder V).
+            sense (str, optional): 'local' (2-Draht) oder 'remote' (4-Draht).
+            output (bool, optional): Ausgang ein-/ausschalten.
+            reset (bool): Kanal vorher zurücksetzen.
+
+        Returns:
+            bool: True, wenn das Gerät die Konfiguration bestätigt hat.
+
+        Examples:
+            .. code-block:: python
+
+                manager.configure_channel('a', source_func='V', limit=0.01,
+                                          level=0.0, output=True, reset=True)
+        """
+        if not self._check_connection(f"configure channel {channel}"):
+            return False
+        if source_func not in (None, 'V', 'I'):
+            self.log_mgr.error(f"Invalid source function '{source_func}' for channel {channel}.")
+            return False
+        if sense not in (None, 'local', 'remote'):
+            self.log_mgr.error(f"Invalid sense mode '{sense}' for channel {channel}.")
+            return False
+
+        with self.batch():
+            if reset:
+                self.reset_channel(channel)
+            if source_func == 'V':
+                self.set_source_voltage(channel)
+            elif source_func == 'I':
+                self.set_source_current(channel)
+            if sense == 'local':
+                self.set_sense_local(channel)
+            elif sense == 'remote':
+                self.set_sense_remote(channel)
+            if limit is not None:
+                self.set_source_limit(channel, limit)
+            if level is not None:
+                self.set_source_level(channel, level)
+            if output is not None:
+                self.set_output_state(channel, output)
+        return self.wait_complete()
+
+    # --- Messgeschwindigkeit ---
+
+    @_io()
+    def set_measure_settings(self, channel: str | None = None, preset: str | None = None,
+                             nplc: float | None = None, autozero: str | None = None, delay=None,
+                             filter_count: int | None = None, display: bool | None = None) -> bool:
+        """
+        Stellt Geschwindigkeit und Genauigkeit der Messungen ein.
+
+        Ein Preset setzt alle Werte, zusätzlich übergebene Parameter
+        überschreiben einzelne davon. Ohne Preset werden nur die übergebenen
+        Werte geändert. Die Einstellungen werden im Profil gespeichert und
+        bei jedem Verbinden (und nach einem Kanal-Reset) erneut übertragen.
+        Ohne Verbindung werden sie nur gespeichert.
+
+        Args:
+            channel (str, optional): Der Kanal (z.B. 'a'). None = beide Kanäle.
+            preset (str, optional): 'fast', 'normal' oder 'hi-accuracy' (siehe `MEASURE_PRESETS`).
+            nplc (float, optional): Integrationszeit in Netzperioden (0.001 ... 25).
+            autozero (str, optional): 'off', 'once' oder 'auto'.
+            delay (float | str, optional): Messverzögerung in Sekunden oder 'auto'.
+            filter_count (int, optional): Anzahl gemittelter Messungen (1 = kein Filter).
+            display (bool, optional): Messwerte am Gerät anzeigen (gilt für beide Kanäle).
+
+        Returns:
+            bool: True, wenn die Einstellungen gültig sind und (falls verbunden)
+                  vom Gerät bestätigt wurden.
+
+        Examples:
+            .. code-block:: python
+
+                # Schnelles Streaming auf Kanal 'b', aber mit 2 Messungen gemittelt
+                manager.set_measure_settings('b', preset='fast', filter_count=2)
+
+                # Nur die Integrationszeit ändern
+                manager.set_measure_settings('a', nplc=5)
+        """
+        if preset is not None and preset not in self.MEASURE_PRESETS:
+            self.log_mgr.error(f"Unknown SMU measure preset '{preset}' "
+                               f"(expected one of {list(self.MEASURE_PRESETS)}).")
+            return False
+
+        overrides = dict(self.MEASURE_PRESETS[preset]) if preset else {}
+        for key, value in (('nplc', nplc), ('autozero', autozero), ('delay', delay),
+                           ('filter_count', filter_count), ('display', display)):
+            if value is not None:
+                overrides[key] = value
+
+        channels = ('a', 'b') if channel is None else (channel,)
+        settings = {key: dict(value) if isinstance(value, dict) else value
+                    for key, value in self.measure_settings.items()}
+        if 'display' in overrides:
+            settings['display'] = bool(overrides.pop('display'))
+        for ch in channels:
+            settings[ch].update(overrides)
+
+        try:
+            for ch in channels:
+                self._validate_measure_settings(settings[ch])
+        except ValueError as e:
+            self.log_mgr.error(f"Invalid SMU measure settings: {e}")
+            return False
+
+        self.measure_settings = settings
+        self.profile_mgr.write(self._measure_settings_key(), self.measure_settings)
+        self.log_mgr.info(f"SMU measure settings for channel(s) {', '.join(channels)}: "
+                          f"{', '.join(f'{k}={v}' for k, v in settings[channels[0]].items())}, "
+                          f"display={settings['display']}")
+
+        if not self.is_connected():
+            return True
+        self._apply_measure_settings(channels)
+        return self.wait_complete()
+
+    def get_measure_settings(self, channel: str) -> dict:
+        """
+        Gibt die Messeinstellungen eines Kanals zurück.
+
+        Returns:
+            dict: {'nplc', 'autozero', 'delay', 'filter_count', 'display'}
+        """
+        return dict(self.measure_settings[channel], display=self.measure_settings['display'])
+
+    @_io(SmuIoThread.PRIORITY_LOW)
+    def benchmark_measure_presets(self, channel: str = 'a', duration: float = 1.0,
+                                  presets=None) -> dict | None:
+        """
+        Misst, wie viele Einzelmessungen pro Sekunde mit jedem Preset möglich sind.
+
+        Jedes Preset wird für `duration` Sekunden auf den Kanal angewendet und
+        mit `measure_iv` gemessen (ohne Signale). Danach werden die eigenen
+        Einstellungen des Kanals wiederhergestellt. Der Ausgang wird nicht
+        verändert.
+
+        Args:
+            channel (str): Der Kanal (z.B. 'a').
+            duration (float): Messdauer pro Preset in Sekunden.
+            presets (list[str], optional): Zu testende Presets (Standard: alle).
+
+        Returns:
+            dict | None: {Preset: Messungen pro Sekunde}, None bei einem Fehler.
+        """
+        if not self._check_connection(f"benchmark measure presets on {channel}"):
+            return None
+        if self.is_streaming():
+            self.log_mgr.error("Cannot benchmark while the SMU is streaming.")
+            return None
+
+        results = {}
+        try:
+            for name in presets or list(self.MEASURE_PRESETS):
+                preset = dict(self.MEASURE_PRESETS[name])
+                display = preset.pop('display')
+                self._send_measure_settings(channel, preset)
+                self.smu_device.set_display_enabled(display)
+                self.smu_device.sync()
+                self.smu_device.measure_iv(channel) # Erste Messung (z.B. Bereichswahl) nicht mitzählen
+
+                count = 0
+                t0 = time.perf_counter()
+                while True:
+                    self.smu_device.measure_iv(channel)
+                    count += 1
+                    elapsed = time.perf_counter() - t0
+                    if elapsed >= duration and count >= 3:
+                        break
+                results[name] = count / elapsed
+                self.log_mgr.info(f"SMU preset '{name}' on channel {channel}: {results[name]:.1f} readings/s")
+        except Exception as e:
+            self.log_mgr.error(f"Error during SMU measure benchmark: {e}")
+            if isinstance(e, (ConnectionError, serial.SerialException)):
+                self.disconnect()
+                return None
+            results = None
+        self._apply_measure_settings((channel,))
+        return results
+
+    def _load_measure_settings(self) -> dict:
+        """ Liest die Messeinstellungen aus dem Profil (fehlende Werte = Preset 'normal'). """
+        normal = dict(self.MEASURE_PRESETS['normal'])
+        display = normal.pop('display')
+        stored = self.profile_mgr.read(self._measure_settings_key()) or {}
+        settings = {'display': bool(stored.get('display', display))}
+        for ch in ('a', 'b'):
+            settings[ch] = dict(normal)
+            settings[ch].update({key: value for key, value in (stored.get(ch) or {}).items() if key in normal})
+            try:
+                self._validate_measure_settings(settings[ch])
+            except ValueError as e:
+                self.log_mgr.warning(f"Ignoring stored SMU measure settings for channel {ch}: {e}")
+                settings[ch] = dict(normal)
+        return settings
+
+    def _measure_settings_key(self) -> str:
+        """ Profil-Schlüssel der Messeinstellungen (Pool-Geräte speichern getrennt). """
+        return "Smu_MeasureSettings" if self.name is None else f"Smu_MeasureSettings_{self.name}"
+
+    @staticmethod
+    def _validate_measure_settings(settings: dict):
+        """ Prüft die Werte eines Kanals und wirft ValueError bei ungültigen Angaben. """
+        if not 0.001 <= settings['nplc'] <= 25:
+            raise ValueError(f"NPLC {settings['nplc']} out of range (0.001 ... 25).")
+        if settings['autozero'] not in Keithley2602.AUTOZERO_MODES:
+            raise ValueError(f"invalid autozero mode '{settings['autozero']}'.")
+        if settings['delay'] != 'auto' and not (isinstance(settings['delay'], (int, float)) and settings['delay'] >= 0):
+            raise ValueError(f"invalid measure delay '{settings['delay']}'.")
+        if not 1 <= settings['filter_count'] <= 100:
+            raise ValueError(f"filter count {settings['filter_count']} out of range (1 ... 100).")
+
+    def _send_measure_settings(self, channel: str, settings: dict):
+        """ Überträgt die Messeinstellungen eines Kanals (ohne Display) an das Gerät. """
+        with self.smu_device.batch():
+            self.smu_device.set_measure_nplc(channel, settings['nplc'])
+            self.smu_device.set_measure_autozero(channel, settings['autozero'])
+            self.smu_device.set_measure_delay(channel, settings['delay'])
+            self.smu_device.set_measure_filter(channel, settings['filter_count'])
+
+    def _apply_measure_settings(self, channels, display: bool = True):
+        """ Überträgt die gespeicherten Messeinstellungen an das verbundene Gerät. """
+        try:
+            with self.smu_device.batch():
+                for ch in channels:
+                    self._send_measure_settings(ch, self.measure_settings[ch])
+                if display:
+                    self.smu_device.set_display_enabled(self.measure_settings['display'])
+        except Exception as e:
+            self.log_mgr.error(f"Failed to apply SMU measure settings: {e}")
+
+    def simulated_output_current(self, channel: str = 'a') -> float | None:
+        """
+        Ausgangsstrom eines Kanals des DUMMY-Geräts (ohne Messung, ohne I/O-Thread).
+
+        Dient als Lichtquelle des simulierten Spektrometers
+        (`SpectrometerManager.set_simulated_light_source`).
+
+        Returns:
+            float | None: Strom in A, None wenn kein DUMMY verbunden ist.
+        """
+        device = self.smu_device
+        if not isinstance(device, DummyKeithley2602):
+            return None
+        return device.output_current(channel)
+
+    def get_cache_stats(self) -> dict | None:
+        """
+        Gibt die Zähler des Register-Caches im Treiber zurück.
+
+        Der Treiber merkt sich die zuletzt gesendeten Werte von `smuX.source.*`,
+        `smuX.measure.*` und `smuX.sense` und lässt unveränderte Zuweisungen weg
+        (z.B. gleiches Limit bei jedem Sweep-Punkt oder Spinbox-Events ohne
+        Wertänderung).
+
+        Returns:
+            dict | None: {'hits': übersprungene Befehle, 'misses': gesendete Befehle,
+                          'saved_bytes': eingesparte Bytes, 'entries': gemerkte Register}.
+                         None ohne Verbindung.
+
+        Examples:
+            .. code-block:: python
+
+                stats = manager.get_cache_stats()
+                print(f"{stats['hits']} Befehle gespart ({stats['saved_bytes']} Bytes)")
+        """
+        if not self.is_connected():
+            return None
+        return self.smu_device.get_cache_stats()
+
+    def invalidate_cache(self, channel: str | None = None):
+        """
+        Verwirft den Register-Cache, sodass alle folgenden Befehle wieder gesendet werden.
+
+        Nötig, wenn das Gerät am Treiber vorbei geändert wurde (z.B. am Frontpanel).
+
+        Args:
+            channel (str, optional): Nur diesen Kanal verwerfen. None = alle.
+        """
+        if not self._check_connection("invalidate register cache"):
+            return
+        self.smu_device.invalidate_cache(channel)
+        self.log_mgr.debug(f"SMU register cache invalidated ({channel or 'all channels'}).")
+
+    # --- I/O-Trace ---
+
+    @_io()
+    def start_trace(self, max_records: int = 65536, payload_capacity: int = 16 * 1024 * 1024) -> bool:
+        """
+        Startet die binäre Aufzeichnung aller SMU-Lese- und Schreibvorgänge.
+
+        Die Einträge landen mit Zeitstempel in einem vorab allozierten Ringpuffer
+        (siehe `TraceRecorder`). Das zeilenweise Debug-Log der SMU-Kommunikation
+        ist währenddessen abgeschaltet. Gespeichert wird mit `save_trace`, eine
+        gespeicherte Sitzung lässt sich mit `connect("REPLAY:<Datei>")` abspielen.
+
+        Damit das Replay zu `connect` passt, beginnt der Trace mit dem Handshake
+        des Treibers und den Messeinstellungen, die `connect` sendet (sie werden
+        hier erneut übertragen).
+
+        Args:
+            max_records (int): Anzahl der Einträge im Ring.
+            payload_capacity (int): Größe des Datenpuffers in Bytes.
+
+        Returns:
+            bool: True, wenn die Aufzeichnung läuft.
+
+        Examples:
+            Eine Sitzung aufzeichnen und später ohne Gerät reproduzieren:
+
+            .. code-block:: python
+
+                manager.start_trace()
+                manager.sweep_linear('a', -1.0, 1.0, 1000)
+                manager.save_trace("sweep.mltrace")
+                manager.stop_trace()
+
+                manager.connect("REPLAY:sweep.mltrace")
+        """
+        if not self._check_connection("start I/O trace"):
+            return False
+        self.smu_device.start_trace(TraceRecorder(max_records, payload_capacity))
+        # Wie nach connect(), sonst weicht das Replay bei den Messeinstellungen ab
+        self._apply_measure_settings(('a', 'b'))
+        self.log_mgr.info("SMU I/O trace started. Line-by-line SMU debug logging is paused.")
+        return True
+
+    @_io()
+    def stop_trace(self):
+        """ Beendet die Aufzeichnung (bereits gespeicherte Dateien bleiben erhalten). """
+        if self.smu_device is None:
+            return
+        recorder = self.smu_device.stop_trace()
+        if recorder is not None:
+            self.log_mgr.info(f"SMU I/O trace stopped ({len(recorder)} records).")
+
+    @_io()
+    def save_trace(self, path: str) -> int | None:
+        """
+        Speichert den aktuellen Trace als Binärdatei.
+
+        Args:
+            path (str): Zieldatei (Endung üblicherweise '.mltrace').
+
+        Returns:
+            int | None: Anzahl der gespeicherten Einträge, None bei Fehler.
+        """
+        recorder = getattr(self.smu_device, 'trace_recorder', None)
+        if recorder is None:
+            self.log_mgr.warning("Cannot save I/O trace: No trace running.")
+            return None
+        try:
+            count = recorder.dump(path)
+            self.log_mgr.info(f"SMU I/O trace saved to {path} ({count} records).")
+            return count
+        except OSError as e:
+            self.log_mgr.error(f"Failed to save SMU I/O trace: {e}")
+            return None
+
     # --- Daten Erhebung ---
 
+    @_io()
     def measure_iv(self, channel: str) -> tuple[float, float] | None:
         """
         Führt eine einzelne I/V-Messung auf dem Kanal durch.
@@ -503,4 +1327,484 @@ class SmuManager(QObject):
             if isinstance(e, (ConnectionError, serial.SerialException, ValueError)):
                 self.log_mgr.error("Critical error during measurement. Disconnecting SMU.")
                 self.disconnect()
-            return None
\ No newline at end of file
+            return None
+
+    @_io()
+    def set_level_and_measure(self, channel: str, level: float) -> tuple[float, float] | None:
+        """
+        Setzt das Source-Level und misst direkt danach Strom und Spannung.
+
+        Beides geht als eine kurze Zeile an das Gerät (mit der TSP-Bibliothek
+        z.B. `mlLvM(smua,0.5)`), es gibt nur eine Antwort. Für Schleifen, die
+        Punkt für Punkt in Python gesteuert werden, ist das deutlich schneller
+        als `set_source_level` + `measure_iv`. Löst `new_measurement_acquired` aus.
+
+        Args:
+            channel (str): Der Kanal (z.B. 'a').
+            level (float): Das zu setzende Level (in Volt oder Ampere, je nach Source-Funktion).
+
+        Returns:
+            tuple[float, float] | None: (Strom, Spannung) bei Erfolg, None bei einem Fehler.
+
+        Examples:
+            .. code-block:: python
+
+                for v in np.linspace(0, 1, 101):
+                    current, voltage = manager.set_level_and_measure('a', v)
+        """
+        if not self._check_connection(f"set level and measure on {channel}"):
+            return None
+
+        func = self.channel_source_func.get(channel, 'V')
+        try:
+            current, voltage = self.smu_device.set_level_and_measure(channel, level, source_func=func)
+            self.log_mgr.debug(f"SMU Channel {channel} set to {level} ({func}) and measured: C={current}, V={voltage}")
+
+            self.new_measurement_acquired.emit(channel, current, voltage)
+
+            return current, voltage
+
+        except Exception as e:
+            self.log_mgr.error(f"Error during set-and-measure on {channel}: {e}")
+            if isinstance(e, (ConnectionError, serial.SerialException, ValueError)):
+                self.log_mgr.error("Critical error during measurement. Disconnecting SMU.")
+                self.disconnect()
+            return None
+
+    @_io()
+    def measure_iv_all(self, channels=('a', 'b')) -> dict | None:
+        """
+        Misst Strom und Spannung mehrerer Kanäle in einem einzigen Geräte-Roundtrip.
+
+        Typischer Anwendungsfall: Kanal 'a' treibt das Device, Kanal 'b'
+        überwacht eine Photodiode. Beide Werte kommen mit einem gemeinsamen
+        Gerätezeitstempel zurück. Löst `new_measurements_acquired` aus.
+
+        Args:
+            channels (tuple[str, ...]): Die zu messenden Kanäle (Standard: ('a', 'b')).
+
+        Returns:
+            dict | None: {'timestamp': float, 'a': (Strom, Spannung), 'b': (Strom, Spannung)}
+                         bei Erfolg, None bei einem Messfehler.
+
+        Examples:
+            .. code-block:: python
+
+                result = manager.measure_iv_all()
+                if result:
+                    i_dev, v_dev = result['a']
+                    i_pd, _ = result['b']
+                    print(f"t={result['timestamp']:.3f} s: {i_dev} A, Photostrom {i_pd} A")
+        """
+        if not self._check_connection(f"measure IV for {', '.join(channels)}"):
+            return None
+
+        try:
+            result = self.smu_device.measure_iv_multi(tuple(channels))
+            readings = {ch: result[ch] for ch in channels}
+            self.log_mgr.debug(f"SMU Channels measured at t={result['timestamp']}: {readings}")
+
+            self.new_measurements_acquired.emit(result['timestamp'], readings)
+
+            return result
+
+        except Exception as e:
+            self.log_mgr.error(f"Error during multi-channel IV measurement: {e}")
+            if isinstance(e, (ConnectionError, serial.SerialException, ValueError)):
+                self.log_mgr.error("Critical error during measurement. Disconnecting SMU.")
+                self.disconnect()
+            return None
+
+    @_io()
+    def set_and_measure_settled(self, channel: str, level: float, tol: float = 1e-3, max_wait: float = 1.0,
+                                window: int = 3, abs_tol: float | None = None) -> dict | None:
+        """
+        Setzt das Source-Level und misst, bis der Wert eingeschwungen ist.
+
+        Ersetzt das feste `time.sleep(...)` zwischen `set_source_level` und
+        `measure_iv`: Es wird so lange gemessen, bis die letzten `window`
+        Werte um höchstens `tol * |Mittelwert| + abs_tol` streuen. Bei einer
+        echten 2602 läuft die Schleife als TSP-Funktion auf dem Gerät.
+        Beobachtet wird der Strom bei Spannungsquelle, sonst die Spannung.
+        Löst `new_measurement_acquired` mit dem eingeschwungenen Wert aus.
+
+        Args:
+            channel (str): Der Kanal (z.B. 'a').
+            level (float): Das zu setzende Level (in Volt oder Ampere).
+            tol (float): Relative Toleranz (Standard: 0.1 %).
+            max_wait (float): Maximale Wartezeit in Sekunden.
+            window (int): Anzahl aufeinanderfolgender Werte, die übereinstimmen müssen.
+            abs_tol (float, optional): Absolute Toleranz für Werte nahe 0
+                                       (None = 1 nA bzw. 10 uV).
+
+        Returns:
+            dict | None: {'current', 'voltage', 'settle_time' [s], 'settled' (bool)}
+                         bei Erfolg, None bei einem Fehler.
+
+        Examples:
+            .. code-block:: python
+
+                result = manager.set_and_measure_settled('a', 0.5, tol=1e-3, max_wait=0.5)
+                if result:
+                    print(f"{result['current']} A nach {result['settle_time'] * 1e3:.1f} ms")
+        """
+        if not self._check_connection(f"settled measurement for {channel}"):
+            return None
+
+        func = self.channel_source_func.get(channel, 'V')
+        try:
+            result = self.smu_device.set_and_measure_settled(channel, level, source_func=func, tol=tol,
+                                                             abs_tol=abs_tol, window=window, max_wait=max_wait)
+            if not result['settled']:
+                self.log_mgr.warning(f"SMU Channel {channel} did not settle within {max_wait} s at level {level}.")
+            self.log_mgr.debug(f"SMU Channel {channel} settled after {result['settle_time']:.4f} s: "
+                               f"C={result['current']}, V={result['voltage']}")
+
+            self.new_measurement_acquired.emit(channel, result['current'], result['voltage'])
+
+            return result
+
+        except Exception as e:
+            self.log_mgr.error(f"Error during settled measurement on {channel}: {e}")
+            if isinstance(e, (ConnectionError, serial.SerialException, ValueError)):
+                self.log_mgr.error("Critical error during measurement. Disconnecting SMU.")
+                self.disconnect()
+            return None
+
+    # --- Streaming ---
+
+    def start_stream(self, channels=('a', 'b'), interval: float = 0.0, block_interval: float = 0.1,
+                     capacity: int = 1_000_000) -> bool:
+        """
+        Startet die kontinuierliche Messung in einem Hintergrund-Thread.
+
+        Die Samples (Host-Zeitstempel aus `time.monotonic()` seit Start, Strom
+        und Spannung pro Kanal) landen in einem vorab allozierten Ringpuffer
+        (`stream_buffer`). Die GUI bekommt alle `block_interval` Sekunden einen
+        Block über `stream_block_acquired`, statt eines Signals pro Sample.
+        Skripte lesen im eigenen Takt mit `read_stream`.
+
+        Andere Befehle (z.B. `set_source_level`) sind währenddessen weiter
+        möglich, sie werden zwischen zwei Samples ausgeführt.
+
+        Args:
+            channels (tuple[str, ...]): Zu messende Kanäle.
+            interval (float): Mindestabstand zwischen Samples in s (0 = so schnell wie möglich).
+            block_interval (float): Takt der Block-Signale in s.
+            capacity (int): Größe des Ringpuffers in Samples.
+
+        Returns:
+            bool: True, wenn das Streaming gestartet wurde.
+
+        Examples:
+            Stabilitätsmessung, die alle Sekunde in die HDF5-Datei schreibt:
+
+            .. code-block:: python
+
+                manager.start_stream(('a',))
+                cursor = 0
+                while running:
+                    time.sleep(1.0)
+                    cursor, data, lost = manager.read_stream(cursor)
+                    current, voltage = data['a']
+                    export_mgr.add_many("Time", data['timestamp'], "s")
+                    export_mgr.add_many("Current", current, "A")
+                    export_mgr.add_many("Voltage", voltage, "V")
+                    export_mgr.commit_many()
+                manager.stop_stream()
+        """
+        if not self._check_connection("start streaming"):
+            return False
+        self.stop_stream()
+
+        self.stream_buffer = SampleRingBuffer(tuple(channels), capacity)
+        # Das zeilenweise Debug-Log würde bei tausenden Samples/s selbst zum Flaschenhals
+        self._stream_log_io = self.smu_device.log_io
+        self.smu_device.log_io = False
+        self._stream_worker = SmuStreamWorker(self.smu_device, self.stream_buffer, interval, block_interval,
+                                              on_block=self.stream_block_acquired.emit,
+                                              on_error=self._on_stream_error)
+        self._stream_worker.start()
+        self.log_mgr.info(f"SMU streaming started on channel(s) {', '.join(channels)}.")
+        self.stream_state_changed.emit(True)
+        return True
+
+    def stop_stream(self):
+        """ Beendet das Streaming. Der Ringpuffer bleibt bis zum nächsten Start erhalten. """
+        if self._stream_worker is None:
+            return
+        worker, self._stream_worker = self._stream_worker, None
+        worker.stop()
+        if self.smu_device is not None:
+            self.smu_device.log_io = self._stream_log_io
+        duration = time.monotonic() - worker.t0
+        rate = self.stream_buffer.total / duration if duration > 0 else 0.0
+        self.log_mgr.info(f"SMU streaming stopped: {self.stream_buffer.total} samples ({rate:.0f} samples/s).")
+        self.stream_state_changed.emit(False)
+
+    def is_streaming(self) -> bool:
+        """ Gibt zurück, ob gerade gestreamt wird. """
+        return self._stream_worker is not None and self._stream_worker.is_alive()
+
+    def read_stream(self, cursor: int = 0) -> tuple[int, dict | None, int]:
+        """
+        Liefert alle Stream-Samples seit `cursor`.
+
+        Args:
+            cursor (int): Rückgabewert des letzten Aufrufs (0 beim ersten Mal).
+
+        Returns:
+            tuple[int, dict | None, int]: (neuer Cursor, Daten wie bei `stream_block_acquired`,
+                                           Anzahl verlorener Samples). Ohne Stream (cursor, None, 0).
+        """
+        if self.stream_buffer is None:
+            return cursor, None, 0
+        cursor, rows, lost = self.stream_buffer.read_since(cursor)
+        if lost:
+            self.log_mgr.warning(f"SMU stream reader too slow: {lost} samples overwritten.")
+        return cursor, self.stream_buffer.as_dict(rows), lost
+
+    def _on_stream_error(self, error: Exception):
+        """ Wird im Stream-Thread aufgerufen, wenn eine Messung fehlschlägt. """
+        self.log_mgr.error(f"Error during SMU streaming, stream stopped: {error}")
+        self.stream_state_changed.emit(False)
+
+    # --- Sweeps (auf dem Gerät) ---
+
+    @_io()
+    def sweep_linear(self, channel: str, start: float, stop: float, points: int,
+                     limit: float | None = None, settle_delay: float | None = None) -> dict | None:
+        """
+        Führt einen linearen Sweep komplett auf dem Gerät aus (TSP-Trigger-Modell).
+
+        Alle Punkte werden in den Messpuffer der SMU geschrieben und anschließend
+        in einer einzigen Übertragung als numpy-Arrays zurückgelesen. Die Source-
+        Funktion (V oder A) wird aus `set_source_voltage`/`set_source_current`
+        übernommen. Nach dem Sweep ist der Ausgang ausgeschaltet.
+
+        Args:
+            channel (str): Der Kanal (z.B. 'a').
+            start (float): Start-Level (in Volt oder Ampere).
+            stop (float): End-Level (in Volt oder Ampere).
+            points (int): Anzahl der Sweep-Punkte.
+            limit (float, optional): Compliance während des Sweeps (A bzw. V).
+            settle_delay (float, optional): Wartezeit pro Punkt in Sekunden
+                                            None = eingestellte Messverzögerung
+                                            (siehe `set_measure_settings`).
+
+        Returns:
+            dict | None: Dict mit den numpy-Arrays 'current', 'voltage', 'source'
+                         und 'timestamp'. None bei einem Fehler.
+
+        Examples:
+            Eine I/V-Kennlinie mit 1000 Punkten aufnehmen:
+
+            .. code-block:: python
+
+                manager.set_source_voltage('a')
+                result = manager.sweep_linear('a', -1.0, 1.0, 1000, limit=0.01)
+                if result:
+                    print(result['voltage'], result['current'])
+        """
+        return self._run_sweep("linear sweep", channel, 'sweep_linear',
+                               start, stop, points, limit=limit, settle_delay=settle_delay)
+
+    @_io()
+    def sweep_log(self, channel: str, start: float, stop: float, points: int,
+                  limit: float | None = None, settle_delay: float | None = None) -> dict | None:
+        """
+        Führt einen logarithmischen Sweep komplett auf dem Gerät aus.
+
+        `start` und `stop` müssen dasselbe Vorzeichen haben und ungleich 0 sein.
+        Parameter und Rückgabe wie bei `sweep_linear`.
+
+        Examples:
+            Strom logarithmisch von 1 nA bis 10 mA treiben:
+
+            .. code-block:: python
+
+                manager.set_source_current('a')
+                result = manager.sweep_log('a', 1e-9, 1e-2, 71, limit=10.0)
+        """
+        return self._run_sweep("log sweep", channel, 'sweep_log',
+                               start, stop, points, limit=limit, settle_delay=settle_delay)
+
+    @_io()
+    def sweep_list(self, channel: str, levels, limit: float | None = None,
+                   settle_delay: float | None = None) -> dict | None:
+        """
+        Führt einen Sweep über eine beliebige Liste von Levels auf dem Gerät aus.
+
+        Args:
+            channel (str): Der Kanal (z.B. 'a').
+            levels (list[float] | numpy.ndarray): Die anzufahrenden Source-Levels.
+            limit (float, optional): Compliance während des Sweeps (A bzw. V).
+            settle_delay (float, optional): Wartezeit pro Punkt in Sekunden
+                                            (None = eingestellte Messverzögerung).
+
+        Returns:
+            dict | None: Wie bei `sweep_linear`.
+
+        Examples:
+            Hin- und Rück-Sweep (Hysterese):
+
+            .. code-block:: python
+
+                up = np.linspace(0, 2, 51)
+                result = manager.sweep_list('a', np.concatenate([up, up[::-1]]))
+        """
+        return self._run_sweep("list sweep", channel, 'sweep_list',
+                               levels, limit=limit, settle_delay=settle_delay)
+
+    @_io()
+    def acquire_timed(self, channel: str, interval: float, count: int, source_level: float | None = None,
+                      limit: float | None = None, output_off: bool = True) -> dict | None:
+        """
+        Nimmt einen I/V-Verlauf mit festem Zeitabstand auf (z.B. Einschaltvorgang, Degradation).
+
+        Der Takt kommt vom Trigger-Timer der SMU, nicht aus Python. Damit sind
+        Abstände unter einer Millisekunde möglich, sofern die Messung selbst
+        schnell genug ist (siehe `set_measure_settings(preset='fast')`). Der
+        Ausgang wird direkt vor dem ersten Punkt eingeschaltet. Alle Werte werden
+        am Ende in einer binären Übertragung gelesen.
+
+        Args:
+            channel (str): Der Kanal (z.B. 'a').
+            interval (float): Abstand der Messpunkte in Sekunden.
+            count (int): Anzahl der Messpunkte.
+            source_level (float, optional): Source-Level (V oder A). None = aktuelles Level.
+            limit (float, optional): Compliance (A bzw. V).
+            output_off (bool): Ausgang nach der Aufnahme ausschalten.
+
+        Returns:
+            dict | None: Wie bei `sweep_linear` ('timestamp' ist die Gerätezeit in s).
+
+        Examples:
+            Einschaltvorgang mit 0.5 ms Auflösung über 100 ms:
+
+            .. code-block:: python
+
+                manager.set_measure_settings('a', preset='fast')
+                result = manager.acquire_timed('a', interval=0.5e-3, count=200, source_level=2.0)
+                if result:
+                    t = result['timestamp'] - result['timestamp'][0]
+        """
+        return self._run_sweep("timed acquisition", channel, 'acquire_timed', interval, count,
+                               source_level=source_level, limit=limit, output_off=output_off)
+
+    @_io()
+    def read_buffer(self, channel: str, buffer: str = "nvbuffer1") -> dict | None:
+        """
+        Liest einen kompletten Messpuffer der SMU binär (REAL64) aus.
+
+        Die Übertragung erfolgt als ein Block Rohdaten, der direkt mit numpy
+        dekodiert wird. Auch zehntausende Punkte sind so in Millisekunden
+        eingelesen.
+
+        Args:
+            channel (str): Der Kanal (z.B. 'a').
+            buffer (str): Der Gerätepuffer ('nvbuffer1' oder 'nvbuffer2').
+
+        Returns:
+            dict | None: Dict mit den numpy-Arrays 'readings', 'source' und
+                         'timestamp'. None bei einem Fehler.
+
+        Examples:
+            .. code-block:: python
+
+                data = manager.read_buffer('a')
+                if data:
+                    print(f"{len(data['readings'])} Punkte gelesen")
+        """
+        if not self._check_connection(f"read buffer {buffer} of {channel}"):
+            return None
+        try:
+            return self.smu_device.read_buffer(channel, buffer)
+        except Exception as e:
+            self.log_mgr.error(f"Error reading buffer {buffer} of {channel}: {e}")
+            return None
+
+    def _run_sweep(self, command_name: str, channel: str, driver_method: str, *args, **kwargs) -> dict | None:
+        """
+        Interne Hilfsfunktion für alle Sweep-Arten und `acquire_timed` (Verbindungsprüfung, Fehlerbehandlung).
+        """
+        if not self._check_connection(f"run {command_name} on {channel}"):
+            return None
+
+        func = self.channel_source_func.get(channel, 'V')
+        try:
+            start_time = time.perf_counter()
+            result = getattr(self.smu_device, driver_method)(channel, *args, source_func=func, **kwargs)
+            duration = time.perf_counter() - start_time
+            self.log_mgr.info(f"SMU Channel {channel} {command_name}: "
+                              f"{len(result['current'])} points in {duration:.2f} s.")
+            return result
+
+        except Exception as e:
+            self.log_mgr.error(f"Error during {command_name} on {channel}: {e}")
+            if isinstance(e, (ConnectionError, serial.SerialException)):
+                self.log_mgr.error("Critical error during sweep. Disconnecting SMU.")
+                self.disconnect()
+            return None
+
+    # --- asyncio-Fassade ---
+
+    def _run_async(self, method, *args, **kwargs):
+        """
+        Führt eine Manager-Methode im SMU-I/O-Thread aus und liefert ein awaitable.
+
+        Der I/O-Thread sorgt dafür, dass Zugriffe auf die SMU nacheinander
+        erfolgen, während andere Geräte parallel arbeiten.
+        """
+        return asyncio.wrap_future(self._io_thread.submit(method, *args, **kwargs))
+
+    async def measure_iv_async(self, channel: str) -> tuple[float, float] | None:
+        """
+        Wie `measure_iv`, aber als Coroutine für asyncio-Experimente.
+
+        Examples:
+            SMU und Spektrometer gleichzeitig messen, die Wartezeiten überlappen:
+
+            .. code-block:: python
+
+                async def step():
+                    iv, (wl, intensities) = await asyncio.gather(
+                        api.smu_mgr.measure_iv_async('a'),
+                        api.spectrometer_mgr.acquire_spectrum_async(),
+                    )
+
+                asyncio.run(step())
+        """
+        return await self._run_async(self.measure_iv, channel)
+
+    async def measure_iv_all_async(self, channels=('a', 'b')) -> dict | None:
+        """ Wie `measure_iv_all`, aber als Coroutine. """
+        return await self._run_async(self.measure_iv_all, channels)
+
+    async def set_source_level_async(self, channel: str, level: float):
+        """ Wie `set_source_level`, aber als Coroutine. """
+        return await self._run_async(self.set_source_level, channel, level)
+
+    async def set_output_state_async(self, channel: str, enable: bool):
+        """ Wie `set_output_state`, aber als Coroutine. """
+        return await self._run_async(self.set_output_state, channel, enable)
+
+    async def configure_channel_async(self, channel: str, **settings) -> bool:
+        """ Wie `configure_channel`, aber als Coroutine. """
+        return await self._run_async(self.configure_channel, channel, **settings)
+
+    async def wait_complete_async(self) -> bool:
+        """ Wie `wait_complete`, aber als Coroutine. """
+        return await self._run_async(self.wait_complete)
+
+    async def sweep_linear_async(self, channel: str, start: float, stop: float, points: int, **kwargs) -> dict | None:
+        """ Wie `sweep_linear`, aber als Coroutine. """
+        return await self._run_async(self.sweep_linear, channel, start, stop, points, **kwargs)
+
+    async def sweep_log_async(self, channel: str, start: float, stop: float, points: int, **kwargs) -> dict | None:
+        """ Wie `sweep_log`, aber als Coroutine. """
+        return await self._run_async(self.sweep_log, channel, start, stop, points, **kwargs)
+
+    async def sweep_list_async(self, channel: str, levels, **kwargs) -> dict | None:
+        """ Wie `sweep_list`, aber als Coroutine. """
+        return await self._run_async(self.sweep_list, channel, levels, **kwargs)
@@ -0,0 +1,201 @@
+# modules/smu/SmuPool.py
+"""
+================================================================================
+Mehrere SMUs unter logischen Namen
+================================================================================
+
+Der `SmuPool` verwaltet beliebig viele SMUs (z.B. mehrere 2602 für mehrere
+Pixel gleichzeitig). Jedes Gerät ist ein eigener `SmuManager` mit eigenem
+I/O-Thread, Befehle an verschiedene Geräte laufen also parallel.
+
+Kanäle werden als "<gerät>.<kanal>" angesprochen, z.B. "smu1.a". Die Haupt-SMU
+der GUI ist als "smu1" im Pool enthalten.
+
+TSP-Link-Knoten (mehrere Geräte hinter einer Verbindung) werden noch nicht
+unterstützt; jedes Gerät braucht eine eigene Verbindung.
+"""
+
+import time
+
+import numpy as np
+from PySide6.QtCore import Signal
+
+from core.InstrumentPool import InstrumentPool
+from .SmuManager import SmuManager
+
+
+class SmuPool(InstrumentPool):
+    """
+    Verwaltet mehrere SMUs und bietet Operationen über alle Geräte.
+
+    Die Geräte (außer der Haupt-SMU) werden im Profil unter `Smu_Pool`
+    gespeichert ({name: port}) und mit `connect_saved` wieder verbunden
+    (siehe `InstrumentPool`).
+
+    Args:
+        log_manager: LogManager-Instanz.
+        profile_manager: ProfileManager-Instanz.
+        primary (SmuManager, optional): Haupt-SMU der GUI, wird als `primary_name` eingetragen.
+        primary_name (str): Logischer Name der Haupt-SMU.
+
+    Signale:
+        instruments_changed (list):
+            Wird ausgelöst, wenn ein Gerät hinzugefügt oder entfernt wurde.
+            Args: (list: Namen aller Geräte).
+
+        measurements_acquired (object):
+            Wird nach `measure_all` ausgelöst.
+            Args: (dict: Ergebnis von `measure_all`).
+
+    Examples:
+        .. code-block:: python
+
+            pool.add_instrument("smu2", "COM4")
+            pool.add_instrument("smu3", "192.168.0.12")
+    """
+
+    MANAGER_CLASS = SmuManager
+    PROFILE_KEY = "Smu_Pool"
+    KIND = "SMU"
+    NAME_RULE = "must not be empty or contain '.'"
+
+    CHANNELS = ('a', 'b')
+    """tuple[str, ...]: Kanäle pro Gerät."""
+
+    measurements_acquired = Signal(object)
+
+    def __init__(self, log_manager, profile_manager, primary: SmuManager | None = None,
+                 primary_name: str = "smu1"):
+        super().__init__(log_manager, profile_manager, primary, primary_name)
+
+    def _is_valid_name(self, name: str) -> bool:
+        # Der Punkt trennt Gerät und Kanal ("smu1.a")
+        return bool(name) and '.' not in name
+
+    # --- Adressierung ---
+
+    def resolve(self, address: str) -> tuple[SmuManager, str]:
+        """
+        Zerlegt eine Kanal-Adresse.
+
+        Args:
+            address (str): "<gerät>.<kanal>", z.B. "smu1.a".
+
+        Returns:
+            tuple[SmuManager, str]: (Manager des Geräts, Kanal)
+
+        Raises:
+            ValueError: Bei ungültiger Adresse.
+            KeyError: Wenn das Gerät nicht im Pool ist.
+        """
+        name, _, channel = address.rpartition('.')
+        if not name or channel not in self.CHANNELS:
+            raise ValueError(f"Invalid SMU channel address '{address}' (expected e.g. 'smu1.a').")
+        return self.manager(name), channel
+
+    def channels(self, connected_only: bool = True) -> list[str]:
+        """ Adressen aller Kanäle, z.B. ['smu1.a', 'smu1.b', 'smu2.a', 'smu2.b']. """
+        return [f"{name}.{ch}" for name, manager in self._managers.items()
+                if manager.is_connected() or not connected_only
+                for ch in self.CHANNELS]
+
+    def call(self, address: str, method_name: str, *args, **kwargs):
+        """
+        Ruft eine kanalbezogene `SmuManager`-Methode für eine Adresse auf.
+
+        Examples:
+            .. code-block:: python
+
+                pool.call("smu2.b", "sweep_linear", 0.0, 2.0, 21)
+        """
+        manager, channel = self.resolve(address)
+        return getattr(manager, method_name)(channel, *args, **kwargs)
+
+    def measure_iv(self, address: str) -> tuple[float, float] | None:
+        """ Wie `SmuManager.measure_iv`, aber mit Adresse. """
+        return self.call(address, 'measure_iv')
+
+    def set_level_and_measure(self, address: str, level: float) -> tuple[float, float] | None:
+        """ Wie `SmuManager.set_level_and_measure`, aber mit Adresse. """
+        return self.call(address, 'set_level_and_measure', level)
+
+    def set_source_level(self, address: str, level: float):
+        """ Wie `SmuManager.set_source_level`, aber mit Adresse. """
+        return self.call(address, 'set_source_level', level)
+
+    def set_output_state(self, address: str, enable: bool):
+        """ Wie `SmuManager.set_output_state`, aber mit Adresse. """
+        return self.call(address, 'set_output_state', enable)
+
+    def configure_channel(self, address: str, **settings) -> bool:
+        """ Wie `SmuManager.configure_channel`, aber mit Adresse. """
+        return self.call(address, 'configure_channel', **settings)
+
+    # --- Operationen über alle Geräte ---
+
+    def measure_all(self, addresses=None) -> dict | None:
+        """
+        Misst alle (oder die angegebenen) Kanäle auf allen Geräten.
+
+        Jedes Gerät misst seine Kanäle in einem Roundtrip, die Geräte
+        arbeiten parallel. Das Ergebnis ist eine Zeile mit gemeinsamem
+        Zeitstempel (Mitte des Messzeitraums, Sekunden seit Erstellung des
+        Pools). Kanäle, deren Messung fehlschlägt, sind NaN.
+
+        Args:
+            addresses (list[str], optional): Kanal-Adressen. None = alle verbundenen Kanäle.
+
+        Returns:
+            dict | None: {'timestamp': float,
+                          'columns': ['timestamp', 'smu1.a_current', 'smu1.a_voltage', ...],
+                          'data': ndarray (Werte in der Reihenfolge von 'columns'),
+                          'smu1.a': (Strom, Spannung), ...}
+                         None, wenn kein Kanal verbunden ist.
+
+        Examples:
+            .. code-block:: python
+
+                result = pool.measure_all()
+                export_mgr.add_many("Pixel currents", result['data'][1::2], "A")
+                i_pixel2, v_pixel2 = result['smu2.a']
+        """
+        addresses = self.channels() if addresses is None else list(addresses)
+        if not addresses:
+            self.log_mgr.warning("measure_all: no SMU channel connected.")
+            return None
+
+        by_instrument = self._group(addresses)
+        start = time.monotonic()
+        results = self._parallel({name: ('measure_iv_all', (tuple(channels),), {})
+                                  for name, channels in by_instrument.items()})
+        timestamp = (start + time.monotonic()) / 2 - self.t0
+
+        data = [timestamp]
+        result = {'timestamp': timestamp, 'columns': ['timestamp']}
+        for address in addresses:
+            name, _, channel = address.rpartition('.')
+            readings = results.get(name)
+            current, voltage = readings[channel] if readings else (float('nan'), float('nan'))
+            result[address] = (current, voltage)
+            result['columns'] += [f"{address}_current", f"{address}_voltage"]
+            data += [current, voltage]
+        result['data'] = np.array(data, dtype=np.float64)
+
+        self.measurements_acquired.emit(result)
+        return result
+
+    def set_output_all(self, enable: bool):
+        """ Schaltet die Ausgänge aller Kanäle auf allen verbundenen Geräten (parallel). """
+        futures = [self._managers[name].submit('set_output_state', ch, enable)
+                   for name, channels in self._group(self.channels()).items() for ch in channels]
+        for future in futures:
+            future.result()
+
+    def _group(self, addresses) -> dict[str, list[str]]:
+        """ Prüft die Adressen und gruppiert sie nach Gerät: {name: [kanal, ...]}. """
+        by_instrument = {}
+        for address in addresses:
+            self.resolve(address)
+            name, _, channel = address.rpartition('.')
+            by_instrument.setdefault(name, []).append(channel)
+        return by_instrument
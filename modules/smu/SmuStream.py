@@ -0,0 +1,171 @@
+# modules/smu/SmuStream.py
+"""
+================================================================================
+Kontinuierliche SMU-Datenaufnahme (Streaming)
+================================================================================
+
+`SmuStreamWorker` misst in einem Hintergrund-Thread so schnell wie möglich
+(oder mit festem Intervall) einen oder beide Kanäle und schreibt die Werte in
+einen vorab allozierten `SampleRingBuffer`.
+
+Konsumenten holen sich die Daten in ihrem eigenen Takt:
+    - GUI/Plots bekommen in festen Abständen einen Block (Callback/Signal)
+    - Skripte/Export lesen mit `read_since(cursor)` alle neuen Samples
+    - Übersichten nutzen `decimated(max_points)`
+"""
+
+import threading
+import time
+
+import numpy as np
+
+
+class SampleRingBuffer:
+    """
+    Thread-sicherer Ringpuffer für Mehrkanal-Samples.
+
+    Jede Zeile enthält den Zeitstempel und Strom/Spannung pro Kanal. Der
+    Puffer wird einmal alloziert, ältere Samples werden überschrieben.
+
+    Args:
+        channels (tuple[str, ...]): Kanäle, z.B. ('a', 'b').
+        capacity (int): Anzahl der Samples im Ring.
+    """
+
+    def __init__(self, channels=('a', 'b'), capacity: int = 1_000_000):
+        self.channels = tuple(channels)
+        self.capacity = capacity
+        self.columns = ['timestamp'] + [f"{ch}_{kind}" for ch in self.channels for kind in ('current', 'voltage')]
+        self._data = np.full((capacity, len(self.columns)), np.nan, dtype=np.float64)
+        self._total = 0
+        self._lock = threading.Lock()
+
+    @property
+    def total(self) -> int:
+        """ Anzahl aller jemals geschriebenen Samples (dient als Cursor). """
+        return self._total
+
+    def __len__(self) -> int:
+        return min(self._total, self.capacity)
+
+    def append(self, row):
+        """ Fügt ein Sample hinzu (Reihenfolge wie `columns`). """
+        with self._lock:
+            self._data[self._total % self.capacity] = row
+            self._total += 1
+
+    def _slice(self, start: int, stop: int) -> np.ndarray:
+        """ Kopiert die Samples [start, stop) (absolute Indizes, Lock muss gehalten werden). """
+        first, last = start % self.capacity, stop % self.capacity
+        if stop - start == 0:
+            return np.empty((0, len(self.columns)))
+        if first < last:
+            return self._data[first:last].copy()
+        return np.concatenate((self._data[first:], self._data[:last]))
+
+    def read_since(self, cursor: int) -> tuple[int, np.ndarray, int]:
+        """
+        Liefert alle Samples ab `cursor`.
+
+        Args:
+            cursor (int): Wert von `total` beim letzten Lesen (0 beim ersten Mal).
+
+        Returns:
+            tuple[int, np.ndarray, int]: (neuer Cursor, Samples [N x Spalten],
+                                          Anzahl verlorener Samples, weil der Leser zu langsam war)
+        """
+        with self._lock:
+            total = self._total
+            start = max(cursor, total - self.capacity)
+            return total, self._slice(start, total), start - cursor
+
+    def latest(self, count: int) -> np.ndarray:
+        """ Die letzten `count` Samples. """
+        with self._lock:
+            count = min(count, len(self))
+            return self._slice(self._total - count, self._total)
+
+    def decimated(self, max_points: int) -> np.ndarray:
+        """ Alle gespeicherten Samples, gleichmäßig auf höchstens `max_points` ausgedünnt. """
+        with self._lock:
+            data = self._slice(self._total - len(self), self._total)
+        step = max(1, int(np.ceil(len(data) / max_points)))
+        return data[::step]
+
+    def as_dict(self, rows: np.ndarray) -> dict:
+        """
+        Wandelt Samples in das Format von `SmuManager.measure_iv_all` (mit Arrays) um.
+
+        Returns:
+            dict: {'timestamp': ndarray, 'a': (Strom-ndarray, Spannungs-ndarray), ...}
+        """
+        result = {'timestamp': rows[:, 0]}
+        for index, ch in enumerate(self.channels):
+            result[ch] = (rows[:, 1 + 2 * index], rows[:, 2 + 2 * index])
+        return result
+
+
+class SmuStreamWorker(threading.Thread):
+    """
+    Hintergrund-Thread, der kontinuierlich misst und in einen `SampleRingBuffer` schreibt.
+
+    Args:
+        driver: SMU-Treiber mit `measure_iv_multi(channels)`.
+        buffer (SampleRingBuffer): Zielpuffer.
+        interval (float): Mindestabstand zwischen zwei Samples in Sekunden (0 = so schnell wie möglich).
+        block_interval (float): Abstand, in dem `on_block` mit den neuen Samples aufgerufen wird.
+        on_block (callable, optional): Wird mit dem Dict aus `SampleRingBuffer.as_dict` aufgerufen.
+        on_error (callable, optional): Wird mit der Exception aufgerufen, wenn die Messung abbricht.
+    """
+
+    def __init__(self, driver, buffer: SampleRingBuffer, interval: float = 0.0, block_interval: float = 0.1,
+                 on_block=None, on_error=None):
+        super().__init__(name="SmuStream", daemon=True)
+        self.driver = driver
+        self.buffer = buffer
+        self.interval = interval
+        self.block_interval = block_interval
+        self.on_block = on_block
+        self.on_error = on_error
+        self._stop_event = threading.Event()
+        self.t0 = time.monotonic()
+
+    def stop(self, timeout: float = 2.0):
+        """ Beendet die Messung und wartet auf das Thread-Ende. """
+        self._stop_event.set()
+        if self.is_alive() and threading.current_thread() is not self:
+            self.join(timeout)
+
+    def run(self):
+        channels = self.buffer.channels
+        cursor = 0
+        next_block = time.monotonic() + self.block_interval
+        next_sample = time.monotonic()
+        try:
+            while not self._stop_event.is_set():
+                if self.interval > 0:
+                    delay = next_sample - time.monotonic()
+                    if delay > 0 and self._stop_event.wait(delay):
+                        break
+                    next_sample += self.interval
+
+                result = self.driver.measure_iv_multi(channels)
+                row = [time.monotonic() - self.t0]
+                for ch in channels:
+                    row.extend(result[ch])
+                self.buffer.append(row)
+
+                if time.monotonic() >= next_block:
+                    cursor = self._emit_block(cursor)
+                    next_block = time.monotonic() + self.block_interval
+        except Exception as e:
+            if self.on_error is not None:
+                self.on_error(e)
+        finally:
+            self._emit_block(cursor)
+
+    def _emit_block(self, cursor: int) -> int:
+        cursor, rows, _ = self.buffer.read_since(cursor)
+        if len(rows) and self.on_block is not None:
+            self.on_block(self.buffer.as_dict(rows))
+        return cursor
@@ -135,6 +135,8 @@ class SmuWidget(QWidget, Ui_Form):
         self.smu_mgr.connection_status_changed.connect(self.on_connection_status_changed)
         self.smu_mgr.device_list_updated.connect(self.on_device_list_updated)
         self.smu_mgr.new_measurement_acquired.connect(self.on_new_measurement_acquired)
+        self.smu_mgr.new_measurements_acquired.connect(self.on_new_measurements_acquired)
+        self.smu_mgr.stream_block_acquired.connect(self.on_stream_block_acquired)
 
         # 2. UI-Elemente (Verbindung)
         self.pushButton_connect.clicked.connect(self.on_connect_clicked)
@@ -331,19 +333,47 @@ class SmuWidget(QWidget, Ui_Form):
             self.label_currentB.setText(formatted_current)
             self.modelB.insertRow(0, [item_time, item_volt, item_curr])
 
+    @Slot(float, dict)
+    def on_new_measurements_acquired(self, timestamp, readings):
+        """
+        Verteilt eine gemeinsame Mehrkanal-Messung auf die Kanal-Anzeigen.
+        """
+        for channel, (current, voltage) in readings.items():
+            self.on_new_measurement_acquired(channel, current, voltage)
+
+    @Slot(object)
+    def on_stream_block_acquired(self, block):
+        """
+        Zeigt beim Streaming nur den jeweils letzten Wert eines Blocks an.
+
+        Die Tabelle wird dabei nicht befüllt (tausende Zeilen pro Sekunde),
+        die vollständigen Daten liegen im Ringpuffer des Managers.
+        """
+        for channel, (current, voltage) in block.items():
+            if channel == 'timestamp' or not len(current):
+                continue
+            formatted_voltage = self._format_si(float(voltage[-1]), "V")
+            formatted_current = self._format_si(float(current[-1]), "A")
+            if channel == 'a':
+                self.label_voltageA.setText(formatted_voltage)
+                self.label_currentA.setText(formatted_current)
+            elif channel == 'b':
+                self.label_voltageB.setText(formatted_voltage)
+                self.label_currentB.setText(formatted_current)
+
     # --- Slots für UI-Aktionen (Verbindung) ---
 
     @Slot()
     def on_connect_clicked(self):
         """Wird aufgerufen, wenn der Verbinden/Trennen-Button geklickt wird."""
         if self.smu_mgr.is_connected():
-            self.smu_mgr.disconnect()
+            self.smu_mgr.request('disconnect')
         else:
             selected_port = self.comboBox_port.currentText()
             if not selected_port:
                 self.log_mgr.warning("Kein SMU-Port zur Verbindung ausgewählt.")
                 return
-            self.smu_mgr.connect(selected_port)
+            self.smu_mgr.request('connect', selected_port)
 
     # --- Hilfsfunktion für Reset (aktualisiert) ---
     
@@ -393,17 +423,17 @@ class SmuWidget(QWidget, Ui_Form):
 
     @Slot()
     def on_measure_A_clicked(self):
-        self.smu_mgr.measure_iv('a')
+        self.smu_mgr.request('measure_iv', 'a')
 
     @Slot()
     def on_reset_A_clicked(self):
-        self.smu_mgr.reset_channel('a')
+        self.smu_mgr.request('reset_channel', 'a')
         self.modelA.setRowCount(0) # Tabelle leeren
         self._sync_ui_to_reset_state('a') # UI auf Default setzen
 
     @Slot(bool)
     def on_output_A_toggled(self, is_on):
-        self.smu_mgr.set_output_state('a', is_on)
+        self.smu_mgr.request('set_output_state', 'a', is_on)
         self.pushButton_outputA.setText("ON" if is_on else "OFF")
 
     @Slot()
@@ -411,9 +441,9 @@ class SmuWidget(QWidget, Ui_Form):
         # Wird getriggert, wenn V ODER C gecheckt wird
         # Nur senden, wenn der Button auch wirklich 'checked' ist
         if self.pushButton_voltageA.isChecked():
-            self.smu_mgr.set_source_voltage('a')
+            self.smu_mgr.request('set_source_voltage', 'a')
         elif self.pushButton_currentA.isChecked():
-            self.smu_mgr.set_source_current('a')
+            self.smu_mgr.request('set_source_current', 'a')
         # IMMER die Labels aktualisieren
         self._update_channel_labels('a')
 
@@ -421,15 +451,15 @@ class SmuWidget(QWidget, Ui_Form):
     def on_sense_A_changed(self):
         # Wird getriggert, wenn Local ODER Remote gecheckt wird
         if self.pushButton_remoteA.isChecked():
-            self.smu_mgr.set_sense_remote('a')
+            self.smu_mgr.request('set_sense_remote', 'a')
         elif self.pushButton_localA.isChecked():
-            self.smu_mgr.set_sense_local('a')
+            self.smu_mgr.request('set_sense_local', 'a')
     
     @Slot()
     def on_level_A_changed(self):
         try:
             level = float(self.lineEdit_levelA.text())
-            self.smu_mgr.set_source_level('a', level)
+            self.smu_mgr.request('set_source_level', 'a', level)
         except ValueError:
             self.log_mgr.warning(f"Ungültige Level-Eingabe (A): '{self.lineEdit_levelA.text()}'")
 
@@ -437,7 +467,7 @@ class SmuWidget(QWidget, Ui_Form):
     def on_limit_A_changed(self):
         try:
             limit = float(self.lineEdit_limitA.text()) 
-            self.smu_mgr.set_source_limit('a', limit)
+            self.smu_mgr.request('set_source_limit', 'a', limit)
         except ValueError:
             self.log_mgr.warning(f"Ungültige Limit-Eingabe (A): '{self.lineEdit_limitA.text()}'")
 
@@ -445,41 +475,41 @@ class SmuWidget(QWidget, Ui_Form):
 
     @Slot()
     def on_measure_B_clicked(self):
-        self.smu_mgr.measure_iv('b')
+        self.smu_mgr.request('measure_iv', 'b')
 
     @Slot()
     def on_reset_B_clicked(self):
-        self.smu_mgr.reset_channel('b')
+        self.smu_mgr.request('reset_channel', 'b')
         self.modelB.setRowCount(0) # Tabelle leeren
         self._sync_ui_to_reset_state('b') # UI auf Default setzen
 
     @Slot(bool)
     def on_output_B_toggled(self, is_on):
         # HINWEIS: Dies funktioniert, da du outputB 'checkable' gemacht hast.
-        self.smu_mgr.set_output_state('b', is_on)
+        self.smu_mgr.request('set_output_state', 'b', is_on)
         self.pushButton_outputB.setText("ON" if is_on else "OFF")
 
     @Slot()
     def on_source_B_changed(self):
         if self.pushButton_voltageB.isChecked():
-            self.smu_mgr.set_source_voltage('b')
+            self.smu_mgr.request('set_source_voltage', 'b')
         elif self.pushButton_currentB.isChecked():
-            self.smu_mgr.set_source_current('b')
+            self.smu_mgr.request('set_source_current', 'b')
         # IMMER die Labels aktualisieren
         self._update_channel_labels('b')
 
     @Slot()
     def on_sense_B_changed(self):
         if self.pushButton_remoteB.isChecked():
-            self.smu_mgr.set_sense_remote('b')
+            self.smu_mgr.request('set_sense_remote', 'b')
         elif self.pushButton_localB.isChecked():
-            self.smu_mgr.set_sense_local('b')
+            self.smu_mgr.request('set_sense_local', 'b')
     
     @Slot()
     def on_level_B_changed(self):
         try:
             level = float(self.lineEdit_levelB.text())
-            self.smu_mgr.set_source_level('b', level)
+            self.smu_mgr.request('set_source_level', 'b', level)
         except ValueError:
             self.log_mgr.warning(f"Ungültige Level-Eingabe (B): '{self.lineEdit_levelB.text()}'")
 
@@ -487,7 +517,7 @@ class SmuWidget(QWidget, Ui_Form):
     def on_limit_B_changed(self):
         try:
             limit = float(self.lineEdit_limitB.text()) 
-            self.smu_mgr.set_source_limit('b', limit)
+            self.smu_mgr.request('set_source_limit', 'b', limit)
         except ValueError:
             self.log_mgr.warning(f"Ungültige Limit-Eingabe (B): '{self.lineEdit_limitB.text()}'")
 
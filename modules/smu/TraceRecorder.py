@@ -0,0 +1,290 @@
+# modules/smu/TraceRecorder.py
+"""
+================================================================================
+I/O-Trace für SMU-Verbindungen (Aufzeichnung und Replay)
+================================================================================
+
+`TraceRecorder` speichert jeden Schreib- und Lesevorgang einer Verbindung mit
+Zeitstempel in einem vorab allozierten Ringpuffer. Pro Vorgang fallen nur ein
+Eintrag in ein numpy-Array und eine Byte-Kopie an, kein String-Formatieren,
+kein Logfile, kein Qt-Signal. Bei Bedarf wird der Puffer als kompakte
+Binärdatei gespeichert (`dump`).
+
+`ReplayTransport` spielt eine solche Datei wieder ab. Der Treiber (und damit
+`SmuManager`) läuft dabei exakt die aufgezeichnete Sitzung durch, wahlweise
+mit den aufgezeichneten Gerätelaufzeiten. So lassen sich Timing-Regressionen
+im Host-Code ohne Gerät reproduzieren:
+
+    .. code-block:: python
+
+        smu_mgr.connect("REPLAY:/pfad/zur/sitzung.mltrace")
+
+Dateiformat (little endian):
+    Header   : 8s Magic 'MLTRACE1', uint32 Anzahl Einträge, uint64 Payload-Länge
+    Einträge : Anzahl x RECORD_DTYPE
+    Payload  : alle Daten der Einträge hintereinander
+"""
+
+import struct
+import time
+from collections import namedtuple
+
+import numpy as np
+
+try:
+    from .Transport import Transport
+except ImportError:
+    from Transport import Transport
+
+
+TraceRecord = namedtuple("TraceRecord", ["timestamp", "direction", "data", "truncated"])
+"""Ein Eintrag des Traces: (Zeit seit Start [s], TX/RX, Bytes, gekürzt)."""
+
+
+class TraceRecorder:
+    """
+    Ringpuffer für zeitgestempelte TX/RX-Vorgänge.
+
+    Args:
+        max_records (int): Anzahl der Einträge im Ring.
+        payload_capacity (int): Größe des Datenpuffers in Bytes. Ist er voll,
+                                fallen die ältesten Einträge heraus.
+    """
+
+    TX = 0
+    RX = 1
+
+    FLAG_TRUNCATED = 1
+
+    MAGIC = b"MLTRACE1"
+    _HEADER = struct.Struct("<8sIQ")
+    RECORD_DTYPE = np.dtype([
+        ('timestamp', '<f8'),   # Sekunden seit Start der Aufzeichnung
+        ('direction', 'u1'),    # TX / RX
+        ('flags', 'u1'),
+        ('length', '<u4'),      # gespeicherte Bytes
+        ('offset', '<u8'),      # absolute Position im Datenstrom
+    ])
+
+    def __init__(self, max_records: int = 65536, payload_capacity: int = 16 * 1024 * 1024):
+        self.max_records = max_records
+        self.payload_capacity = payload_capacity
+        self._records = np.zeros(max_records, dtype=self.RECORD_DTYPE)
+        self._payload = bytearray(payload_capacity)
+        self.clear()
+
+    def clear(self):
+        """ Verwirft alle Einträge und setzt die Zeitbasis neu. """
+        self._count = 0
+        self._payload_total = 0
+        self._t0 = time.perf_counter()
+
+    def __len__(self) -> int:
+        return len(self._valid_indices())
+
+    def record(self, direction: int, data: bytes):
+        """ Speichert einen Vorgang (TX oder RX). """
+        length = len(data)
+        flags = 0
+        if length > self.payload_capacity:
+            data = data[:self.payload_capacity]
+            length = self.payload_capacity
+            flags = self.FLAG_TRUNCATED
+
+        offset = self._payload_total
+        start = offset % self.payload_capacity
+        end = start + length
+        if end <= self.payload_capacity:
+            self._payload[start:end] = data
+        else:
+            split = self.payload_capacity - start
+            self._payload[start:] = data[:split]
+            self._payload[:length - split] = data[split:]
+        self._payload_total += length
+
+        self._records[self._count % self.max_records] = (
+            time.perf_counter() - self._t0, direction, flags, length, offset)
+        self._count += 1
+
+    def _valid_indices(self) -> np.ndarray:
+        """ Ring-Indizes der noch vollständigen Einträge in zeitlicher Reihenfolge. """
+        n = min(self._count, self.max_records)
+        first = self._count - n
+        indices = np.arange(first, self._count) % self.max_records
+        oldest_payload = self._payload_total - self.payload_capacity
+        return indices[self._records['offset'][indices] >= max(oldest_payload, 0)]
+
+    def _payload_of(self, record) -> bytes:
+        start = int(record['offset']) % self.payload_capacity
+        end = start + int(record['length'])
+        if end <= self.payload_capacity:
+            return bytes(self._payload[start:end])
+        return bytes(self._payload[start:]) + bytes(self._payload[:end - self.payload_capacity])
+
+    def records(self) -> list[TraceRecord]:
+        """ Gibt alle gespeicherten Einträge in zeitlicher Reihenfolge zurück. """
+        return [TraceRecord(float(record['timestamp']), int(record['direction']),
+                            self._payload_of(record), bool(record['flags'] & self.FLAG_TRUNCATED))
+                for record in self._records[self._valid_indices()]]
+
+    def dump(self, path: str) -> int:
+        """
+        Speichert den Ringpuffer als Binärdatei.
+
+        Returns:
+            int: Anzahl der geschriebenen Einträge.
+        """
+        records = self._records[self._valid_indices()].copy()
+        payloads = [self._payload_of(record) for record in records]
+        records['offset'] = np.concatenate(([0], np.cumsum(records['length'][:-1]))) if len(records) else []
+        payload = b"".join(payloads)
+        with open(path, "wb") as f:
+            f.write(self._HEADER.pack(self.MAGIC, len(records), len(payload)))
+            f.write(records.tobytes())
+            f.write(payload)
+        return len(records)
+
+    @classmethod
+    def load(cls, path: str) -> list[TraceRecord]:
+        """ Liest eine mit `dump` gespeicherte Datei. """
+        with open(path, "rb") as f:
+            magic, count, payload_length = cls._HEADER.unpack(f.read(cls._HEADER.size))
+            if magic != cls.MAGIC:
+                raise ValueError(f"'{path}' is not a Modulab I/O trace.")
+            records = np.frombuffer(f.read(count * cls.RECORD_DTYPE.itemsize), dtype=cls.RECORD_DTYPE)
+            payload = f.read(payload_length)
+        return [TraceRecord(float(record['timestamp']), int(record['direction']),
+                            payload[int(record['offset']):int(record['offset']) + int(record['length'])],
+                            bool(record['flags'] & cls.FLAG_TRUNCATED))
+                for record in records]
+
+
+class TracingTransport:
+    """
+    Hülle um einen Transport, die alle Schreib- und Lesevorgänge aufzeichnet.
+
+    Verhält sich nach außen wie der innere Transport.
+    """
+
+    def __init__(self, inner, recorder: TraceRecorder):
+        self.inner = inner
+        self.recorder = recorder
+
+    @property
+    def timeout(self) -> float:
+        return self.inner.timeout
+
+    @timeout.setter
+    def timeout(self, value: float):
+        self.inner.timeout = value
+
+    @property
+    def is_open(self) -> bool:
+        return self.inner.is_open
+
+    def open(self):
+        self.inner.open()
+
+    def close(self):
+        self.inner.close()
+
+    def clear_input(self):
+        self.inner.clear_input()
+
+    def write(self, data: bytes):
+        self.recorder.record(TraceRecorder.TX, data)
+        self.inner.write(data)
+
+    def readline(self) -> bytes:
+        data = self.inner.readline()
+        self.recorder.record(TraceRecorder.RX, data)
+        return data
+
+    def read(self, size: int) -> bytes:
+        data = self.inner.read(size)
+        self.recorder.record(TraceRecorder.RX, data)
+        return data
+
+
+class ReplayTransport(Transport):
+    """
+    Spielt einen aufgezeichneten Trace als Verbindung ab.
+
+    Schreibvorgänge werden mit der Aufzeichnung verglichen, Lesevorgänge
+    liefern die aufgezeichneten Antworten.
+
+    Args:
+        path (str): Trace-Datei (siehe `TraceRecorder.dump`).
+        realtime (bool): Antworten mit der aufgezeichneten Gerätelaufzeit
+                         (Zeit zwischen letztem TX und RX) verzögern.
+        strict (bool): Bei abweichenden Befehlen einen Fehler werfen.
+    """
+
+    def __init__(self, path: str, realtime: bool = True, strict: bool = True, timeout: float = 2.0):
+        super().__init__(f"REPLAY:{path}", timeout)
+        self.path = path
+        self.realtime = realtime
+        self.strict = strict
+        self._trace = []
+        self._position = 0
+        self._open = False
+        self._last_tx_recorded = 0.0
+        self._last_tx_actual = 0.0
+
+    @property
+    def is_open(self) -> bool:
+        return self._open
+
+    def open(self):
+        self._trace = TraceRecorder.load(self.path)
+        self._position = 0
+        self._open = True
+
+    def close(self):
+        self._open = False
+
+    def clear_input(self):
+        pass
+
+    def _next(self, direction: int) -> TraceRecord:
+        if self._position >= len(self._trace):
+            raise ConnectionError("Replay trace exhausted.")
+        record = self._trace[self._position]
+        if record.direction != direction:
+            raise ValueError(f"Replay diverged at record {self._position}: expected "
+                             f"{'TX' if record.direction == TraceRecorder.TX else 'RX'}.")
+        if record.truncated:
+            raise ValueError(f"Replay record {self._position} was truncated during recording.")
+        self._position += 1
+        return record
+
+    def write(self, data: bytes):
+        record = self._next(TraceRecorder.TX)
+        if self.strict and record.data != data:
+            raise ValueError(f"Replay diverged at record {self._position - 1}: "
+                             f"sent {data[:60]!r}, recorded {record.data[:60]!r}.")
+        self._last_tx_recorded = record.timestamp
+        self._last_tx_actual = time.perf_counter()
+
+    def _receive(self) -> bytes:
+        record = self._next(TraceRecorder.RX)
+        if self.realtime:
+            due = self._last_tx_actual + (record.timestamp - self._last_tx_recorded)
+            delay = due - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+        return record.data
+
+    def _recv(self, max_bytes: int) -> bytes:
+        # Ein Lesevorgang der Aufzeichnung entspricht einem Block
+        return self._receive()
+
+    def readline(self) -> bytes:
+        return self._receive()
+
+    def read(self, size: int) -> bytes:
+        data = self._receive()
+        if self.strict and len(data) > size:
+            raise ValueError(f"Replay diverged at record {self._position - 1}: read of {size} bytes, "
+                             f"recorded {len(data)}.")
+        return data
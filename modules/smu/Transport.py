@@ -0,0 +1,292 @@
+# modules/smu/Transport.py
+"""
+================================================================================
+Transport-Schicht für SMU-Treiber
+================================================================================
+
+Der Keithley2602-Treiber spricht TSP über eine austauschbare Verbindung.
+Welche Verbindung genutzt wird, ergibt sich aus der Adresse:
+
+    COM3, /dev/ttyUSB0                  -> SerialTransport (RS232 / USB-Seriell)
+    192.168.0.10:5025, socket://host    -> SocketTransport (LAN Raw-Socket, Port 5025)
+    TCPIP0::192.168.0.10::INSTR         -> VisaTransport   (pyvisa, alles mit '::')
+    REPLAY:/pfad/sitzung.mltrace        -> ReplayTransport (siehe TraceRecorder.py)
+
+Alle Transports lesen in großen Blöcken in einen eigenen Empfangspuffer,
+`readline()` und `read()` bedienen sich daraus. So entfällt das byteweise
+Lesen von `serial.Serial.readline()`.
+"""
+
+import re
+import socket
+import time
+from abc import ABC, abstractmethod
+
+import serial
+
+# pyvisa ist optional, ohne wird nur der VISA-Transport deaktiviert
+try:
+    import pyvisa
+except ImportError:
+    pyvisa = None
+
+DEFAULT_SOCKET_PORT = 5025
+"""int: Raw-Socket-Port der Keithley 2600-Serie."""
+
+_SOCKET_ADDRESS = re.compile(r"^(?:socket://)?(?P<host>[A-Za-z0-9.\-]+):(?P<port>\d+)$")
+
+
+class Transport(ABC):
+    """
+    Basisklasse aller Transports mit gepuffertem Lesen.
+
+    Unterklassen implementieren nur `open`, `close`, `is_open`, `write`
+    und `_recv` (liefert b"" bei Timeout). Fehlt eine davon, schlägt
+    schon das Erzeugen fehl, nicht erst der erste Zugriff.
+    """
+
+    READ_CHUNK = 65536
+    """int: Maximale Blockgröße pro Lesezugriff in Bytes."""
+
+    def __init__(self, address: str, timeout: float = 2.0):
+        self.address = address
+        self._timeout = timeout
+        self._rx = bytearray()
+
+    @property
+    def timeout(self) -> float:
+        """ Lese-Timeout in Sekunden """
+        return self._timeout
+
+    @timeout.setter
+    def timeout(self, value: float):
+        self._timeout = value
+        if self.is_open:
+            self._apply_timeout()
+
+    @property
+    @abstractmethod
+    def is_open(self) -> bool:
+        ...
+
+    @abstractmethod
+    def open(self):
+        ...
+
+    @abstractmethod
+    def close(self):
+        ...
+
+    @abstractmethod
+    def write(self, data: bytes):
+        ...
+
+    @abstractmethod
+    def _recv(self, max_bytes: int) -> bytes:
+        ...
+
+    def _apply_timeout(self):
+        """ Überträgt `self._timeout` auf die darunterliegende Verbindung. """
+        pass
+
+    def clear_input(self):
+        """ Verwirft alle bereits empfangenen, noch nicht gelesenen Daten. """
+        self._rx.clear()
+        old_timeout = self._timeout
+        self.timeout = 0.05
+        try:
+            while self._recv(self.READ_CHUNK):
+                pass
+        finally:
+            self.timeout = old_timeout
+
+    def readline(self) -> bytes:
+        """ Liest bis einschließlich '\\n'. Bei Timeout wird der bisherige Rest zurückgegeben. """
+        deadline = time.monotonic() + (self._timeout or 0)
+        while True:
+            index = self._rx.find(b"\n")
+            if index >= 0:
+                line = bytes(self._rx[:index + 1])
+                del self._rx[:index + 1]
+                return line
+            chunk = self._recv(self.READ_CHUNK)
+            if chunk:
+                self._rx += chunk
+            elif time.monotonic() >= deadline:
+                line = bytes(self._rx)
+                self._rx.clear()
+                return line
+
+    def read(self, size: int) -> bytes:
+        """ Liest bis zu `size` Bytes (weniger nur bei Timeout), wie `serial.Serial.read`. """
+        deadline = time.monotonic() + (self._timeout or 0)
+        while len(self._rx) < size:
+            chunk = self._recv(max(self.READ_CHUNK, size - len(self._rx)))
+            if chunk:
+                self._rx += chunk
+            elif time.monotonic() >= deadline:
+                break
+        data = bytes(self._rx[:size])
+        del self._rx[:size]
+        return data
+
+
+class SerialTransport(Transport):
+    """ RS232 bzw. virtueller COM-Port über pyserial. """
+
+    def __init__(self, address: str, baudrate: int = 115200, timeout: float = 2.0):
+        super().__init__(address, timeout)
+        self._serial = serial.Serial()
+        self._serial.port = address
+        self._serial.baudrate = baudrate
+        self._serial.timeout = timeout
+
+    @property
+    def is_open(self) -> bool:
+        return self._serial.is_open
+
+    def open(self):
+        self._serial.open()
+        # Größerer Treiberpuffer für Bulk-Transfers (nur unter Windows verfügbar)
+        if hasattr(self._serial, "set_buffer_size"):
+            try:
+                self._serial.set_buffer_size(rx_size=self.READ_CHUNK, tx_size=self.READ_CHUNK)
+            except Exception:
+                pass
+
+    def close(self):
+        self._serial.close()
+
+    def write(self, data: bytes):
+        self._serial.write(data)
+
+    def _apply_timeout(self):
+        self._serial.timeout = self._timeout
+
+    def _recv(self, max_bytes: int) -> bytes:
+        # Blockiert bis zum ersten Byte, danach wird alles Vorhandene auf einmal geholt
+        waiting = self._serial.in_waiting
+        return self._serial.read(min(max(1, waiting), max_bytes))
+
+
+class SocketTransport(Transport):
+    """ LAN Raw-Socket (TSP direkt über TCP, Standard-Port 5025). """
+
+    RECV_BUFFER_SIZE = 1 << 20
+    """int: Gewünschte Größe des Socket-Empfangspuffers (1 MiB)."""
+
+    def __init__(self, address: str, timeout: float = 2.0):
+        super().__init__(address, timeout)
+        self.host, self.port = parse_socket_address(address)
+        self._socket = None
+
+    @property
+    def is_open(self) -> bool:
+        return self._socket is not None
+
+    def open(self):
+        self._socket = socket.create_connection((self.host, self.port), timeout=self._timeout)
+        self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self.RECV_BUFFER_SIZE)
+
+    def close(self):
+        if self._socket is not None:
+            try:
+                self._socket.close()
+            finally:
+                self._socket = None
+
+    def write(self, data: bytes):
+        self._socket.sendall(data)
+
+    def _apply_timeout(self):
+        self._socket.settimeout(self._timeout)
+
+    def _recv(self, max_bytes: int) -> bytes:
+        try:
+            data = self._socket.recv(max_bytes)
+        except socket.timeout:
+            return b""
+        if not data:
+            self.close()
+            raise ConnectionError(f"Connection to {self.host}:{self.port} closed by peer.")
+        return data
+
+
+class VisaTransport(Transport):
+    """ Beliebige VISA-Ressource über pyvisa (z.B. TCPIP0::<ip>::INSTR oder GPIB0::26::INSTR). """
+
+    def __init__(self, address: str, timeout: float = 2.0):
+        super().__init__(address, timeout)
+        self._resource = None
+
+    @property
+    def is_open(self) -> bool:
+        return self._resource is not None
+
+    def open(self):
+        if pyvisa is None:
+            raise ConnectionError("pyvisa is not installed. VISA addresses are not available.")
+        self._resource = pyvisa.ResourceManager().open_resource(self.address)
+        self._resource.write_termination = ""
+        self._resource.read_termination = "\n"
+        self._apply_timeout()
+
+    def close(self):
+        if self._resource is not None:
+            try:
+                self._resource.close()
+            finally:
+                self._resource = None
+
+    def write(self, data: bytes):
+        self._resource.write_raw(data)
+
+    def _apply_timeout(self):
+        self._resource.timeout = max(1, int(self._timeout * 1000))
+
+    def _recv(self, max_bytes: int) -> bytes:
+        try:
+            return self._resource.read_raw(max_bytes)
+        except pyvisa.errors.VisaIOError as e:
+            if e.error_code == pyvisa.constants.StatusCode.error_timeout:
+                return b""
+            raise ConnectionError(str(e))
+
+
+def is_network_address(address: str) -> bool:
+    """ Prüft, ob eine Adresse kein lokaler serieller Port ist (Socket oder VISA). """
+    return "::" in address or address.startswith("socket://") or bool(_SOCKET_ADDRESS.match(address))
+
+
+def parse_socket_address(address: str) -> tuple[str, int]:
+    """ Zerlegt 'host:port' bzw. 'socket://host[:port]' in (host, port). Ohne Port gilt 5025. """
+    match = _SOCKET_ADDRESS.match(address)
+    if match:
+        return match.group("host"), int(match.group("port"))
+    return address.replace("socket://", ""), DEFAULT_SOCKET_PORT
+
+
+def create_transport(address: str, baudrate: int = 115200, timeout: float = 2.0) -> Transport:
+    """
+    Erzeugt den passenden Transport zu einer Adresse (noch nicht geöffnet).
+
+    Examples:
+        .. code-block:: python
+
+            create_transport("COM3")                     # SerialTransport
+            create_transport("192.168.0.10:5025")        # SocketTransport
+            create_transport("TCPIP0::192.168.0.10::INSTR") # VisaTransport
+            create_transport("REPLAY:trace.mltrace")     # ReplayTransport
+    """
+    if address.upper().startswith("REPLAY:"):
+        try:
+            from .TraceRecorder import ReplayTransport
+        except ImportError:
+            from TraceRecorder import ReplayTransport
+        return ReplayTransport(address[len("REPLAY:"):], timeout=timeout)
+    if "::" in address:
+        return VisaTransport(address, timeout=timeout)
+    if address.startswith("socket://") or _SOCKET_ADDRESS.match(address):
+        return SocketTransport(address, timeout=timeout)
+    return SerialTransport(address, baudrate=baudrate, timeout=timeout)
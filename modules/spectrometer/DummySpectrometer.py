@@ -0,0 +1,118 @@
+# modules/spectrometer/DummySpectrometer.py
+"""
+================================================================================
+Simuliertes Spektrometer (ohne Hardware / ohne seabreeze)
+================================================================================
+
+`DummySpectrometer` bildet den Teil der `seabreeze.spectrometers.Spectrometer`-
+API nach, den der `SpectrometerManager` nutzt. Damit lassen sich Live-Ansicht,
+Export und Experimente ohne Ocean-Optics-Gerät testen und benchmarken.
+
+Simuliert werden:
+    - 2048 Pixel mit polynomieller Wellenlängen-Kalibrierung (ca. 340-1040 nm, ähnlich einem FLAME-S)
+    - Integrationszeit in Echtzeit (die Aufnahme dauert so lange wie die Belichtung)
+    - ADC-Sockel, Dunkelstrom mit festem Pixelmuster, Schrot- und Ausleserauschen
+    - elektrisch dunkle Pixel (für `correct_dark_counts`) und Sättigung bei 65535
+    - eine LED-Emission, deren Helligkeit optional dem Strom der simulierten SMU folgt
+"""
+
+import time
+
+import numpy as np
+
+
+class DummySpectrometer:
+    """
+    Simuliert ein Ocean-Optics-Spektrometer mit der seabreeze-API.
+
+    Args:
+        light_source (callable, optional): Liefert den LED-Strom in A (z.B. den
+            Ausgangsstrom des simulierten SMU-Kanals). None (oder Rückgabe None)
+            = konstante Helligkeit.
+    """
+
+    PIXELS = 2048
+    WAVELENGTH_COEFFICIENTS = (339.4, 0.3815, -1.6e-5, -1.9e-9)
+    """tuple[float, ...]: Kalibrierpolynom λ(Pixel) = c0 + c1·p + c2·p² + c3·p³ in nm."""
+    DARK_PIXELS = 18
+    """int: Anzahl der elektrisch dunklen Pixel am Anfang des Sensors."""
+
+    def __init__(self, light_source=None):
+        self.model = "DUMMY"
+        self.serial_number = "DUMMY"
+        self.integration_time_micros_limits = (1_000, 65_000_000)
+        self.max_intensity = 65535.0
+        self.light_source = light_source
+
+        self.led_center_nm = 630.0
+        self.led_fwhm_nm = 20.0
+        self.counts_per_second = 2e5
+        """float: Spitzen-Zählrate der LED ohne `light_source` (Counts/s)."""
+        self.counts_per_ampere_second = 2e7
+        """float: Spitzen-Zählrate pro A LED-Strom (Counts/s/A), wenn `light_source` gesetzt ist."""
+        self.offset_counts = 1500.0
+        self.dark_counts_per_second = 300.0
+        self.read_noise_counts = 8.0
+        self.gain = 0.5
+        """float: Counts pro Photoelektron (bestimmt das Schrotrauschen)."""
+
+        self._rng = np.random.default_rng()
+        pixel = np.arange(self.PIXELS, dtype=np.float64)
+        self._wavelengths = np.polyval(self.WAVELENGTH_COEFFICIENTS[::-1], pixel)
+        # Festes Dunkelstrom-Muster (heiße Pixel), bleibt für dieses Gerät gleich
+        self._dark_pattern = np.random.default_rng(2602).lognormal(0.0, 0.3, self.PIXELS)
+        self._integration_s = 0.1
+        self._last_readout = time.monotonic()
+        self._is_open = True
+
+    def integration_time_micros(self, time_us: int):
+        low, high = self.integration_time_micros_limits
+        if not low <= time_us <= high:
+            raise ValueError(f"Integration time {time_us} us outside limits {low}-{high} us.")
+        self._integration_s = time_us / 1e6
+
+    def wavelengths(self) -> np.ndarray:
+        return self._wavelengths.copy()
+
+    def intensities(self, correct_dark_counts: bool = False, correct_nonlinearity: bool = False) -> np.ndarray:
+        """ Simuliert eine Belichtung (blockiert für die Integrationszeit). """
+        if not self._is_open:
+            raise RuntimeError("DUMMY spectrometer is closed.")
+        # Das Gerät belichtet ab dem letzten Auslesen; nur die Restzeit wird gewartet
+        remaining = self._last_readout + self._integration_s - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+        self._last_readout = time.monotonic()
+
+        t = self._integration_s
+        electrons = (self._led_rate() * self._led_shape() + self.dark_counts_per_second * self._dark_pattern) * t
+        electrons = np.maximum(electrons / self.gain, 0.0)
+        counts = self.offset_counts + self.gain * self._rng.poisson(electrons)
+        counts += self._rng.normal(0.0, self.read_noise_counts, self.PIXELS)
+        counts = np.clip(np.round(counts), 0.0, self.max_intensity)
+
+        if correct_dark_counts:
+            counts -= counts[:self.DARK_PIXELS].mean()
+        # Der simulierte Detektor ist linear, correct_nonlinearity ändert nichts
+        return counts
+
+    def spectrum(self, correct_dark_counts: bool = False, correct_nonlinearity: bool = False) -> np.ndarray:
+        return np.vstack((self.wavelengths(), self.intensities(correct_dark_counts, correct_nonlinearity)))
+
+    def close(self):
+        self._is_open = False
+
+    def _led_rate(self) -> float:
+        if self.light_source is None:
+            return self.counts_per_second
+        current = self.light_source()
+        if current is None:
+            # Quelle nicht verfügbar (z.B. keine simulierte SMU verbunden)
+            return self.counts_per_second
+        return max(0.0, current) * self.counts_per_ampere_second
+
+    def _led_shape(self) -> np.ndarray:
+        sigma = self.led_fwhm_nm / 2.3548
+        shape = np.exp(-0.5 * ((self._wavelengths - self.led_center_nm) / sigma) ** 2)
+        shape[:self.DARK_PIXELS] = 0.0 # Elektrisch dunkle Pixel sehen kein Licht
+        return shape
@@ -1,11 +1,41 @@
+import asyncio
+import functools
+import itertools
+import re
+import time
+from concurrent.futures import Future
+
 from PySide6.QtCore import QObject, Signal
 
 # https://python-seabreeze.readthedocs.io/en/latest/api.html#seabreeze.spectrometers.Spectrometer
-import seabreeze
-seabreeze.use('cseabreeze')
-from seabreeze.spectrometers import Spectrometer, list_devices
+# seabreeze ist optional, ohne steht nur das simulierte Spektrometer ("DUMMY") zur Verfügung
+try:
+    import seabreeze
+    seabreeze.use('cseabreeze')
+    from seabreeze.spectrometers import Spectrometer, list_devices
+except ImportError:
+    seabreeze = None
 import numpy as np
 
+from .DummySpectrometer import DummySpectrometer
+from .SpectrometerWorker import SpectrometerWorker
+
+
+# Schlüssel der Dunkelspektren-Bibliothek (siehe `SpectrometerManager._dark_key`)
+_DARK_KEY = re.compile(r"\d+us_\d+x_b\d+_dc[01]_nl[01]")
+
+
+def _on_worker(method):
+    """
+    Führt eine Manager-Methode im Spektrometer-Thread aus und wartet auf das Ergebnis.
+
+    So greift immer nur ein Thread auf das Gerät zu, auch während der Live-Modus läuft.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        return self._worker.call(method, self, *args, **kwargs)
+    return wrapper
+
 # ==========================================================================================
 # Manager
 # ==========================================================================================
@@ -33,40 +63,98 @@ class SpectrometerManager(QObject):
             Wird ausgelöst, nachdem die Geräteliste aktualisiert wurde.
             Args: (list: Liste von Gerätenamen [str], z.B. ["FLAME (Q...)", ...]).
             
-        new_spectrum_acquired (numpy.ndarray, numpy.ndarray):
+        new_spectrum_acquired (int, numpy.ndarray):
             Wird ausgelöst, wenn ein neues Spektrum verfügbar ist.
-            Args: (numpy.ndarray: Wellenlängen, numpy.ndarray: Intensitäten).
+            Args: (int: `wavelength_axis_id`, numpy.ndarray: Intensitäten).
+            Die Wellenlängen holt der Empfänger einmalig mit `get_wavelengths`
+            und erneut nur, wenn sich die Achsen-ID ändert. Im Live-Modus
+            höchstens `max_emit_rate` mal pro Sekunde; das Array wird danach
+            wiederverwendet (bei `max_emit_rate` 0 ist es eine Kopie, siehe
+            `SpectrometerWorker`).
+
+        continuous_state_changed (bool):
+            Wird ausgelöst, wenn der Live-Modus startet (True) oder endet (False).
+
+        request_finished (int, str, object):
+            Wird ausgelöst, wenn ein mit `request` eingereichter Auftrag fertig ist.
+            Args: (int: Auftrags-ID, str: Methodenname, object: Rückgabewert oder None bei Fehler).
+
+    Threads:
+        Alle Gerätezugriffe laufen in einem eigenen Thread (`SpectrometerWorker`).
+        Aufrufe aus Experiment-Skripten warten wie gewohnt auf das Ergebnis,
+        die GUI nutzt `request` und blockiert nicht.
     """
 
     # Signale
     connection_status_changed = Signal(bool,str)
     device_list_updated = Signal(list)
-    new_spectrum_acquired = Signal(object, object) # Intern als (ndarray, ndarray) behandelt
+    new_spectrum_acquired = Signal(int, object) # (Achsen-ID, Intensitäten als ndarray)
+    continuous_state_changed = Signal(bool)
+    request_finished = Signal(int, str, object)
     
-    def __init__(self, log_manager, profile_manager):
+    def __init__(self, log_manager, profile_manager, name: str | None = None):
         """
         Initialisiert den SpectrometerManager.
 
         Lädt die zuletzt verwendete Konfiguration (Integrationszeit, Korrekturen)
         aus dem ProfileManager und versucht automatisch, eine Verbindung
         zum zuletzt verwendeten Gerät herzustellen.
+
+        Mit `name` entsteht ein weiteres Gerät für den `SpectrometerPool`:
+        Es verbindet sich nicht selbst und speichert seine Einstellungen
+        unter eigenen Profil-Schlüsseln (z.B. "Spec_integration_time_us_nir").
         """
         super().__init__()
         self.log_mgr = log_manager 
         self.profile_mgr = profile_manager
+        # None = Haupt-Spektrometer der GUI; mit Namen = weiteres Gerät im `SpectrometerPool`
+        self.name = name
 
         self.log_mgr.debug("Initializing SpectrometerManager...")
 
         self.spectrometer = None
+        # Wellenlängen-Kalibrierung, einmal pro Verbindung gelesen
+        self._wavelengths = None
+        self._axis_ids = itertools.count(1)
+        self.wavelength_axis_id = 0
         self.available_devices = []
         self.device_name_map = {}
+        self._simulated_light_source = None
+        self._request_ids = itertools.count(1)
+
+        # Ein Thread für alle Gerätezugriffe und den Live-Modus
+        self.max_emit_rate = self.profile_mgr.read(self._key("Spec_max_emit_rate")) or 20.0
+        self._worker = SpectrometerWorker(self._read_spectrum, on_spectrum=self._emit_live_spectrum,
+                                          on_error=self._on_continuous_error, max_rate=self.max_emit_rate,
+                                          name="SpectrometerIO" if name is None else f"SpectrometerIO-{name}")
+        self._worker.start()
 
         # Zuletzt verwendete Konfiguration laden
-        self.correct_dark_counts = self.profile_mgr.read("Spec_correct_dark_counts")
-        self.correct_non_linearity = self.profile_mgr.read("Spec_non_linearity")
-        self.current_integration_time_us = self.profile_mgr.read("Spec_integration_time_us")
+        self.correct_dark_counts = self.profile_mgr.read(self._key("Spec_correct_dark_counts"))
+        self.correct_non_linearity = self.profile_mgr.read(self._key("Spec_non_linearity"))
+        self.current_integration_time_us = self.profile_mgr.read(self._key("Spec_integration_time_us"))
+        self.scans_to_average = self.profile_mgr.read(self._key("Spec_scans_to_average"))
+        self.boxcar_width = self.profile_mgr.read(self._key("Spec_boxcar_width"))
         self.LastDevice = self.profile_mgr.read("Spec_LastDevice") # gibt auf self.profile_mgr.write("Spec_LastDevice", value)
 
+        # Summenpuffer für die Mittelung (werden bei der ersten Aufnahme passend alloziert)
+        self._scan_sum = None
+        self._scan_sum_sq = None
+        self._scan = None
+        self.last_variance = None
+
+        # Dunkelspektren des verbundenen Geräts: {Schlüssel: (Zeitpunkt, Intensitäten)}
+        self._dark_library = {}
+        self._dark_warned = set()
+        self.dark_subtraction = bool(self.profile_mgr.read(self._key("Spec_dark_subtraction")))
+        self.dark_max_age_s = self.profile_mgr.read(self._key("Spec_dark_max_age_s"))
+        self.dark_shutter = None
+
+        # Spektrale Bereiche (ROI): {Name: (von_nm, bis_nm)}; die Pixelgrenzen werden pro Verbindung berechnet
+        self._rois = {name: tuple(band) for name, band in (self.profile_mgr.read(self._key("Spec_rois")) or {}).items()}
+        self._roi_pixels = ([], None, None)
+        self._half_dx = None
+
         if self.correct_dark_counts is None:
             self.set_correction_dark_count(False)
 
@@ -76,6 +164,17 @@ class SpectrometerManager(QObject):
         if self.current_integration_time_us is None:
             self.set_integrationtime(100 * 1000) # Standard 100ms
 
+        if self.scans_to_average is None:
+            self.set_scans_to_average(1)
+
+        if self.boxcar_width is None:
+            self.set_boxcar_width(0)
+
+        if name is not None:
+            # Pool-Geräte verbindet der SpectrometerPool selbst
+            self.LastDevice = None
+            return
+
         self.LastDevice = self.profile_mgr.read("Spec_LastDevice") # gibt auf self.profile_mgr.write("Spec_LastDevice", value)
 
         if self.LastDevice:
@@ -93,11 +192,12 @@ class SpectrometerManager(QObject):
         Scannt nach verfügbaren Spektrometern und aktualisiert die interne Liste.
 
         Verwendet `seabreeze.list_devices()` und erstellt eine Zuordnung (Map)
-        von formatierten Gerätenamen zu Geräteinstanzen. Löst das 
+        von formatierten Gerätenamen zu Geräteinstanzen. Zusätzlich steht
+        immer ein simuliertes Spektrometer "DUMMY" zur Verfügung. Löst das 
         `device_list_updated`-Signal aus.
 
         Returns:
-            list: Eine Liste formatierter Gerätenamen (z.B. ["Oceanoptics (O...)", "USB2000 (...)"]).
+            list: Eine Liste formatierter Gerätenamen (z.B. ["Oceanoptics (O...)", "USB2000 (...)", "DUMMY"]).
 
         Examples:
             Eine Geräteliste abrufen und in einer Combobox anzeigen:
@@ -118,11 +218,15 @@ class SpectrometerManager(QObject):
         """
         device_names = []
         try:
-            self.available_devices = list_devices()
+            if seabreeze is None:
+                self.log_mgr.debug("seabreeze is not installed, only the DUMMY spectrometer is available.")
+                self.available_devices = []
+            else:
+                self.available_devices = list_devices()
             self.device_name_map.clear()
 
             if not self.available_devices:
-                self.log_mgr.warning("No spectrometer found.")
+                self.log_mgr.warning("No spectrometer found (DUMMY available).")
             else:
                 self.log_mgr.debug(f"{len(self.available_devices)} spectrometer(s) found.")
                 for dev in self.available_devices:
@@ -134,10 +238,12 @@ class SpectrometerManager(QObject):
             self.log_mgr.error(f"Error listing spectrometers: {e}")
             self.available_devices =[]
             self.device_name_map.clear()
-        
+
+        device_names.append("DUMMY")
         self.device_list_updated.emit(device_names)
         return device_names
     
+    @_on_worker
     def connect(self, device_name_or_serial: str) -> bool:
         """
         Verbindet ein Spektrometer über seinen Namen oder seine Seriennummer.
@@ -170,11 +276,22 @@ class SpectrometerManager(QObject):
             
                 serial = "QEP20488"
                 spectrometer_mgr.connect(serial)
+
+            Simuliertes Spektrometer (ohne Hardware):
+
+            .. code-block:: python
+
+                spectrometer_mgr.connect("DUMMY")
         """
         self.disconnect()
         dev_to_connect = None
         try:
-            if device_name_or_serial in self.device_name_map:
+            if device_name_or_serial.upper() == "DUMMY":
+                self.log_mgr.info("Connecting to simulated DUMMY spectrometer...")
+                self.spectrometer = DummySpectrometer(light_source=self._simulated_light_source)
+            elif seabreeze is None:
+                raise ImportError("seabreeze is not installed")
+            elif device_name_or_serial in self.device_name_map:
                 # Name (z.B. "FLAME (Q...)")
                 dev_to_connect = self.device_name_map[device_name_or_serial]
                 self.spectrometer = Spectrometer(dev_to_connect)
@@ -182,13 +299,21 @@ class SpectrometerManager(QObject):
                 # Seriennummer (z.B. "Q...")
                 self.spectrometer = Spectrometer.from_serial_number(device_name_or_serial)
             
+            # Die Achse ändert sich während der Verbindung nicht
+            self._wavelengths = np.array(self.spectrometer.wavelengths(), dtype=np.float64)
+            self._wavelengths.flags.writeable = False
+            self.wavelength_axis_id = next(self._axis_ids)
+            self._update_roi_pixels()
+
             active_name = self.get_activeDeviceName()
-            self.LastDevice = self.spectrometer.serial_number
-            self.profile_mgr.write("Spec_LastDevice",self.LastDevice)
+            if self.name is None:
+                self.LastDevice = self.spectrometer.serial_number
+                self.profile_mgr.write("Spec_LastDevice",self.LastDevice)
             self.log_mgr.info(f"Successfully connected to {active_name}")
             
             # Wende zuletzt bekannte Einstellungen an
             self.set_integrationtime(self.current_integration_time_us)
+            self._load_dark_library()
             
             self.connection_status_changed.emit(True,active_name)
             return True
@@ -196,6 +321,8 @@ class SpectrometerManager(QObject):
         except Exception as e:
             self.log_mgr.error(f"Connection failed: {e}")
             self.spectrometer= None
+            self._wavelengths = None
+            self._update_roi_pixels()
             self.connection_status_changed.emit (False, "")
             return False
         
@@ -215,6 +342,7 @@ class SpectrometerManager(QObject):
             self.log_mgr.warning("No 'LastDevice' found to connect to.")
             return False
         
+    @_on_worker
     def disconnect(self):
         """
         Trennt die aktive Verbindung zum Spektrometer.
@@ -222,12 +350,16 @@ class SpectrometerManager(QObject):
         Schließt das Gerät über `spectrometer.close()` und löst 
         `connection_status_changed` aus.
         """
+        self.stop_continuous()
         if self.spectrometer:
             try:
                 self.spectrometer.close()
             except Exception as e:
                 self.log_mgr.error(f"Error closing spectrometer: {e}")
             self.spectrometer = None
+            self._wavelengths = None
+            self._update_roi_pixels()
+            self._dark_library = {}
             self.connection_status_changed.emit(False,"")
 
     def get_activeDeviceName(self) -> str:
@@ -242,6 +374,48 @@ class SpectrometerManager(QObject):
             return f"{self.spectrometer.model} ({self.spectrometer.serial_number})"
         return ""
     
+    def set_simulated_light_source(self, light_source):
+        """
+        Koppelt die Helligkeit des simulierten Spektrometers an eine Stromquelle.
+
+        Args:
+            light_source (callable | None): Liefert den LED-Strom in A, z.B.
+                `SmuManager.simulated_output_current`. None = konstante Helligkeit.
+
+        Examples:
+            .. code-block:: python
+
+                spectrometer_mgr.set_simulated_light_source(smu_mgr.simulated_output_current)
+                smu_mgr.connect("DUMMY")
+                spectrometer_mgr.connect("DUMMY")
+                # Spektren werden jetzt heller, je mehr Strom Kanal 'a' liefert
+        """
+        self._simulated_light_source = light_source
+        if isinstance(self.spectrometer, DummySpectrometer):
+            self.spectrometer.light_source = light_source
+
+    def get_wavelengths(self) -> np.ndarray | None:
+        """
+        Gibt die Wellenlängen-Achse des verbundenen Geräts zurück.
+
+        Die Achse wird beim Verbinden einmal gelesen und ist schreibgeschützt.
+        Sie gehört zu `wavelength_axis_id`, das sich bei jeder neuen
+        Verbindung ändert.
+
+        Returns:
+            np.ndarray | None: Wellenlängen in nm, None wenn nicht verbunden.
+
+        Examples:
+            .. code-block:: python
+
+                def on_spectrum(axis_id, intensities):
+                    if axis_id != self.axis_id:
+                        self.axis_id = axis_id
+                        self.wavelengths = spectrometer_mgr.get_wavelengths()
+                    ...
+        """
+        return self._wavelengths
+
     def is_connected(self) -> bool: 
         """
         Prüft, ob eine aktive Verbindung zum Spektrometer besteht.
@@ -271,7 +445,7 @@ class SpectrometerManager(QObject):
                 spectrometer_mgr.set_correction_dark_count(True)
         """
         self.correct_dark_counts = enable
-        self.profile_mgr.write("Spec_correct_dark_counts", enable)
+        self.profile_mgr.write(self._key("Spec_correct_dark_counts"), enable)
         self.log_mgr.info(f"Dark count correction set to: {enable}")
     
     def get_correction_dark_count(self) -> bool:
@@ -301,7 +475,7 @@ class SpectrometerManager(QObject):
                 spectrometer_mgr.set_correction_non_linearity(False)
         """
         self.correct_non_linearity = enable
-        self.profile_mgr.write("Spec_non_linearity", enable)
+        self.profile_mgr.write(self._key("Spec_non_linearity"), enable)
         self.log_mgr.info(f"Non-linearity correction set to: {enable}")
     
     def get_correction_non_linearity(self) -> bool:
@@ -313,6 +487,76 @@ class SpectrometerManager(QObject):
         """
         return self.correct_non_linearity
 
+    def set_scans_to_average(self, scans: int) -> bool:
+        """
+        Stellt ein, über wie viele Scans jedes Spektrum gemittelt wird.
+
+        Gilt für `acquire_spectrum` und den Live-Modus. Ausgegeben wird nur
+        das gemittelte Spektrum; die Varianz pro Pixel liefert
+        `acquire_spectrum_with_variance`.
+
+        Args:
+            scans (int): Anzahl der Scans (1 = keine Mittelung).
+
+        Returns:
+            bool: True, wenn der Wert gültig ist.
+
+        Examples:
+            .. code-block:: python
+
+                # Schwaches Signal: 50 Scans mitteln und über ±2 Pixel glätten
+                spectrometer_mgr.set_scans_to_average(50)
+                spectrometer_mgr.set_boxcar_width(2)
+                wavelengths, intensities = spectrometer_mgr.acquire_spectrum()
+        """
+        if int(scans) < 1:
+            self.log_mgr.error(f"Invalid scans to average: {scans} (must be >= 1).")
+            return False
+        self.scans_to_average = int(scans)
+        self.profile_mgr.write(self._key("Spec_scans_to_average"), self.scans_to_average)
+        self.log_mgr.info(f"Scans to average set to: {self.scans_to_average}")
+        return True
+
+    def get_scans_to_average(self) -> int:
+        """
+        Gibt die Anzahl der gemittelten Scans zurück.
+
+        Returns:
+            int: Scans pro Spektrum.
+        """
+        return self.scans_to_average
+
+    def set_boxcar_width(self, width: int) -> bool:
+        """
+        Stellt die Boxcar-Glättung ein (gleitender Mittelwert über benachbarte Pixel).
+
+        Wie bei OceanView ist `width` die Anzahl der Pixel auf jeder Seite,
+        gemittelt wird also über 2 * width + 1 Pixel (am Rand entsprechend weniger).
+
+        Args:
+            width (int): Pixel pro Seite (0 = keine Glättung).
+
+        Returns:
+            bool: True, wenn der Wert gültig ist.
+        """
+        if int(width) < 0:
+            self.log_mgr.error(f"Invalid boxcar width: {width} (must be >= 0).")
+            return False
+        self.boxcar_width = int(width)
+        self.profile_mgr.write(self._key("Spec_boxcar_width"), self.boxcar_width)
+        self.log_mgr.info(f"Boxcar width set to: {self.boxcar_width}")
+        return True
+
+    def get_boxcar_width(self) -> int:
+        """
+        Gibt die Boxcar-Breite (Pixel pro Seite) zurück.
+
+        Returns:
+            int: Boxcar-Breite.
+        """
+        return self.boxcar_width
+
+    @_on_worker
     def set_integrationtime(self, time_us: int) -> bool:
         """
         Stellt die Integrationszeit des Spektrometers in Mikrosekunden (us) ein.
@@ -345,7 +589,7 @@ class SpectrometerManager(QObject):
             # 'set_integrationtime' wird automatisch in 'connect' erneut aufgerufen.
             self.log_mgr.info(f"Storing integration time ({time_us} us) for next connect.")
             self.current_integration_time_us = time_us
-            self.profile_mgr.write("Spec_integration_time_us", time_us)
+            self.profile_mgr.write(self._key("Spec_integration_time_us"), time_us)
             return True
         
         try:
@@ -360,7 +604,7 @@ class SpectrometerManager(QObject):
             
             self.spectrometer.integration_time_micros(clamped_us)
             self.current_integration_time_us = clamped_us
-            self.profile_mgr.write("Spec_integration_time_us", clamped_us)
+            self.profile_mgr.write(self._key("Spec_integration_time_us"), clamped_us)
 
             self.log_mgr.info(f"Integration time set to {self.current_integration_time_us} us.")
             return True
@@ -378,6 +622,7 @@ class SpectrometerManager(QObject):
         """
         return self.current_integration_time_us
 
+    @_on_worker
     def get_integrationtime_limits_us(self) -> tuple[int, int]:
         """
         Gibt die Hardware-Limits (min, max) der Integrationszeit in Mikrosekunden zurück.
@@ -406,6 +651,7 @@ class SpectrometerManager(QObject):
             self.log_mgr.error(f"Error reading integration time limits: {e}")
             return (0, 0)
 
+    @_on_worker
     def get_max_intensity(self) -> float:
         """
         Gibt die maximal mögliche Intensität (ADC-Sättigungswert) des Spektrometers zurück.
@@ -426,13 +672,126 @@ class SpectrometerManager(QObject):
             self.log_mgr.error(f"Error reading max intensity: {e}")
             return 65535.0 # Fallback
 
+    @_on_worker
+    def auto_integration_time(self, target_fraction: float = 0.8, tolerance: float = 0.05,
+                              max_acquisitions: int = 8, condition: str = "default") -> int | None:
+        """
+        Sucht die Integrationszeit, bei der das höchste Pixel `target_fraction` der Sättigung erreicht.
+
+        Die Suche nutzt, dass die Counts linear mit der Integrationszeit
+        wachsen: Eine Aufnahme bei der kürzesten Zeit liefert den Sockel
+        (Offset), jede weitere ungesättigte Aufnahme die Steigung, daraus
+        folgt direkt die Zielzeit. Gesättigte Aufnahmen verkleinern nur die
+        Suchklammer (geometrische Mitte). Meist genügen drei Aufnahmen.
+
+        Das Ergebnis wird gesetzt und pro Gerät und `condition` im Profil
+        gespeichert (`Spec_auto_integration`); die nächste Suche mit
+        derselben Bedingung startet dort.
+
+        Args:
+            target_fraction (float): Ziel-Maximum als Anteil von `get_max_intensity` (0 ... 1).
+            tolerance (float): Zulässige Abweichung als Anteil der Sättigung.
+            max_acquisitions (int): Höchstzahl der Aufnahmen.
+            condition (str): Name der Lichtbedingung, z.B. "LED 10 mA".
+
+        Returns:
+            int | None: Die gesetzte Integrationszeit in µs oder None bei einem Fehler.
+
+        Examples:
+            .. code-block:: python
+
+                for current in (0.001, 0.01, 0.1):
+                    api.smu_mgr.set_source_level('a', current)
+                    spectrometer_mgr.auto_integration_time(condition=f"LED {current} A")
+                    wl, intensities = spectrometer_mgr.acquire_spectrum()
+        """
+        if not self.is_connected():
+            self.log_mgr.warning("Cannot search integration time: No spectrometer connected.")
+            return None
+        if not 0.0 < target_fraction < 1.0:
+            self.log_mgr.error(f"Invalid target fraction {target_fraction} (must be between 0 and 1).")
+            return None
+
+        previous_us = self.current_integration_time_us
+        try:
+            min_us, max_us = self.spectrometer.integration_time_micros_limits
+            saturation = float(self.spectrometer.max_intensity)
+            target = target_fraction * saturation
+            cache = dict(self.profile_mgr.read("Spec_auto_integration") or {})
+            device_cache = dict(cache.get(self.spectrometer.serial_number, {}))
+            time_us = max(min_us, min(int(device_cache.get(condition, previous_us)), max_us))
+
+            # Sockel bei kürzester Zeit; ist schon der gesättigt, ist das Licht zu hell
+            offset = self._peak_at(min_us)
+            acquisitions = 1
+            # Klammer: längste ungesättigte / kürzeste gesättigte Zeit (None = noch keine)
+            low, saturated_us = min_us, None
+            best_us, best_error = min_us, abs(offset - target)
+            if offset >= 0.98 * saturation:
+                self.log_mgr.warning("Spectrometer saturates at the shortest integration time.")
+                time_us = None
+
+            while time_us is not None and acquisitions < max_acquisitions:
+                peak = self._peak_at(time_us)
+                acquisitions += 1
+                if peak >= 0.98 * saturation:
+                    saturated_us = time_us
+                    next_us = np.sqrt(low * saturated_us)
+                else:
+                    low = time_us
+                    if abs(peak - target) < best_error:
+                        best_us, best_error = time_us, abs(peak - target)
+                    if abs(peak - target) <= tolerance * saturation:
+                        break
+                    if time_us >= max_us:
+                        self.log_mgr.warning(f"Signal too weak: {peak / saturation:.0%} of saturation "
+                                             f"at the longest integration time.")
+                        break
+                    rate = (peak - offset) / (time_us - min_us) if time_us > min_us else 0.0
+                    next_us = min_us + (target - offset) / rate if rate > 0 else max_us
+                # Vorhersage außerhalb der Klammer: geometrische Mitte
+                if next_us <= low or (saturated_us is not None and next_us >= saturated_us):
+                    next_us = np.sqrt(low * (saturated_us or max_us))
+                next_us = max(min_us, min(int(round(next_us)), max_us))
+                if next_us == time_us:
+                    break
+                time_us = next_us
+        except Exception as e:
+            self.log_mgr.error(f"Error during integration time search: {e}")
+            self.set_integrationtime(previous_us)
+            return None
+
+        self.set_integrationtime(best_us)
+        device_cache[condition] = best_us
+        cache[self.spectrometer.serial_number] = device_cache
+        self.profile_mgr.write("Spec_auto_integration", cache)
+        self.log_mgr.info(f"Auto integration time: {best_us} us after {acquisitions} acquisitions "
+                          f"(target {target_fraction:.0%} of saturation).")
+        return best_us
+
+    def _peak_at(self, time_us: int) -> float:
+        """ Setzt die Integrationszeit (ohne sie zu speichern) und liefert das höchste Pixel eines Scans. """
+        self.spectrometer.integration_time_micros(time_us)
+        return float(np.max(self._read_raw_spectrum()))
+
     # --- Daten Erhebung ---
 
-    def acquire_spectrum(self) -> tuple[np.ndarray | None, np.ndarray | None]:
+    @_on_worker
+    def acquire_spectrum(self, out: np.ndarray | None = None) -> tuple[np.ndarray | None, np.ndarray | None]:
         """
         Nimmt ein einzelnes Spektrum mit den aktuell gesetzten Korrekturen auf.
 
-        Löst bei Erfolg das `new_spectrum_acquired`-Signal aus.
+        Vom Gerät werden nur die Intensitäten gelesen, die Wellenlängen sind
+        die zwischengespeicherte Achse (`get_wavelengths`).
+
+        Bei `scans_to_average` > 1 wird über mehrere Scans gemittelt, bei
+        `boxcar_width` > 0 geglättet. Löst bei Erfolg einmal das
+        `new_spectrum_acquired`-Signal mit dem Endergebnis aus.
+
+        Args:
+            out (np.ndarray, optional): float64-Puffer mit einem Wert pro Pixel.
+                Das Ergebnis wird hineingeschrieben (und zurückgegeben), statt
+                ein neues Array anzulegen.
 
         Returns:
             tuple[np.ndarray | None, np.ndarray | None]: 
@@ -458,24 +817,581 @@ class SpectrometerManager(QObject):
                 else:
                     print("Spektrum-Aufnahme fehlgeschlagen.")
         """
+        wavelengths, intensities, _ = self.acquire_spectrum_with_variance(out)
+        return wavelengths, intensities
+
+    @_on_worker
+    def acquire_spectrum_with_variance(self, out: np.ndarray | None = None
+                                       ) -> tuple[np.ndarray | None, np.ndarray | None, np.ndarray | None]:
+        """
+        Wie `acquire_spectrum`, liefert zusätzlich die Varianz pro Pixel über die gemittelten Scans.
+
+        Die Varianz ist die Stichprobenvarianz der (geglätteten) Einzelscans;
+        die Unsicherheit des Mittelwerts ist `sqrt(variance / scans_to_average)`.
+
+        Returns:
+            tuple: (wavelengths, intensities, variance) bei Erfolg. `variance`
+                   ist None, wenn nur ein Scan aufgenommen wurde.
+                   (None, None, None) bei einem Messfehler oder wenn nicht verbunden.
+
+        Examples:
+            .. code-block:: python
+
+                spectrometer_mgr.set_scans_to_average(100)
+                wl, mean, var = spectrometer_mgr.acquire_spectrum_with_variance()
+                snr = mean / np.sqrt(var / 100)
+        """
         if not self.is_connected():
             self.log_mgr.warning("Cannot acquire spectrum: No spectrometer connected.")
-            return None, None
+            return None, None, None
         
         try:
-            wavelengths, intensities = self.spectrometer.spectrum(
-                correct_dark_counts=self.correct_dark_counts,
-                correct_nonlinearity=self.correct_non_linearity
-            )
+            intensities = self._read_spectrum(out)
             self.log_mgr.debug("Spectrum acquired successfully.")
 
             # Sende das Signal mit den neuen Daten
-            self.new_spectrum_acquired.emit(wavelengths, intensities)
+            self.new_spectrum_acquired.emit(self.wavelength_axis_id, intensities)
 
-            return wavelengths, intensities
+            return self._wavelengths, intensities, self.last_variance
         
         except Exception as e:
             self.log_mgr.error(f"Error during spectrum acquisition: {e}")
             # Bei kritischen Fehlern ggf. Verbindung trennen
             # self.disconnect() 
-            return None, None
\ No newline at end of file
+            return None, None, None
+
+    def _read_spectrum(self, out: np.ndarray | None = None, subtract_dark: bool = True) -> np.ndarray:
+        """
+        Liest ein (gemitteltes, geglättetes) Spektrum (nur im Worker-Thread aufrufen).
+
+        Die Scans werden in vorab allozierte float64-Puffer aufsummiert
+        (Summe und Quadratsumme), die Varianz landet in `last_variance`.
+        Passt `out` nicht zur Pixelzahl, wird ein neues Array zurückgegeben.
+        Ist die Dunkelspektrum-Subtraktion aktiv, wird das passende
+        Dunkelspektrum aus der Bibliothek abgezogen.
+        """
+        dark = self._current_dark() if subtract_dark and self.dark_subtraction else None
+        scans, width = self.scans_to_average, self.boxcar_width
+        intensities = self._read_raw_spectrum()
+        if out is not None and out.shape != np.shape(intensities):
+            out = None
+        if dark is not None and dark.shape != np.shape(intensities):
+            dark = None
+        if scans == 1 and width == 0:
+            self.last_variance = None
+            if out is None:
+                out = intensities
+            else:
+                np.copyto(out, intensities)
+            if dark is not None:
+                np.subtract(out, dark, out=out)
+            return out
+
+        if self._scan_sum is None or self._scan_sum.shape != np.shape(intensities):
+            self._scan_sum = np.empty(np.shape(intensities), dtype=np.float64)
+            self._scan_sum_sq = np.empty_like(self._scan_sum)
+            self._scan = np.empty_like(self._scan_sum)
+        total, total_sq, scan = self._scan_sum, self._scan_sum_sq, self._scan
+        total.fill(0.0)
+        total_sq.fill(0.0)
+
+        for index in range(scans):
+            if index:
+                intensities = self._read_raw_spectrum()
+            self._boxcar(intensities, width, out=scan)
+            total += scan
+            np.square(scan, out=scan)
+            total_sq += scan
+
+        mean = np.divide(total, scans, out=out)
+        if scans > 1:
+            # Stichprobenvarianz aus Summe und Quadratsumme; Rundung kann minimal negativ werden
+            variance = (total_sq - total * mean) / (scans - 1)
+            np.maximum(variance, 0.0, out=variance)
+            self.last_variance = variance
+        else:
+            self.last_variance = None
+        if dark is not None:
+            np.subtract(mean, dark, out=mean)
+        return mean
+
+    def _read_raw_spectrum(self) -> np.ndarray:
+        """ Liest einen einzelnen Scan (nur Intensitäten) mit den aktuellen Korrekturen vom Gerät. """
+        if not self.is_connected():
+            raise ConnectionError("No spectrometer connected.")
+        return self.spectrometer.intensities(
+            correct_dark_counts=self.correct_dark_counts,
+            correct_nonlinearity=self.correct_non_linearity
+        )
+
+    @staticmethod
+    def _boxcar(intensities: np.ndarray, width: int, out: np.ndarray):
+        """ Gleitender Mittelwert über ±`width` Pixel (über die kumulierte Summe, O(N)). """
+        if width == 0:
+            np.copyto(out, intensities)
+            return
+        cumulative = np.empty(len(intensities) + 1, dtype=np.float64)
+        cumulative[0] = 0.0
+        np.cumsum(intensities, out=cumulative[1:])
+        low, high, count = SpectrometerManager._boxcar_bounds(len(intensities), width)
+        np.subtract(cumulative[high], cumulative[low], out=out)
+        out /= count
+
+    @staticmethod
+    @functools.cache
+    def _boxcar_bounds(pixels: int, width: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """ Fenstergrenzen und -größen pro Pixel (am Rand verkürzt). """
+        index = np.arange(pixels)
+        low = np.clip(index - width, 0, pixels)
+        high = np.clip(index + width + 1, 0, pixels)
+        return low, high, (high - low).astype(np.float64)
+
+    async def acquire_spectrum_async(self) -> tuple[np.ndarray | None, np.ndarray | None]:
+        """
+        Wie `acquire_spectrum`, aber als Coroutine für asyncio-Experimente.
+
+        Die Aufnahme läuft im Spektrometer-Thread. Während der Integrationszeit
+        kann so z.B. die SMU messen (siehe `SmuManager.measure_iv_async`).
+
+        Returns:
+            tuple[np.ndarray | None, np.ndarray | None]: Wie `acquire_spectrum`.
+        """
+        return await asyncio.wrap_future(self._worker.submit(self.acquire_spectrum))
+
+    # --- Dunkelspektren ---
+
+    def _dark_key(self) -> str:
+        """
+        Bibliotheks-Schlüssel der aktuellen Einstellungen, z.B. '100000us_10x_b2_dc1_nl0'.
+
+        Die Korrekturen (elektrisch dunkle Pixel, Nichtlinearität) verschieben
+        die Grundlinie des Spektrums und gehören deshalb mit in den Schlüssel.
+        """
+        return (f"{self.current_integration_time_us}us_{self.scans_to_average}x_b{self.boxcar_width}"
+                f"_dc{int(bool(self.correct_dark_counts))}_nl{int(bool(self.correct_non_linearity))}")
+
+    @_on_worker
+    def acquire_dark(self) -> np.ndarray | None:
+        """
+        Nimmt ein Dunkelspektrum mit den aktuellen Einstellungen auf und speichert es in der Bibliothek.
+
+        Das Licht muss dabei blockiert sein (Shutter zu / Lampe aus). Ist
+        `dark_shutter` gesetzt, wird es dafür aufgerufen. Die Bibliothek
+        enthält ein Dunkelspektrum pro Integrationszeit, Mittelung,
+        Boxcar-Breite und Korrektur-Einstellung und wird pro Gerät im Profil gespeichert
+        (`Spec_dark_library`). Ein Experiment, das zwischen einigen
+        Integrationszeiten wechselt, nimmt die Dunkelspektren also nur einmal auf.
+
+        Returns:
+            np.ndarray | None: Das Dunkelspektrum oder None bei einem Fehler.
+
+        Examples:
+            .. code-block:: python
+
+                for time_us in (10_000, 100_000, 1_000_000):
+                    spectrometer_mgr.set_integrationtime(time_us)
+                    spectrometer_mgr.acquire_dark()
+                spectrometer_mgr.set_dark_subtraction(True)
+        """
+        if not self.is_connected():
+            self.log_mgr.warning("Cannot acquire dark spectrum: No spectrometer connected.")
+            return None
+        try:
+            if self.dark_shutter is not None:
+                self.dark_shutter(True)
+            try:
+                dark = self._read_spectrum(subtract_dark=False).astype(np.float64)
+            finally:
+                if self.dark_shutter is not None:
+                    self.dark_shutter(False)
+        except Exception as e:
+            self.log_mgr.error(f"Error acquiring dark spectrum: {e}")
+            return None
+
+        dark.flags.writeable = False
+        key = self._dark_key()
+        self._dark_library[key] = (time.time(), dark)
+        self._dark_warned.discard(key)
+        self._save_dark_library()
+        self.log_mgr.info(f"Dark spectrum stored for {key}.")
+        return dark
+
+    def set_dark_subtraction(self, enable: bool):
+        """
+        Aktiviert/Deaktiviert den Abzug des Dunkelspektrums bei jeder Aufnahme.
+
+        Im Gegensatz zu `set_correction_dark_count` (elektrisch dunkle Pixel)
+        wird hier ein gemessenes Dunkelspektrum aus der Bibliothek abgezogen.
+        Fehlt eines für die aktuellen Einstellungen, wird einmalig gewarnt
+        und nichts abgezogen.
+
+        Args:
+            enable (bool): True, um die Subtraktion zu aktivieren.
+        """
+        self.dark_subtraction = bool(enable)
+        self.profile_mgr.write(self._key("Spec_dark_subtraction"), self.dark_subtraction)
+        self.log_mgr.info(f"Dark spectrum subtraction set to: {self.dark_subtraction}")
+
+    def get_dark_subtraction(self) -> bool:
+        """
+        Gibt zurück, ob das Dunkelspektrum abgezogen wird.
+
+        Returns:
+            bool: True, wenn die Subtraktion aktiv ist.
+        """
+        return self.dark_subtraction
+
+    def set_dark_max_age(self, max_age_s: float | None, shutter=None):
+        """
+        Stellt ein, nach welcher Zeit ein Dunkelspektrum automatisch neu aufgenommen wird.
+
+        Die neue Aufnahme braucht Dunkelheit, deshalb geschieht sie nur mit
+        einer Shutter-Funktion. Ohne Shutter wird bei einem abgelaufenen
+        Dunkelspektrum nur gewarnt und das alte weiter verwendet.
+
+        Args:
+            max_age_s (float | None): Höchstalter in Sekunden, None = nie erneuern.
+            shutter (callable, optional): Wird mit True (Licht blockieren) bzw.
+                False (Licht freigeben) aufgerufen.
+
+        Examples:
+            Lichtquelle hängt an SMU-Kanal 'b' und wird für das Dunkelspektrum ausgeschaltet:
+
+            .. code-block:: python
+
+                spectrometer_mgr.set_dark_max_age(
+                    600, shutter=lambda dark: api.smu_mgr.set_output_state('b', not dark))
+        """
+        self.dark_max_age_s = max_age_s
+        if shutter is not None:
+            self.dark_shutter = shutter
+        self.profile_mgr.write(self._key("Spec_dark_max_age_s"), max_age_s)
+        self.log_mgr.info(f"Dark spectrum max. age set to: {max_age_s} s")
+
+    def get_dark_library(self) -> list[dict]:
+        """
+        Gibt eine Übersicht der gespeicherten Dunkelspektren des verbundenen Geräts zurück.
+
+        Returns:
+            list[dict]: [{'key': str, 'age_s': float, 'mean': float}, ...]
+        """
+        now = time.time()
+        return [{'key': key, 'age_s': now - timestamp, 'mean': float(dark.mean())}
+                for key, (timestamp, dark) in self._dark_library.items()]
+
+    def clear_dark_library(self):
+        """ Löscht alle Dunkelspektren des verbundenen Geräts. """
+        self._dark_library.clear()
+        self._dark_warned.clear()
+        self._save_dark_library()
+        self.log_mgr.info("Dark spectrum library cleared.")
+
+    def _current_dark(self) -> np.ndarray | None:
+        """ Dunkelspektrum für die aktuellen Einstellungen (erneuert es bei Bedarf). """
+        key = self._dark_key()
+        entry = self._dark_library.get(key)
+        expired = (entry is not None and self.dark_max_age_s is not None
+                   and time.time() - entry[0] > self.dark_max_age_s)
+        if entry is None or expired:
+            if expired and self.dark_shutter is not None:
+                self.log_mgr.info(f"Dark spectrum for {key} expired, re-acquiring.")
+                dark = self.acquire_dark()
+                if dark is not None:
+                    return dark
+            if key not in self._dark_warned:
+                self._dark_warned.add(key)
+                if entry is None:
+                    self.log_mgr.warning(f"No dark spectrum for {key}; acquisition is not dark-corrected.")
+                else:
+                    self.log_mgr.warning(f"Dark spectrum for {key} is older than {self.dark_max_age_s} s "
+                                         f"and no shutter is set; using it anyway.")
+            if entry is None:
+                return None
+        return entry[1]
+
+    def _load_dark_library(self):
+        """ Lädt die Dunkelspektren des verbundenen Geräts aus dem Profil. """
+        stored = (self.profile_mgr.read("Spec_dark_library") or {}).get(self.spectrometer.serial_number, {})
+        self._dark_library = {}
+        for key, entry in stored.items():
+            if not _DARK_KEY.fullmatch(key):
+                # Älteres Format ohne Korrektur-Einstellungen: nicht eindeutig zuzuordnen
+                self.log_mgr.info(f"Discarding dark spectrum '{key}' stored without correction settings.")
+                continue
+            dark = np.array(entry['intensities'], dtype=np.float64)
+            dark.flags.writeable = False
+            self._dark_library[key] = (entry['timestamp'], dark)
+        self._dark_warned.clear()
+        if self._dark_library:
+            self.log_mgr.info(f"{len(self._dark_library)} dark spectra loaded from profile.")
+
+    def _save_dark_library(self):
+        """ Speichert die Dunkelspektren des verbundenen Geräts im Profil (pro Seriennummer). """
+        if not self.is_connected():
+            return
+        stored = dict(self.profile_mgr.read("Spec_dark_library") or {})
+        stored[self.spectrometer.serial_number] = {
+            key: {'timestamp': timestamp, 'intensities': dark.tolist()}
+            for key, (timestamp, dark) in self._dark_library.items()}
+        self.profile_mgr.write("Spec_dark_library", stored)
+
+    # --- Spektrale Bereiche (ROI) ---
+
+    def add_roi(self, name: str, start_nm: float, stop_nm: float) -> bool:
+        """
+        Definiert einen benannten Wellenlängenbereich für `reduce_spectrum`.
+
+        Die Bereiche werden im Profil gespeichert (`Spec_rois`). Die
+        Pixelgrenzen werden nur einmal pro Verbindung aus der
+        Wellenlängen-Achse berechnet, nicht bei jedem Spektrum.
+        Ein vorhandener Bereich mit gleichem Namen wird ersetzt.
+
+        Args:
+            name (str): Name des Bereichs, z.B. "Emission".
+            start_nm (float): Untere Grenze in nm (inklusive).
+            stop_nm (float): Obere Grenze in nm (inklusive).
+
+        Returns:
+            bool: True bei Erfolg, False bei ungültigen Grenzen.
+
+        Examples:
+            .. code-block:: python
+
+                spectrometer_mgr.add_roi("Emission", 600, 660)
+                spectrometer_mgr.add_roi("Parasitic", 420, 480)
+        """
+        if not name:
+            self.log_mgr.error("Invalid ROI name: must not be empty.")
+            return False
+        if not start_nm < stop_nm:
+            self.log_mgr.error(f"Invalid ROI '{name}': {start_nm} nm must be below {stop_nm} nm.")
+            return False
+        self._rois[name] = (float(start_nm), float(stop_nm))
+        self._save_rois()
+        self.log_mgr.info(f"ROI '{name}' set to {start_nm}-{stop_nm} nm.")
+        return True
+
+    def remove_roi(self, name: str):
+        """ Entfernt einen Wellenlängenbereich. """
+        if self._rois.pop(name, None) is not None:
+            self._save_rois()
+
+    def clear_rois(self):
+        """ Entfernt alle Wellenlängenbereiche. """
+        self._rois = {}
+        self._save_rois()
+
+    def get_rois(self) -> dict[str, tuple[float, float]]:
+        """
+        Gibt die definierten Wellenlängenbereiche zurück.
+
+        Returns:
+            dict[str, tuple[float, float]]: {Name: (von_nm, bis_nm)}
+
+        Examples:
+            Bereiche als statische Metadaten exportieren:
+
+            .. code-block:: python
+
+                rois = spectrometer_mgr.get_rois()
+                export_mgr.add_static("ROI_Names", [name.encode() for name in rois])
+                export_mgr.add_static("ROI_Ranges", np.array(list(rois.values())), "nm")
+        """
+        return dict(self._rois)
+
+    def reduce_spectrum(self, intensities: np.ndarray) -> dict[str, dict[str, float]]:
+        """
+        Reduziert ein Spektrum auf Kennwerte pro Wellenlängenbereich.
+
+        Pro Bereich werden das Integral (Trapezregel über die Wellenlänge),
+        die Peak-Wellenlänge und die Peak-Höhe berechnet. Das kumulative
+        Integral wird einmal für das ganze Spektrum gebildet, jedes
+        Bandintegral ist dann nur noch eine Differenz. Bereiche ohne Pixel
+        (außerhalb der Achse) liefern NaN.
+
+        Args:
+            intensities (np.ndarray): Intensitäten, z.B. von `acquire_spectrum`.
+
+        Returns:
+            dict[str, dict[str, float]]: {Name: {'integral': Counts·nm,
+            'peak_wavelength': nm, 'peak_intensity': Counts}}.
+            Leer, wenn keine Bereiche definiert sind oder kein Gerät verbunden ist.
+
+        Examples:
+            Nur die Kennwerte statt des ganzen Spektrums speichern:
+
+            .. code-block:: python
+
+                _, intensities = spectrometer_mgr.acquire_spectrum()
+                for name, band in spectrometer_mgr.reduce_spectrum(intensities).items():
+                    export_mgr.add(f"{name}_Integral", band['integral'], "counts*nm")
+                    export_mgr.add(f"{name}_Peak_WL", band['peak_wavelength'], "nm")
+        """
+        names, starts, stops = self._roi_pixels
+        if not names or intensities is None:
+            return {}
+        wavelengths = self._wavelengths
+        y = np.asarray(intensities, dtype=np.float64)
+
+        # cumulative[i] = Integral von Pixel 0 bis Pixel i
+        cumulative = np.zeros(len(y))
+        np.cumsum((y[:-1] + y[1:]) * self._half_dx, out=cumulative[1:])
+        valid = stops > starts
+        integrals = np.where(valid, cumulative[stops - 1] - cumulative[starts], np.nan)
+
+        result = {}
+        for name, start, stop, integral, ok in zip(names, starts, stops, integrals, valid):
+            if ok:
+                peak = start + int(np.argmax(y[start:stop]))
+                result[name] = {'integral': float(integral),
+                                'peak_wavelength': float(wavelengths[peak]),
+                                'peak_intensity': float(y[peak])}
+            else:
+                result[name] = {'integral': np.nan, 'peak_wavelength': np.nan, 'peak_intensity': np.nan}
+        return result
+
+    def _update_roi_pixels(self):
+        """ Berechnet die Pixelgrenzen aller Bereiche aus der zwischengespeicherten Achse. """
+        wavelengths = self._wavelengths
+        if wavelengths is None or not self._rois:
+            self._roi_pixels = ([], None, None)
+            return
+        self._half_dx = 0.5 * np.diff(wavelengths)
+        bands = np.array(list(self._rois.values()), dtype=np.float64).reshape(-1, 2)
+        starts = np.searchsorted(wavelengths, bands[:, 0], side='left')
+        stops = np.searchsorted(wavelengths, bands[:, 1], side='right')
+        empty = stops <= starts
+        for name in np.array(list(self._rois))[empty]:
+            self.log_mgr.warning(f"ROI '{name}' {self._rois[name]} nm contains no pixels of {self.get_activeDeviceName()}.")
+        # Leere Bereiche auf gültige Indizes setzen, `reduce_spectrum` liefert für sie NaN
+        starts[empty] = stops[empty] = 0
+        # Als ein Tupel ersetzen, damit ein laufendes `reduce_spectrum` nie halbe Änderungen sieht
+        self._roi_pixels = (list(self._rois), starts, stops)
+
+    def _save_rois(self):
+        self.profile_mgr.write(self._key("Spec_rois"), {name: list(band) for name, band in self._rois.items()})
+        self._update_roi_pixels()
+
+    # --- Live-Modus ---
+
+    def start_continuous(self, max_rate: float | None = None) -> bool:
+        """
+        Startet die fortlaufende Aufnahme (Live-Modus) im Spektrometer-Thread.
+
+        Die Spektren kommen über `new_spectrum_acquired`, höchstens
+        `max_emit_rate` mal pro Sekunde (bei kurzen Integrationszeiten werden
+        Spektren dazwischen verworfen). Einzelaufnahmen und Einstellungen
+        sind weiter möglich, sie laufen zwischen zwei Live-Spektren.
+
+        Args:
+            max_rate (float, optional): Neue maximale Ausgaberate in Hz (siehe `set_max_emit_rate`).
+
+        Returns:
+            bool: True, wenn der Live-Modus läuft.
+
+        Examples:
+            .. code-block:: python
+
+                spectrometer_mgr.new_spectrum_acquired.connect(plot.update)
+                spectrometer_mgr.start_continuous(max_rate=10)
+                ...
+                spectrometer_mgr.stop_continuous()
+        """
+        if not self.is_connected():
+            self.log_mgr.warning("Cannot start live mode: No spectrometer connected.")
+            return False
+        if max_rate is not None:
+            self.set_max_emit_rate(max_rate)
+        if not self._worker.is_continuous():
+            self._worker.start_continuous()
+            self.log_mgr.info(f"Spectrometer live mode started (max. {self.max_emit_rate:g} spectra/s shown).")
+            self.continuous_state_changed.emit(True)
+        return True
+
+    def stop_continuous(self):
+        """ Beendet den Live-Modus nach der laufenden Aufnahme. """
+        if not self._worker.is_continuous():
+            return
+        self._worker.stop_continuous()
+        self.log_mgr.info(f"Spectrometer live mode stopped ({self._worker.spectra_acquired} spectra acquired).")
+        self.continuous_state_changed.emit(False)
+
+    def is_continuous(self) -> bool:
+        """ Gibt zurück, ob der Live-Modus läuft. """
+        return self._worker.is_continuous()
+
+    def set_max_emit_rate(self, rate: float):
+        """
+        Stellt ein, wie oft der Live-Modus höchstens ein Spektrum ausgibt.
+
+        Args:
+            rate (float): Spektren pro Sekunde (0 = jedes Spektrum). Bei 0 ist jedes
+                ausgegebene Array eine eigene Kopie, sonst bleibt es mindestens
+                `1 / rate` Sekunden unverändert (Doppelpuffer).
+        """
+        self.max_emit_rate = max(0.0, float(rate))
+        self._worker.max_rate = self.max_emit_rate
+        self.profile_mgr.write(self._key("Spec_max_emit_rate"), self.max_emit_rate)
+
+    def _emit_live_spectrum(self, intensities: np.ndarray):
+        """ Läuft im Worker-Thread für jedes ausgegebene Live-Spektrum. """
+        self.new_spectrum_acquired.emit(self.wavelength_axis_id, intensities)
+
+    def _on_continuous_error(self, error: Exception):
+        """ Läuft im Worker-Thread, wenn eine Live-Aufnahme fehlschlägt. """
+        self.log_mgr.error(f"Spectrometer live mode stopped after error: {error}")
+        self.continuous_state_changed.emit(False)
+
+    # --- Nicht blockierende Aufträge (GUI) ---
+
+    def request(self, method_name: str, *args, **kwargs) -> int:
+        """
+        Reiht einen Methodenaufruf im Spektrometer-Thread ein und kehrt sofort zurück.
+
+        Für die GUI gedacht: Das Ergebnis kommt über `request_finished`,
+        Spektren wie gewohnt über `new_spectrum_acquired`.
+
+        Args:
+            method_name (str): Name einer Manager-Methode, z.B. 'acquire_spectrum'.
+            *args, **kwargs: Argumente der Methode.
+
+        Returns:
+            int: Auftrags-ID (wird mit `request_finished` zurückgegeben).
+        """
+        request_id = next(self._request_ids)
+        future = self.submit(method_name, *args, **kwargs)
+        future.add_done_callback(functools.partial(self._on_request_done, request_id, method_name))
+        return request_id
+
+    def submit(self, method_name: str, *args, **kwargs) -> Future:
+        """
+        Reiht einen Methodenaufruf im Spektrometer-Thread ein und gibt ein Future zurück.
+
+        Grundlage von `request`; nützlich, um mehrere Spektrometer parallel
+        aufnehmen zu lassen (siehe `SpectrometerPool.acquire_all`).
+        """
+        return self._worker.submit(getattr(self, method_name), *args, **kwargs)
+
+    def shutdown(self):
+        """
+        Trennt das Gerät und beendet den Spektrometer-Thread.
+
+        Für das Programmende bzw. wenn ein Pool-Gerät entfernt wird. Danach
+        laufen Methodenaufrufe direkt im Aufrufer, `request`/`submit` sind
+        nicht mehr möglich.
+        """
+        self.disconnect()
+        self._worker.stop()
+
+    def _key(self, key: str) -> str:
+        """ Profil-Schlüssel einer Einstellung (Pool-Geräte speichern getrennt). """
+        return key if self.name is None else f"{key}_{self.name}"
+
+    def _on_request_done(self, request_id: int, method_name: str, future):
+        """ Läuft im Worker-Thread, sobald ein Auftrag aus `request` fertig ist. """
+        try:
+            result = future.result()
+        except Exception as e:
+            self.log_mgr.error(f"Spectrometer request '{method_name}' failed: {e}")
+            result = None
+        self.request_finished.emit(request_id, method_name, result)
@@ -0,0 +1,107 @@
+# modules/spectrometer/SpectrometerPool.py
+"""
+================================================================================
+Mehrere Spektrometer unter logischen Namen
+================================================================================
+
+Der `SpectrometerPool` verwaltet beliebig viele Spektrometer (z.B. ein VIS- und
+ein NIR-Gerät). Jedes Gerät ist ein eigener `SpectrometerManager` mit eigenem
+Aufnahme-Thread, Aufnahmen auf verschiedenen Geräten laufen also parallel.
+
+Das Haupt-Spektrometer der GUI ist als "spec1" im Pool enthalten. Die
+Einstellungen (Integrationszeit, Mittelung, ...) speichert jedes Gerät unter
+eigenen Profil-Schlüsseln.
+"""
+
+import time
+
+from PySide6.QtCore import Signal
+
+from core.InstrumentPool import InstrumentPool
+from .SpectrometerManager import SpectrometerManager
+
+
+class SpectrometerPool(InstrumentPool):
+    """
+    Verwaltet mehrere Spektrometer und bietet Operationen über alle Geräte.
+
+    Die Geräte (außer dem Haupt-Spektrometer) werden im Profil unter
+    `Spec_Pool` gespeichert ({name: gerät}) und mit `connect_saved` wieder
+    verbunden (siehe `InstrumentPool`).
+
+    Args:
+        log_manager: LogManager-Instanz.
+        profile_manager: ProfileManager-Instanz.
+        primary (SpectrometerManager, optional): Haupt-Spektrometer der GUI, wird als `primary_name` eingetragen.
+        primary_name (str): Logischer Name des Haupt-Spektrometers.
+
+    Signale:
+        instruments_changed (list):
+            Wird ausgelöst, wenn ein Gerät hinzugefügt oder entfernt wurde.
+            Args: (list: Namen aller Geräte).
+
+        spectra_acquired (object):
+            Wird nach `acquire_all` ausgelöst.
+            Args: (dict: Ergebnis von `acquire_all`).
+
+    Examples:
+        .. code-block:: python
+
+            pool.add_instrument("nir", "NQ51A0123")
+            pool.manager("nir").set_integrationtime(500_000)
+    """
+
+    MANAGER_CLASS = SpectrometerManager
+    PROFILE_KEY = "Spec_Pool"
+    KIND = "Spectrometer"
+
+    spectra_acquired = Signal(object)
+
+    def __init__(self, log_manager, profile_manager, primary: SpectrometerManager | None = None,
+                 primary_name: str = "spec1"):
+        super().__init__(log_manager, profile_manager, primary, primary_name)
+
+    # --- Operationen über alle Geräte ---
+
+    def acquire_all(self, names=None) -> dict | None:
+        """
+        Nimmt auf allen (oder den angegebenen) Spektrometern gleichzeitig ein Spektrum auf.
+
+        Die Aufnahmen werden gleichzeitig in den Threads der Geräte gestartet,
+        die Methode kehrt zurück, sobald alle fertig sind. Die Dauer entspricht
+        also der längsten einzelnen Aufnahme, nicht der Summe. Der Zeitstempel
+        ist die Mitte des Aufnahmezeitraums (Sekunden seit Erstellung des Pools).
+
+        Args:
+            names (list[str], optional): Geräte-Namen. None = alle verbundenen Geräte.
+
+        Returns:
+            dict | None: {'timestamp': float,
+                          'spec1': (Wellenlängen, Intensitäten), ...}
+                         Ein Gerät, dessen Aufnahme fehlschlägt, ist (None, None).
+                         None, wenn kein Gerät verbunden ist.
+
+        Examples:
+            .. code-block:: python
+
+                result = pool.acquire_all()
+                wl_vis, vis = result['spec1']
+                wl_nir, nir = result['nir']
+        """
+        names = self.names(connected_only=True) if names is None else list(names)
+        if not names:
+            self.log_mgr.warning("acquire_all: no spectrometer connected.")
+            return None
+        for name in names:
+            self.manager(name)
+
+        start = time.monotonic()
+        results = self._parallel({name: ('acquire_spectrum', (), {}) for name in names})
+        timestamp = (start + time.monotonic()) / 2 - self.t0
+
+        result = {'timestamp': timestamp}
+        for name in names:
+            result[name] = results.get(name) or (None, None)
+
+        self.spectra_acquired.emit(result)
+        return result
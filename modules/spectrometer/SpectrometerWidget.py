@@ -38,6 +38,9 @@ class SpectrometerWidget(QWidget, Ui_Form):
 
         # Internen Status für Plot-Grenzen
         self.y_max_intensity = 65535.0 # Standardwert
+        # Linie des aktuellen Spektrums, im Live-Modus werden nur die Daten ersetzt
+        self._spectrum_line = None
+        self._axis_id = None
 
         self.__setup_plot()
         self.__setup_ui()
@@ -94,11 +97,14 @@ class SpectrometerWidget(QWidget, Ui_Form):
         self.spec_mgr.connection_status_changed.connect(self.on_connection_status_changed)
         self.spec_mgr.device_list_updated.connect(self.on_device_list_updated)
         self.spec_mgr.new_spectrum_acquired.connect(self.on_new_spectrum_acquired)
+        self.spec_mgr.continuous_state_changed.connect(self.on_continuous_state_changed)
 
         # 2. UI-Elemente (Buttons, Checkboxen etc.) an Manager-Slots oder lokale Slots
 
         self.pushButton_connect.clicked.connect(self.on_connect_clicked)
-        self.pushButton_acquire.clicked.connect(self.spec_mgr.acquire_spectrum)
+        # Aufnahmen laufen im Spektrometer-Thread, die GUI wartet nicht auf die Integrationszeit
+        self.pushButton_acquire.clicked.connect(lambda: self.spec_mgr.request('acquire_spectrum'))
+        self.pushButton_live.toggled.connect(self.on_live_toggled)
 
         # Direkte Verbindung zu Settern (einfach)
         self.checkBox_correctDarkCounts.toggled.connect(self.spec_mgr.set_correction_dark_count)
@@ -106,7 +112,8 @@ class SpectrometerWidget(QWidget, Ui_Form):
 
         # Verbindung über einen Slot, um den richtigen Wert zu senden (besser)
         # valueChanged sendet den int-Wert, den der Manager erwartet
-        self.spinBox_integrationTime.valueChanged.connect(self.spec_mgr.set_integrationtime)
+        self.spinBox_integrationTime.valueChanged.connect(
+            lambda time_us: self.spec_mgr.request('set_integrationtime', time_us))
 
 
     # --- Slots für Signale vom SpectrometerManager ---
@@ -141,6 +148,7 @@ class SpectrometerWidget(QWidget, Ui_Form):
             self.checkBox_correctDarkCounts.setEnabled(True)
             self.checkBox_correctNonLinearity.setEnabled(True)
             self.pushButton_acquire.setEnabled(True)
+            self.pushButton_live.setEnabled(True)
             self.widget_plot.setEnabled(True)
             
             # UI-Bereiche aktivieren (HINWEIS: Dies ist der fehlerhafte Code aus deinem Original)
@@ -170,6 +178,8 @@ class SpectrometerWidget(QWidget, Ui_Form):
             self.checkBox_correctDarkCounts.setEnabled(False)
             self.checkBox_correctNonLinearity.setEnabled(False)
             self.pushButton_acquire.setEnabled(False)
+            self.pushButton_live.setEnabled(False)
+            self.on_continuous_state_changed(False)
             self.widget_plot.setEnabled(False)
 
             # UI-Bereiche deaktivieren (HINWEIS: Dies ist der fehlerhafte Code aus deinem Original)
@@ -180,6 +190,8 @@ class SpectrometerWidget(QWidget, Ui_Form):
 
             # Plot zurücksetzen
             self.y_max_intensity = 65535.0 # Standard
+            self._spectrum_line = None
+            self._axis_id = None
             self.plot_ax.clear()
             self.plot_ax.set_title("Spectrum (Not Connected)")
             self.plot_ax.set_xlabel("Wavelength (nm)")
@@ -187,17 +199,28 @@ class SpectrometerWidget(QWidget, Ui_Form):
             self.plot_canvas.draw()
 
 
-    @Slot(object, object)
-    def on_new_spectrum_acquired(self, wavelengths, intensities):
+    @Slot(int, object)
+    def on_new_spectrum_acquired(self, axis_id, intensities):
         """Aktualisiert den Plot, wenn ein neues Spektrum empfangen wird."""
-        if wavelengths is None or intensities is None:
+        if intensities is None:
             return
+
+        # Gleiche Achse wie zuvor: nur die Daten ersetzen (schnell genug für den Live-Modus)
+        if self._spectrum_line is not None and axis_id == self._axis_id:
+            self._spectrum_line.set_ydata(intensities)
+            self.plot_canvas.draw_idle()
+            return
+
+        wavelengths = self.spec_mgr.get_wavelengths()
+        if wavelengths is None or len(wavelengths) != len(intensities):
+            return
+        self._axis_id = axis_id
             
         # Altes Diagramm löschen
         self.plot_ax.clear()
         
         # Neu zeichnen
-        self.plot_ax.plot(wavelengths, intensities, color="cyan")
+        self._spectrum_line, = self.plot_ax.plot(wavelengths, intensities, color="cyan")
         
         # Beschriftungen und Limits setzen (clear() löscht sie)
         self.plot_ax.set_title(self.spec_mgr.get_activeDeviceName())
@@ -210,20 +233,37 @@ class SpectrometerWidget(QWidget, Ui_Form):
         # Diagramm neu rendern
         self.plot_canvas.draw()
 
+    @Slot(bool)
+    def on_continuous_state_changed(self, running):
+        """Hält den Live-Button synchron, auch wenn der Live-Modus von selbst endet."""
+        self.pushButton_live.blockSignals(True)
+        self.pushButton_live.setChecked(running)
+        self.pushButton_live.blockSignals(False)
+        self.pushButton_acquire.setEnabled(not running and self.spec_mgr.is_connected())
+
     # --- Slots für UI-Aktionen ---
 
     @Slot()
     def on_connect_clicked(self):
         """Wird aufgerufen, wenn der Verbinden/Trennen-Button geklickt wird."""
         if self.spec_mgr.is_connected():
-            self.spec_mgr.disconnect()
+            self.spec_mgr.request('disconnect')
         else:
             selected_device = self.comboBox_deviceList.currentText()
             if not selected_device:
                 self.log_mgr.warning("No spectrometer selected for connection.")
                 return
             
-            self.spec_mgr.connect(selected_device)
+            self.spec_mgr.request('connect', selected_device)
+
+    @Slot(bool)
+    def on_live_toggled(self, checked):
+        """Startet/beendet den Live-Modus."""
+        if checked:
+            if not self.spec_mgr.start_continuous():
+                self.on_continuous_state_changed(False)
+        else:
+            self.spec_mgr.stop_continuous()
     
     # --- Event Filter für ComboBox ---
     
@@ -0,0 +1,156 @@
+# modules/spectrometer/SpectrometerWorker.py
+"""
+================================================================================
+Hintergrund-Thread für die Spektrometer-Aufnahme
+================================================================================
+
+Alle Zugriffe des `SpectrometerManager` auf das Gerät laufen in einem einzigen
+`SpectrometerWorker`. Der Thread arbeitet eingereichte Aufträge ab (z.B.
+Einzelaufnahmen, Integrationszeit setzen) und nimmt im Live-Modus dazwischen
+fortlaufend Spektren auf.
+
+Live-Spektren landen in einem Doppelpuffer: Die Aufnahme schreibt immer in den
+hinteren Puffer, ausgegeben wird der vordere. Getauscht wird nur beim Ausgeben
+(höchstens `max_rate` mal pro Sekunde), der Empfänger kann das Array also
+mindestens `1 / max_rate` Sekunden lang lesen, ohne dass es überschrieben wird.
+Wer die Daten länger behalten will, muss sie kopieren. Mit `max_rate = 0` wird
+jedes Spektrum als eigene Kopie ausgegeben.
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+import numpy as np
+
+
+class SpectrometerWorker(threading.Thread):
+    """
+    Thread für Spektrometer-Aufträge und den Live-Modus.
+
+    Args:
+        acquire (callable): Liefert die Intensitäten eines Spektrums; wird mit `out=<Puffer>`
+            aufgerufen und schreibt möglichst direkt in diesen Puffer.
+        on_spectrum (callable, optional): Wird im Live-Modus mit den Intensitäten aufgerufen.
+        on_error (callable, optional): Wird mit der Exception aufgerufen, wenn der Live-Modus abbricht.
+        max_rate (float): Höchstens so viele Live-Spektren pro Sekunde ausgeben (0 = alle, als Kopie).
+        name (str): Name des Threads.
+    """
+
+    _STOP = object()
+
+    def __init__(self, acquire, on_spectrum=None, on_error=None, max_rate: float = 20.0,
+                 name: str = "SpectrometerIO"):
+        super().__init__(name=name, daemon=True)
+        self._acquire = acquire
+        self.on_spectrum = on_spectrum
+        self.on_error = on_error
+        self.max_rate = max_rate
+        self._jobs = queue.Queue()
+        self._continuous = threading.Event()
+        self._front = None
+        self._back = None
+        self._last_emit = 0.0
+        self._stopped = False
+        self.spectra_acquired = 0
+        """int: Anzahl der Live-Spektren seit dem letzten `start_continuous` (auch nicht ausgegebene)."""
+
+    def is_current(self) -> bool:
+        """ True, wenn der Aufrufer selbst im Worker-Thread läuft. """
+        return threading.current_thread() is self
+
+    def submit(self, function, *args, **kwargs) -> Future:
+        """
+        Reiht `function(*args, **kwargs)` ein; läuft vor der nächsten Live-Aufnahme.
+
+        Raises:
+            RuntimeError: Nach `stop`, der Auftrag würde nie ausgeführt.
+        """
+        if self._stopped:
+            raise RuntimeError(f"{self.name} has been stopped.")
+        future = Future()
+        self._jobs.put((future, lambda: function(*args, **kwargs)))
+        return future
+
+    def call(self, function, *args, **kwargs):
+        """ Führt `function` im Worker aus und wartet (direkt, wenn schon im Worker oder gestoppt). """
+        if self.is_current() or not self.is_alive():
+            return function(*args, **kwargs)
+        return self.submit(function, *args, **kwargs).result()
+
+    def start_continuous(self):
+        """ Startet den Live-Modus. """
+        self.spectra_acquired = 0
+        self._last_emit = 0.0
+        self._continuous.set()
+        # Weckt den Thread, falls er gerade auf Aufträge wartet
+        self._jobs.put(None)
+
+    def stop_continuous(self):
+        """ Beendet den Live-Modus nach der laufenden Aufnahme. """
+        self._continuous.clear()
+
+    def is_continuous(self) -> bool:
+        """ Gibt zurück, ob der Live-Modus läuft. """
+        return self._continuous.is_set()
+
+    def stop(self, timeout: float = 2.0):
+        """ Beendet den Live-Modus, arbeitet die Aufträge ab und beendet den Thread. """
+        if self._stopped:
+            return
+        self._stopped = True
+        self._continuous.clear()
+        self._jobs.put(self._STOP)
+        if self.is_alive() and not self.is_current():
+            self.join(timeout)
+
+    def run(self):
+        while True:
+            try:
+                job = self._jobs.get_nowait() if self._continuous.is_set() else self._jobs.get()
+            except queue.Empty:
+                self._acquire_continuous()
+                continue
+            if job is self._STOP:
+                break
+            if job is None:
+                continue
+            future, function = job
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(function())
+            except BaseException as e:
+                future.set_exception(e)
+
+    def _acquire_continuous(self):
+        try:
+            intensities = self._acquire(out=self._back)
+        except Exception as e:
+            self._continuous.clear()
+            if self.on_error is not None:
+                self.on_error(e)
+            return
+
+        # Erste Aufnahme oder anderes Gerät: Puffer passend anlegen
+        if intensities is not self._back:
+            if self._back is None or self._back.shape != np.shape(intensities):
+                self._front = np.empty(np.shape(intensities), dtype=np.float64)
+                self._back = np.empty_like(self._front)
+            np.copyto(self._back, intensities)
+        self.spectra_acquired += 1
+
+        if self.max_rate <= 0:
+            # Ohne Ratenbegrenzung gibt es keine Mindest-Lesezeit, also eine Kopie ausgeben
+            if self.on_spectrum is not None:
+                self.on_spectrum(self._back.copy())
+            return
+
+        now = time.monotonic()
+        if now - self._last_emit < 1.0 / self.max_rate:
+            return
+        self._last_emit = now
+        self._front, self._back = self._back, self._front
+        if self.on_spectrum is not None:
+            self.on_spectrum(self._front)
@@ -146,6 +146,14 @@ class Ui_Form(object):
 
         self.horizontalLayout_2.addItem(self.horizontalSpacer_2)
 
+        self.pushButton_live = QPushButton(self.frame)
+        self.pushButton_live.setObjectName(u"pushButton_live")
+        sizePolicy2.setHeightForWidth(self.pushButton_live.sizePolicy().hasHeightForWidth())
+        self.pushButton_live.setSizePolicy(sizePolicy2)
+        self.pushButton_live.setCheckable(True)
+
+        self.horizontalLayout_2.addWidget(self.pushButton_live)
+
         self.pushButton_acquire = QPushButton(self.frame)
         self.pushButton_acquire.setObjectName(u"pushButton_acquire")
         sizePolicy2.setHeightForWidth(self.pushButton_acquire.sizePolicy().hasHeightForWidth())
@@ -188,6 +196,7 @@ class Ui_Form(object):
         self.label_integrationTime.setText(QCoreApplication.translate("Form", u"Integration Time [us]:", None))
         self.checkBox_correctDarkCounts.setText(QCoreApplication.translate("Form", u"Correct dark counts", None))
         self.checkBox_correctNonLinearity.setText(QCoreApplication.translate("Form", u"Correct non linearity", None))
+        self.pushButton_live.setText(QCoreApplication.translate("Form", u"Live", None))
         self.pushButton_acquire.setText(QCoreApplication.translate("Form", u"Measure", None))
     # retranslateUi
 